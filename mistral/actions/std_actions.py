@@ -14,15 +14,21 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
 from email import header
 from email.mime import multipart
 from email.mime import text
+import functools
 import smtplib
+import ssl
+import threading
 import time
 from urllib import parse
+import weakref
 
 from oslo_config import cfg
 from oslo_log import log as logging
+from oslo_utils import importutils
 import requests
 
 from mistral import exceptions as exc
@@ -38,6 +44,40 @@ LOG = logging.getLogger(__name__)
 
 CONF = cfg.CONF
 
+_AIOHTTP = importutils.try_import('aiohttp')
+
+# One aiohttp session (and connection pool) per event loop.
+_AIOHTTP_SESSIONS = weakref.WeakKeyDictionary()
+_AIOHTTP_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_aiohttp_session():
+    loop = asyncio.get_running_loop()
+
+    with _AIOHTTP_SESSIONS_LOCK:
+        session = _AIOHTTP_SESSIONS.get(loop)
+
+        if session is None or session.closed:
+            # Don't keep cookies between requests of different actions.
+            session = _AIOHTTP.ClientSession(
+                cookie_jar=_AIOHTTP.DummyCookieJar()
+            )
+
+            _AIOHTTP_SESSIONS[loop] = session
+
+    return session
+
+
+async def close_aiohttp_session():
+    """Closes the aiohttp session of the current event loop, if any."""
+    loop = asyncio.get_running_loop()
+
+    with _AIOHTTP_SESSIONS_LOCK:
+        session = _AIOHTTP_SESSIONS.pop(loop, None)
+
+    if session is not None:
+        await session.close()
+
 
 class EchoAction(actions.Action):
     """Echo action.
@@ -71,6 +111,20 @@ class EchoAction(actions.Action):
 
         return self.output
 
+    def supports_async(self):
+        return True
+
+    async def run_async(self, context):
+        LOG.info(
+            'Running echo action [output=%s, delay=%s]',
+            self.output,
+            self._delay
+        )
+
+        await asyncio.sleep(self._delay)
+
+        return self.output
+
     def test(self, context):
         return 'Echo'
 
@@ -212,56 +266,9 @@ class HTTPAction(actions.Action):
         self.verify = verify
 
     def run(self, context):
-        # SSRF egress policy: reject non-http(s) schemes and hosts that
-        # resolve to blocked addresses (loopback / link-local incl. the
-        # cloud metadata service, plus operator-configured CIDRs) before
-        # issuing the request.
-        egress.validate_url(self.url)
-
-        # Redact credentials so they never reach the logs: 'auth' holds an
-        # HTTP Basic/Digest password or a bearer token, 'cookies' hold
-        # session secrets, and 'params' may carry tokens/API keys.
-        if isinstance(self.auth, tuple):
-            safe_auth = (self.auth[0], '***') if len(self.auth) > 1 else '***'
-        elif self.auth:
-            safe_auth = '***'
-        else:
-            safe_auth = self.auth
-
-        safe_cookies = '***' if self.cookies else self.cookies
-
-        LOG.info(
-            "Running HTTP action "
-            "[url=%s, method=%s, params=%s, body=%s, json=%s,"
-            " headers=%s, cookies=%s, auth=%s, timeout=%s,"
-            " allow_redirects=%s, proxies=%s, verify=%s]",
-            self.url,
-            self.method,
-            redact.redact_sensitive(self.params),
-            rest_utils.prepare_request_body_log(self.body),
-            self.json,
-            rest_utils.clear_sensitive_headers(self.headers),
-            safe_cookies,
-            safe_auth,
-            self.timeout,
-            self.allow_redirects,
-            self.proxies,
-            self.verify
-        )
+        self._validate_and_log_request()
 
         try:
-            url_data = parse.urlsplit(self.url)
-            if 'https' == url_data.scheme:
-                action_verify = self.verify
-            else:
-                action_verify = None
-
-            # Default the request timeout so a slow/never-ending peer
-            # cannot pin the executor forever.
-            timeout = self.timeout
-            if timeout is None:
-                timeout = CONF.action_std_http.default_timeout
-
             resp = requests.request(
                 self.method,
                 self.url,
@@ -271,10 +278,10 @@ class HTTPAction(actions.Action):
                 headers=self.headers,
                 cookies=self.cookies,
                 auth=self.auth,
-                timeout=timeout,
+                timeout=self._get_request_timeout(),
                 allow_redirects=self.allow_redirects,
                 proxies=self.proxies,
-                verify=action_verify
+                verify=self._get_request_verify()
             )
         except Exception as e:
             LOG.exception(
@@ -283,23 +290,10 @@ class HTTPAction(actions.Action):
             )
             raise exc.ActionException("Failed to send HTTP request: %s" % e)
 
-        # Reject an over-large response (by declared Content-Length) before
-        # buffering it into the action result. 0 disables the cap. Note:
-        # responses without a Content-Length (e.g. chunked) are not bounded
-        # here - the request timeout above is the backstop for those.
-        max_size = CONF.action_std_http.max_response_size_bytes
-
-        if max_size:
-            content_length = resp.headers.get('Content-Length')
-
-            if content_length and int(content_length) > max_size:
-                if hasattr(resp, 'close'):
-                    resp.close()
-
-                raise exc.ActionException(
-                    "HTTP response is too large (Content-Length=%s, "
-                    "limit=%s bytes)." % (content_length, max_size)
-                )
+        self._check_response_size(
+            resp.headers.get('Content-Length'),
+            getattr(resp, 'close', None)
+        )
 
         LOG.info(
             "HTTP action response:\n%s\n%s",
@@ -333,6 +327,192 @@ class HTTPAction(actions.Action):
 
         return _result
 
+    def supports_async(self):
+        """Tells if the action can run on an asyncio event loop.
+
+        Subclasses overriding run() must override run_async() as well,
+        otherwise their run() would be bypassed.
+        """
+        if _AIOHTTP is None:
+            return False
+
+        cls = type(self)
+
+        return (
+            cls.run is HTTPAction.run or
+            cls.run_async is not HTTPAction.run_async
+        )
+
+    async def run_async(self, context):
+        """Runs the action with aiohttp on the current event loop.
+
+        Same as run() but doesn't hold a thread while waiting for the
+        response. The only differences in the result are "history" that
+        contains the URLs of the redirects and "cookies" that contains
+        only the cookies set by the response.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Resolving the host name for the egress policy and loading the
+        # CA bundle block, so they run in the default executor of the loop.
+        await loop.run_in_executor(None, self._validate_and_log_request)
+
+        verify = self._get_request_verify()
+
+        if verify is None or verify is True:
+            ssl_ctx = True
+        elif verify is False:
+            ssl_ctx = False
+        else:
+            ssl_ctx = await loop.run_in_executor(
+                None,
+                functools.partial(ssl.create_default_context, cafile=verify)
+            )
+
+        if isinstance(self.auth, tuple):
+            auth = _AIOHTTP.BasicAuth(*self.auth)
+        else:
+            auth = self.auth
+
+        scheme = parse.urlsplit(self.url).scheme
+
+        started_at = time.monotonic()
+
+        try:
+            resp = await _get_aiohttp_session().request(
+                self.method,
+                self.url,
+                params=self.params,
+                data=self.body,
+                json=self.json,
+                headers=self.headers,
+                cookies=self.cookies,
+                auth=auth,
+                timeout=_AIOHTTP.ClientTimeout(
+                    total=self._get_request_timeout()
+                ),
+                # Same as requests, no redirects unless explicitly allowed.
+                allow_redirects=bool(self.allow_redirects),
+                proxy=(self.proxies or {}).get(scheme),
+                ssl=ssl_ctx
+            )
+
+            async with resp:
+                self._check_response_size(
+                    resp.headers.get('Content-Length'),
+                    resp.close
+                )
+
+                body = await resp.read()
+        except exc.ActionException:
+            raise
+        except Exception as e:
+            LOG.exception(
+                "Failed to send HTTP request for action execution: %s",
+                context.execution.action_execution_id
+            )
+            raise exc.ActionException("Failed to send HTTP request: %s" % e)
+
+        LOG.info(
+            "HTTP action response:\n%s\n%s",
+            resp.status,
+            rest_utils.prepare_response_body_log(body)
+        )
+
+        try:
+            content = utils.from_json_str(body)
+        except Exception:
+            LOG.debug("HTTP action response is not json.")
+            content = body
+            if content and resp.charset not in (None, 'utf-8'):
+                content = content.decode(resp.charset).encode('utf-8')
+
+        _result = {
+            'content': content,
+            'status': resp.status,
+            'headers': dict(resp.headers.items()),
+            'url': str(resp.url),
+            'history': [str(r.url) for r in resp.history],
+            'encoding': resp.charset,
+            'reason': resp.reason,
+            'cookies': {k: v.value for k, v in resp.cookies.items()},
+            'elapsed': time.monotonic() - started_at
+        }
+
+        if resp.status not in range(200, 307):
+            return actions.Result(error=_result)
+
+        return _result
+
+    def _validate_and_log_request(self):
+        # SSRF egress policy: reject non-http(s) schemes and hosts that
+        # resolve to blocked addresses (loopback / link-local incl. the
+        # cloud metadata service, plus operator-configured CIDRs) before
+        # issuing the request.
+        egress.validate_url(self.url)
+
+        # Redact credentials so they never reach the logs: 'auth' holds an
+        # HTTP Basic/Digest password or a bearer token, 'cookies' hold
+        # session secrets, and 'params' may carry tokens/API keys.
+        if isinstance(self.auth, tuple):
+            safe_auth = (self.auth[0], '***') if len(self.auth) > 1 else '***'
+        elif self.auth:
+            safe_auth = '***'
+        else:
+            safe_auth = self.auth
+
+        safe_cookies = '***' if self.cookies else self.cookies
+
+        LOG.info(
+            "Running HTTP action "
+            "[url=%s, method=%s, params=%s, body=%s, json=%s,"
+            " headers=%s, cookies=%s, auth=%s, timeout=%s,"
+            " allow_redirects=%s, proxies=%s, verify=%s]",
+            self.url,
+            self.method,
+            redact.redact_sensitive(self.params),
+            rest_utils.prepare_request_body_log(self.body),
+            self.json,
+            rest_utils.clear_sensitive_headers(self.headers),
+            safe_cookies,
+            safe_auth,
+            self.timeout,
+            self.allow_redirects,
+            self.proxies,
+            self.verify
+        )
+
+    def _get_request_timeout(self):
+        # Default the request timeout so a slow/never-ending peer
+        # cannot pin the executor forever.
+        if self.timeout is None:
+            return CONF.action_std_http.default_timeout
+
+        return self.timeout
+
+    def _get_request_verify(self):
+        if 'https' == parse.urlsplit(self.url).scheme:
+            return self.verify
+
+        return None
+
+    @staticmethod
+    def _check_response_size(content_length, close_func):
+        # Reject an over-large response (by declared Content-Length) before
+        # buffering it into the action result. 0 disables the cap. Note:
+        # responses without a Content-Length (e.g. chunked) are not bounded
+        # here - the request timeout above is the backstop for those.
+        max_size = CONF.action_std_http.max_response_size_bytes
+
+        if max_size and content_length and int(content_length) > max_size:
+            if close_func:
+                close_func()
+
+            raise exc.ActionException(
+                "HTTP response is too large (Content-Length=%s, "
+                "limit=%s bytes)." % (content_length, max_size)
+            )
+
     def test(self, context):
         # TODO(rakhmerov): Implement.
         return None
@@ -341,6 +521,16 @@ class HTTPAction(actions.Action):
 class MistralHTTPAction(HTTPAction):
 
     def run(self, context):
+        self._add_mistral_headers(context)
+
+        return super(MistralHTTPAction, self).run(context)
+
+    async def run_async(self, context):
+        self._add_mistral_headers(context)
+
+        return await super(MistralHTTPAction, self).run_async(context)
+
+    def _add_mistral_headers(self, context):
         self.headers = self.headers or {}
 
         exec_ctx = context.execution
@@ -352,8 +542,6 @@ class MistralHTTPAction(HTTPAction):
             'Mistral-Callback-URL': exec_ctx.callback_url,
         })
 
-        return super(MistralHTTPAction, self).run(context)
-
     def is_sync(self):
         return False
 
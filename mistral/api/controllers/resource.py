@@ -123,7 +123,7 @@ class ResourceList(Resource):
 
     @classmethod
     def convert_with_links(cls, resources, limit, url=None, fields=None,
-                           **kwargs):
+                           marker=None, **kwargs):
         resource_list = cls()
 
         setattr(resource_list, resource_list._type, resources)
@@ -132,6 +132,7 @@ class ResourceList(Resource):
             limit,
             url=url,
             fields=fields,
+            marker=marker,
             **kwargs
         )
 
@@ -141,8 +142,12 @@ class ResourceList(Resource):
         """Return whether resources has more items."""
         return len(self.collection) and len(self.collection) == limit
 
-    def get_next(self, limit, url=None, fields=None, **kwargs):
-        """Return a link to the next subset of the resources."""
+    def get_next(self, limit, url=None, fields=None, marker=None, **kwargs):
+        """Return a link to the next subset of the resources.
+
+        The marker of the link is the ID of the last resource unless
+        another one is given.
+        """
         if not self.has_next(limit):
             return wtypes.Unset
 
@@ -160,7 +165,7 @@ class ResourceList(Resource):
             {
                 'args': q_args,
                 'limit': limit,
-                'marker': self.collection[-1].id
+                'marker': marker or self.collection[-1].id
             }
         )
 
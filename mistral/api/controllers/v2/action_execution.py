@@ -153,7 +153,15 @@ class ActionExecutionsController(rest.RestController):
 
         LOG.debug("Fetch action_execution [id=%s]", id)
 
-        return _get_action_execution(id, fields=fields)
+        try:
+            return _get_action_execution(id, fields=fields)
+        except exc.DBEntityNotFoundError:
+            action_ex = rest_utils.load_archived_execution(id, 'action')
+
+            if not action_ex:
+                raise
+
+            return _get_action_execution_resource(action_ex, fields=fields)
 
     @rest_utils.wrap_wsme_controller_exception
     @wsme_pecan.wsexpose(resources.ActionExecution,
@@ -237,8 +245,9 @@ class ActionExecutionsController(rest.RestController):
 
         return resources.ActionExecution.from_dict(values)
 
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.ActionExecutions, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.ActionExecutions, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text, wtypes.text,
                          wtypes.text, wtypes.text, wtypes.text, types.uuid,
@@ -365,8 +374,9 @@ class ActionExecutionsController(rest.RestController):
 
 
 class TasksActionExecutionController(rest.RestController):
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.ActionExecutions, types.uuid, types.uuid,
+    @wsme_pecan.wsexpose(resources.ActionExecutions, types.uuid, types.marker,
                          int, types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, types.uniquelist, wtypes.text,
                          wtypes.text, wtypes.text, wtypes.text, wtypes.text,
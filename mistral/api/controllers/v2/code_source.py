@@ -116,7 +116,7 @@ class CodeSourcesController(rest.RestController, hooks.HookController):
 
         return resources.CodeSource.from_db_model(db_model).to_json()
 
-    @wsme_pecan.wsexpose(resources.CodeSources, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.CodeSources, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text,
                          resources.SCOPE_TYPES, types.uuid, wtypes.text,
@@ -109,7 +109,7 @@ class CronTriggersController(rest.RestController):
         )(identifier)
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.CronTriggers, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.CronTriggers, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text, types.uuid, types.jsontype,
                          types.jsontype, resources.SCOPE_TYPES, wtypes.text,
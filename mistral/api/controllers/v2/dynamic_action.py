@@ -134,7 +134,7 @@ class DynamicActionsController(rest.RestController, hooks.HookController):
 
         return resources.DynamicAction.from_db_model(db_model)
 
-    @wsme_pecan.wsexpose(resources.DynamicActions, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.DynamicActions, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text,
                          resources.SCOPE_TYPES, types.uuid, wtypes.text,
@@ -143,7 +143,7 @@ class EventTriggersController(rest.RestController):
         _delete_event_trigger()
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.EventTriggers, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.EventTriggers, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          bool, types.jsontype)
     def get_all(self, marker=None, limit=None, sort_keys='created_at',
@@ -34,6 +34,7 @@ from mistral.db.v2 import api as db_api
 from mistral.db.v2.sqlalchemy import models as db_models
 from mistral import exceptions as exc
 from mistral.rpc import clients as rpc
+from mistral.services import execution_watcher
 from mistral.services import workflows as wf_service
 from mistral.utils import filter_utils
 from mistral.utils import rest_utils
@@ -89,6 +90,55 @@ def _get_workflow_execution(id, must_exist=True, fields=None):
         )
 
 
+def _get_workflow_execution_versions(id):
+    with db_api.transaction(read_only=True):
+        wf_ex = db_api.load_workflow_execution(
+            id,
+            fields=(
+                db_models.WorkflowExecution.id,
+                db_models.WorkflowExecution.created_at,
+                db_models.WorkflowExecution.updated_at
+            )
+        )
+
+    # Archived executions are not cached.
+    return [wf_ex] if wf_ex else None
+
+
+def _get_workflow_execution_state(id):
+    with db_api.transaction(read_only=True):
+        wf_ex = db_api.load_workflow_execution(
+            id,
+            fields=(db_models.WorkflowExecution.state,)
+        )
+
+    return wf_ex.state if wf_ex else None
+
+
+def _get_execution_resource(id, fields):
+    try:
+        wf_ex = _get_workflow_execution(id, fields=fields)
+    except exc.DBEntityNotFoundError:
+        wf_ex = rest_utils.load_archived_execution(id, 'workflow')
+
+        if not wf_ex:
+            raise
+
+        if fields:
+            wf_ex = tuple(getattr(wf_ex, f, None) for f in fields)
+
+    if fields:
+        return resources.Execution.from_tuples(zip(fields, wf_ex))
+
+    resource = resources.Execution.from_db_model(wf_ex, fields=fields)
+
+    resource.published_global = (
+        data_flow.get_workflow_execution_published_global(wf_ex)
+    )
+
+    return resource
+
+
 # TODO(rakhmerov): Make sure to make all needed renaming on public API.
 
 
@@ -98,32 +148,39 @@ class ExecutionsController(rest.RestController):
     executions = sub_execution.SubExecutionsController()
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Execution, wtypes.text, types.uniquelist)
-    def get(self, id, fields=None):
+    @wsme_pecan.wsexpose(resources.Execution, wtypes.text, types.uniquelist,
+                         bool, int)
+    def get(self, id, fields=None, wait_for_state_change=False,
+            timeout=None):
         """Return the specified Execution.
 
         :param id: UUID of execution to retrieve.
         :param fields: Optional. A specified list of fields of the resource to
                        be returned. 'id' will be included automatically in
                        fields if it's not provided.
+        :param wait_for_state_change: Optional. If True and the execution is
+                       not completed, the execution is returned once its
+                       state changes or the timeout expires.
+        :param timeout: Optional. The max number of seconds to wait for a
+                       state change. Default: [api] max_watch_timeout.
         """
         acl.enforce("executions:get", context.ctx())
 
         LOG.debug("Fetch execution [id=%s]", id)
 
-        wf_ex = _get_workflow_execution(id, fields=fields)
-
-        if fields:
-            return resources.Execution.from_tuples(zip(fields, wf_ex))
-
-        resource = resources.Execution.from_db_model(wf_ex, fields=fields)
+        if wait_for_state_change:
+            execution_watcher.wait_for_state_change(
+                id,
+                lambda: _get_workflow_execution_state(id),
+                timeout
+            )
 
-        resource.published_global = (
-            data_flow.get_workflow_execution_published_global(wf_ex)
+        return rest_utils.get_cached(
+            resources.Execution,
+            lambda: _get_workflow_execution_versions(id),
+            lambda: _get_execution_resource(id, fields)
         )
 
-        return resource
-
     @rest_utils.wrap_wsme_controller_exception
     @wsme_pecan.wsexpose(
         resources.Execution,
@@ -353,8 +410,9 @@ class ExecutionsController(rest.RestController):
             db_api.delete_workflow_execution
         )(id)
 
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Executions, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.Executions, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, types.uuid, wtypes.text,
                          types.uniquelist, types.jsontype, types.uuid,
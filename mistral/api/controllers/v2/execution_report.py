@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
 from datetime import datetime
 from oslo_log import log as logging
 from pecan import rest
@@ -22,7 +23,6 @@ from mistral.api.controllers.v2 import resources
 from mistral.api.controllers.v2 import types
 from mistral import context
 from mistral.db.v2 import api as db_api
-from mistral.db.v2.sqlalchemy import models as db_models
 from mistral.utils import rest_utils
 from mistral.workflow import states
 
@@ -31,17 +31,30 @@ LOG = logging.getLogger(__name__)
 
 ESTIMATED_TIME_QUERY_LIMIT = 20
 
+# The max number of ids passed to one query loading report entries.
+ENTRY_QUERY_BATCH_SIZE = 1000
 
-def create_workflow_execution_entry(wf_ex):
-    return resources.WorkflowExecutionReportEntry.from_db_model(wf_ex)
+_ENTRY_FIELDS = (
+    'id',
+    'name',
+    'created_at',
+    'updated_at',
+    'state',
+    'state_info'
+)
 
+_WF_EX_FIELDS = _ENTRY_FIELDS + ('task_execution_id',)
 
-def create_task_execution_entry(task_ex):
-    return resources.TaskExecutionReportEntry.from_db_model(task_ex)
+_TASK_EX_FIELDS = _ENTRY_FIELDS + (
+    'workflow_execution_id',
+    'runtime_context'
+)
 
-
-def create_action_execution_entry(action_ex):
-    return resources.ActionExecutionReportEntry.from_db_model(action_ex)
+_ACTION_EX_FIELDS = _ENTRY_FIELDS + (
+    'accepted',
+    'last_heartbeat',
+    'task_execution_id'
+)
 
 
 def update_statistics_with_task(stat, task_ex):
@@ -57,111 +70,126 @@ def update_statistics_with_task(stat, task_ex):
         stat.increment_paused()
 
 
-def analyse_task_execution(task_ex_id, stat, filters, cur_depth):
-    with db_api.transaction():
-        task_ex = db_api.get_task_execution(task_ex_id)
+def _load_executions(get_func, fields, key, values):
+    """Loads only the given fields of the matching executions.
 
-        if filters['errors_only'] and task_ex.state != states.ERROR:
-            return None
+    :return: A list of dicts sorted by execution id.
+    """
+    values = sorted(values)
 
-        update_statistics_with_task(stat, task_ex)
+    res = []
 
-        entry = create_task_execution_entry(task_ex)
+    for i in range(0, len(values), ENTRY_QUERY_BATCH_SIZE):
+        rows = get_func(
+            fields=fields,
+            **{key: {'in': values[i:i + ENTRY_QUERY_BATCH_SIZE]}}
+        )
 
-        child_executions = task_ex.executions
+        res.extend(dict(zip(fields, row)) for row in rows)
 
-    if 'retry_task_policy' in task_ex.runtime_context:
-        retry_ctx = task_ex.runtime_context['retry_task_policy']
+    return sorted(res, key=lambda ex: ex['id'])
 
-        entry.retry_count = retry_ctx['retry_no']
 
-    entry.action_executions = []
-    entry.workflow_executions = []
+def _load_tree_executions(tree, max_depth):
+    ids = collections.defaultdict(list)
 
-    for c_ex in child_executions:
-        if isinstance(c_ex, db_models.ActionExecution):
-            entry.action_executions.append(
-                create_action_execution_entry(c_ex)
-            )
-        else:
-            entry.workflow_executions.append(
-                analyse_workflow_execution(c_ex.id, stat, filters, cur_depth)
-            )
+    for node in tree:
+        ids[node.type].append(node.id)
 
-    return entry
+    wf_exs = _load_executions(
+        db_api.get_workflow_executions,
+        _WF_EX_FIELDS,
+        'id',
+        ids['workflow']
+    )
 
+    if max_depth >= 0:
+        # Workflow executions nested deeper than the max depth are still
+        # reported but without their tasks.
+        wf_exs.extend(
+            _load_executions(
+                db_api.get_workflow_executions,
+                _WF_EX_FIELDS,
+                'task_execution_id',
+                [
+                    node.id for node in tree
+                    if node.type == 'task' and node.depth == max_depth
+                ]
+            )
+        )
 
-def analyse_workflow_execution(wf_ex_id, stat, filters, cur_depth):
-    with db_api.transaction():
-        wf_ex = db_api.get_workflow_execution(wf_ex_id)
+    task_exs = _load_executions(
+        db_api.get_task_executions,
+        _TASK_EX_FIELDS,
+        'id',
+        ids['task']
+    )
 
-        entry = create_workflow_execution_entry(wf_ex)
+    action_exs = _load_executions(
+        db_api.get_action_executions,
+        _ACTION_EX_FIELDS,
+        'id',
+        ids['action']
+    )
 
-        max_depth = filters['max_depth']
+    return wf_exs, task_exs, action_exs
 
-        # Don't get deeper into the workflow task executions if
-        # maximum depth is defined and the current depth exceeds it.
-        if 0 <= max_depth < cur_depth:
-            return entry
 
-        task_execs = wf_ex.task_executions
+def build_execution_tree_entry(wf_ex_id, tree, max_depth):
+    """Builds the report entry of a workflow execution and its children.
 
-    entry.task_executions = []
+    :param wf_ex_id: The id of the root workflow execution.
+    :param tree: The execution tree as returned by
+        db_api.get_execution_tree().
+    :param max_depth: The max depth the tree was fetched with.
+    :return: The report entry of the root workflow execution.
+    """
+    wf_exs, task_exs, action_exs = _load_tree_executions(tree, max_depth)
 
-    for t_ex in task_execs:
-        task_exec_entry = analyse_task_execution(
-            t_ex.id,
-            stat,
-            filters,
-            cur_depth + 1
-        )
+    tree_wf_ex_ids = set(node.id for node in tree if node.type == 'workflow')
 
-        if task_exec_entry:
-            entry.task_executions.append(task_exec_entry)
+    wf_entries = {}
+    task_entries = {}
 
-    return entry
+    for wf_ex in wf_exs:
+        entry = resources.WorkflowExecutionReportEntry.from_dict(wf_ex)
 
+        if wf_ex['id'] in tree_wf_ex_ids:
+            entry.task_executions = []
 
-def analyse_task_statistics_only(task_ex_id, stat, filters, cur_depth):
-    with db_api.transaction():
-        task_ex = db_api.get_task_execution(task_ex_id)
+        wf_entries[wf_ex['id']] = entry
 
-        if filters['errors_only'] and task_ex.state != states.ERROR:
-            return
+    for task_ex in task_exs:
+        entry = resources.TaskExecutionReportEntry.from_dict(task_ex)
 
-        update_statistics_with_task(stat, task_ex)
+        runtime_ctx = task_ex['runtime_context'] or {}
 
-        child_executions = task_ex.executions
+        if 'retry_task_policy' in runtime_ctx:
+            entry.retry_count = runtime_ctx['retry_task_policy']['retry_no']
 
-    for c_ex in child_executions:
-        if not isinstance(c_ex, db_models.ActionExecution):
-            analyse_execution_statistics_only(
-                c_ex.id,
-                stat,
-                filters,
-                cur_depth
-            )
+        entry.action_executions = []
+        entry.workflow_executions = []
 
+        wf_entry = wf_entries[task_ex['workflow_execution_id']]
 
-def analyse_execution_statistics_only(wf_ex_id, stat, filters, cur_depth):
+        wf_entry.task_executions.append(entry)
 
-    max_depth = filters['max_depth']
+        task_entries[task_ex['id']] = entry
 
-    if 0 <= max_depth < cur_depth:
-        return
+    for action_ex in action_exs:
+        task_entry = task_entries[action_ex['task_execution_id']]
 
-    with db_api.transaction():
-        wf_ex = db_api.get_workflow_execution(wf_ex_id)
+        task_entry.action_executions.append(
+            resources.ActionExecutionReportEntry.from_dict(action_ex)
+        )
 
-        task_execs = wf_ex.task_executions
+    for wf_ex in wf_exs:
+        if wf_ex['id'] != wf_ex_id:
+            task_entry = task_entries[wf_ex['task_execution_id']]
 
-    for t_ex in task_execs:
-        analyse_task_statistics_only(
-            t_ex.id,
-            stat,
-            filters,
-            cur_depth + 1
-        )
+            task_entry.workflow_executions.append(wf_entries[wf_ex['id']])
+
+    return wf_entries.get(wf_ex_id)
 
 
 def calculate_estimated_left_time_for_exec(wf_ex, prev_wf_exs):
@@ -202,21 +230,27 @@ def build_report(wf_ex_id, filters):
 
     report.statistics = stat
 
-    if not filters['statistics_only']:
-        report.root_workflow_execution = analyse_workflow_execution(
-            wf_ex_id,
-            stat,
-            filters,
-            0
-        )
-    else:
-        analyse_execution_statistics_only(
+    # The whole execution tree is fetched with one query, the filters are
+    # applied by the database. Then only the needed columns of the tree
+    # executions are loaded in bulk.
+    with db_api.transaction():
+        tree = db_api.get_execution_tree(
             wf_ex_id,
-            stat,
-            filters,
-            0
+            max_depth=filters['max_depth'],
+            errors_only=filters['errors_only']
         )
 
+        for node in tree:
+            if node.type == 'task':
+                update_statistics_with_task(stat, node)
+
+        if not filters['statistics_only']:
+            report.root_workflow_execution = build_execution_tree_entry(
+                wf_ex_id,
+                tree,
+                filters['max_depth']
+            )
+
     return report
 
 
@@ -34,6 +34,7 @@ from mistral import exceptions as exc
 from mistral import expressions as expr
 from mistral.lang import parser as spec_parser
 from mistral.rpc import clients as rpc
+from mistral.services import execution_watcher
 from mistral.utils import filter_utils
 from mistral.utils import rest_utils
 from mistral.workflow import data_flow
@@ -82,6 +83,16 @@ def _get_task_execution(id, fields=()):
         return _get_task_resource_with_result(task_ex, fields), task_ex
 
 
+def _get_task_execution_state(id):
+    with db_api.transaction(read_only=True):
+        task_ex = db_api.load_task_execution(
+            id,
+            fields=(db_models.TaskExecution.state,)
+        )
+
+    return task_ex.state if task_ex else None
+
+
 def get_published_global(task_ex, wf_ex=None):
     if task_ex.state not in [states.SUCCESS, states.ERROR]:
         return
@@ -118,8 +129,9 @@ def _task_with_published_global(task, task_ex):
 
 
 class TaskExecutionsController(rest.RestController):
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Executions, types.uuid, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.Executions, types.uuid, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, types.uuid, wtypes.text,
                          types.uniquelist, types.jsontype, STATE_TYPES,
@@ -209,19 +221,41 @@ class TasksController(rest.RestController):
     executions = sub_execution.SubExecutionsController()
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Task, wtypes.text, types.uniquelist)
-    def get(self, id, fields=''):
+    @wsme_pecan.wsexpose(resources.Task, wtypes.text, types.uniquelist, bool,
+                         int)
+    def get(self, id, fields='', wait_for_state_change=False, timeout=None):
         """Return the specified task.
 
         :param id: UUID of task to retrieve
         :param fields: Optional. A specified list of fields of the resource to
                        be returned. 'id' will be included automatically in
                        fields if it's not provided.
+        :param wait_for_state_change: Optional. If True and the task is not
+                       completed, the task is returned once its state
+                       changes or the timeout expires.
+        :param timeout: Optional. The max number of seconds to wait for a
+                       state change. Default: [api] max_watch_timeout.
         """
         acl.enforce('tasks:get', context.ctx())
         LOG.debug("Fetch task [id=%s]", id)
 
-        task, task_ex = _get_task_execution(id, ())
+        if wait_for_state_change:
+            execution_watcher.wait_for_state_change(
+                id,
+                lambda: _get_task_execution_state(id),
+                timeout
+            )
+
+        try:
+            task, task_ex = _get_task_execution(id, ())
+        except exc.DBEntityNotFoundError:
+            task_ex = rest_utils.load_archived_execution(id, 'task')
+
+            if not task_ex:
+                raise
+
+            task = _get_task_resource_with_result(task_ex)
+
         task = _task_with_published_global(task, task_ex)
         if fields:
             if 'id' not in fields:
@@ -230,8 +264,9 @@ class TasksController(rest.RestController):
             task = resources.Task.from_dict(task_dict)
         return task
 
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Tasks, types.uuid, int, types.uniquelist,
+    @wsme_pecan.wsexpose(resources.Tasks, types.marker, int, types.uniquelist,
                          types.list, types.uniquelist, wtypes.text,
                          wtypes.text, types.uuid,
                          types.uuid, types.uniquelist, STATE_TYPES,
@@ -408,8 +443,9 @@ class TasksController(rest.RestController):
 
 
 class ExecutionTasksController(rest.RestController):
+    @rest_utils.ndjson_streamable
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Tasks, types.uuid, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.Tasks, types.uuid, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text, types.uuid,
                          types.uniquelist, STATE_TYPES, wtypes.text,
@@ -496,15 +532,32 @@ class ExecutionTasksController(rest.RestController):
             filters
         )
 
-        return rest_utils.get_all(
+        return rest_utils.get_cached(
             resources.Tasks,
-            resources.Task,
-            db_api.get_task_executions,
-            db_api.get_task_execution,
-            marker=marker,
-            limit=limit,
-            sort_keys=sort_keys,
-            sort_dirs=sort_dirs,
-            fields=fields,
-            **filters
+            lambda: _get_task_execution_versions(workflow_execution_id),
+            lambda: rest_utils.get_all(
+                resources.Tasks,
+                resources.Task,
+                db_api.get_task_executions,
+                db_api.get_task_execution,
+                marker=marker,
+                limit=limit,
+                sort_keys=sort_keys,
+                sort_dirs=sort_dirs,
+                fields=fields,
+                **filters
+            )
         )
+
+
+def _get_task_execution_versions(workflow_execution_id):
+    # All tasks of the workflow execution are read, whatever the filters.
+    with db_api.transaction(read_only=True):
+        return [
+            tuple(row) for row in db_api.get_task_executions(
+                workflow_execution_id=workflow_execution_id,
+                sort_keys=['id'],
+                sort_dirs=['asc'],
+                fields=['id', 'created_at', 'updated_at']
+            )
+        ]
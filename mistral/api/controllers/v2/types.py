@@ -18,6 +18,7 @@ from oslo_utils import uuidutils
 from wsme import types as wtypes
 
 from mistral import exceptions as exc
+from mistral.utils import cursor_utils
 
 
 class ListType(wtypes.UserType):
@@ -90,6 +91,28 @@ class UuidType(wtypes.UserType):
         return UuidType.validate(value) if value is not None else None
 
 
+class MarkerType(wtypes.UserType):
+    """A pagination marker type.
+
+    A marker is either a resource UUID or an opaque marker carrying the
+    sort key values of a resource.
+    """
+
+    basetype = wtypes.text
+    name = 'marker'
+
+    @staticmethod
+    def validate(value):
+        if not uuidutils.is_uuid_like(value):
+            cursor_utils.decode_cursor(value)
+
+        return value
+
+    @staticmethod
+    def frombasetype(value):
+        return MarkerType.validate(value) if value is not None else None
+
+
 class JsonType(wtypes.UserType):
     """A simple JSON type."""
 
@@ -121,6 +144,7 @@ class JsonType(wtypes.UserType):
 
 
 uuid = UuidType()
+marker = MarkerType()
 list = ListType()
 uniquelist = UniqueListType()
 jsontype = JsonType()
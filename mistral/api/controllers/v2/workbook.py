@@ -164,7 +164,7 @@ class WorkbooksController(rest.RestController, hooks.HookController):
         )
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Workbooks, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.Workbooks, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text, wtypes.text,
                          resources.SCOPE_TYPES, wtypes.text,
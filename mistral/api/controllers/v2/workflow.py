@@ -228,7 +228,7 @@ class WorkflowsController(rest.RestController, hooks.HookController):
         _delete_workflow_definition()
 
     @rest_utils.wrap_wsme_controller_exception
-    @wsme_pecan.wsexpose(resources.Workflows, types.uuid, int,
+    @wsme_pecan.wsexpose(resources.Workflows, types.marker, int,
                          types.uniquelist, types.list, types.uniquelist,
                          wtypes.text, wtypes.text, wtypes.text, wtypes.text,
                          resources.SCOPE_TYPES, types.uuid, wtypes.text,
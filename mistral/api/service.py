@@ -56,7 +56,18 @@ class WSGIService(service.ServiceBase):
         self.server = wsgi.Server(
             bind_addr=bind_addr,
             wsgi_app=self.app,
-            server_name=name)
+            server_name=name,
+            numthreads=cfg.CONF.api.server_threads)
+
+        if (cfg.CONF.api.execution_watcher != 'none' and
+                cfg.CONF.api.max_watchers >= cfg.CONF.api.server_threads):
+            LOG.warning(
+                "[api] max_watchers (%s) is not lower than [api] "
+                "server_threads (%s), requests waiting for execution state "
+                "changes may prevent the API from serving other requests.",
+                cfg.CONF.api.max_watchers,
+                cfg.CONF.api.server_threads
+            )
 
         if cfg.CONF.api.enable_ssl_api:
             # NOTE(amorin) I copy pasted this from ironic code and they
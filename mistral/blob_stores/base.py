@@ -0,0 +1,227 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import abc
+import hashlib
+import threading
+import time
+
+import cachetools
+from oslo_log import log as logging
+from stevedore import driver
+
+from mistral import config as cfg
+
+
+LOG = logging.getLogger(__name__)
+
+# A JSON text can't start with "~" so this prefix tells references to
+# blobs from values stored in the database.
+REFERENCE_PREFIX = '~blob:'
+
+_BLOB_STORE = None
+
+_CACHE = None
+_CACHE_LOCK = threading.Lock()
+
+
+def cleanup():
+    global _BLOB_STORE
+    global _CACHE
+
+    _BLOB_STORE = None
+    _CACHE = None
+
+
+def get_blob_store():
+    global _BLOB_STORE
+
+    if not _BLOB_STORE:
+        mgr = driver.DriverManager(
+            'mistral.blob_stores',
+            cfg.CONF.blob_store.driver,
+            invoke_on_load=True
+        )
+
+        _BLOB_STORE = mgr.driver
+
+    return _BLOB_STORE
+
+
+def _get_cache():
+    global _CACHE
+
+    size = cfg.CONF.blob_store.cache_size_mb * 1024 * 1024
+
+    if not size:
+        return None
+
+    if _CACHE is None:
+        _CACHE = cachetools.LRUCache(maxsize=size, getsizeof=len)
+
+    return _CACHE
+
+
+def _cache_put(key, value):
+    with _CACHE_LOCK:
+        cache = _get_cache()
+
+        if cache is not None and len(value) <= cache.maxsize:
+            cache[key] = value
+
+
+def _cache_get(key):
+    with _CACHE_LOCK:
+        cache = _get_cache()
+
+        return cache.get(key) if cache is not None else None
+
+
+def _cache_pop(key):
+    with _CACHE_LOCK:
+        cache = _get_cache()
+
+        if cache is not None:
+            cache.pop(key, None)
+
+
+def is_enabled():
+    return cfg.CONF.blob_store.enabled
+
+
+def is_reference(value):
+    return value is not None and value.startswith(REFERENCE_PREFIX)
+
+
+def get_key(reference):
+    return reference[len(REFERENCE_PREFIX):]
+
+
+def offload(value):
+    """Moves a string to the blob store if it's large enough.
+
+    :param value: String to store.
+    :return: A reference to the blob if the blob store is enabled and the
+        string is at least [blob_store] offload_threshold_kb long, the
+        given string otherwise.
+    """
+    if value is None or not is_enabled():
+        return value
+
+    data = value.encode('utf-8')
+
+    if len(data) < cfg.CONF.blob_store.offload_threshold_kb * 1024:
+        return value
+
+    # Keys are built from the content so storing the same value again,
+    # e.g. when a transaction is retried, doesn't create another blob.
+    key = hashlib.sha256(data).hexdigest()
+
+    get_blob_store().put(key, data)
+
+    _cache_put(key, value)
+
+    return REFERENCE_PREFIX + key
+
+
+def load(value):
+    """Returns the string a value built by offload() refers to."""
+    if not is_reference(value):
+        return value
+
+    key = get_key(value)
+
+    res = _cache_get(key)
+
+    if res is None:
+        res = get_blob_store().get(key).decode('utf-8')
+
+        _cache_put(key, res)
+
+    return res
+
+
+def purge(referenced_keys, min_age):
+    """Deletes blobs which are not referenced anymore.
+
+    :param referenced_keys: Keys of the blobs that must be kept.
+    :param min_age: The min age of a blob to delete it, in seconds. Blobs
+        written by transactions that are still running are not referenced
+        yet, they are younger than that.
+    :return: The number of deleted blobs.
+    """
+    store = get_blob_store()
+
+    deleted = 0
+
+    for key in list(store.list(time.time() - min_age)):
+        if key in referenced_keys:
+            continue
+
+        store.delete(key)
+
+        _cache_pop(key)
+
+        deleted += 1
+
+    LOG.info("Deleted %s unreferenced blobs", deleted)
+
+    return deleted
+
+
+class BlobStore(object, metaclass=abc.ABCMeta):
+    """Blob store interface.
+
+    Blobs are never modified once they are written and their keys are
+    hashes of their content.
+    """
+
+    @abc.abstractmethod
+    def put(self, key, data):
+        """Stores a blob.
+
+        If the blob already exists it must be kept at least as long as it
+        was just written.
+
+        :param key: Blob key.
+        :param data: Blob content (bytes).
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Returns the content of a blob.
+
+        :param key: Blob key.
+        :return: Blob content (bytes).
+        :raises BlobStoreException: If the blob doesn't exist.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """Deletes a blob if it exists.
+
+        :param key: Blob key.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def list(self, older_than):
+        """Returns the keys of the blobs written before the given time.
+
+        :param older_than: UNIX timestamp.
+        :return: Iterable of blob keys.
+        """
+        raise NotImplementedError
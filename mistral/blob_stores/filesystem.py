@@ -0,0 +1,87 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import os
+import re
+import uuid
+
+from mistral.blob_stores import base
+from mistral import config as cfg
+from mistral import exceptions as exc
+
+
+_KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+class FileSystemBlobStore(base.BlobStore):
+    """Stores blobs as files of a local or shared directory.
+
+    Blobs are spread over subdirectories named after the first two
+    characters of their keys.
+    """
+
+    def __init__(self):
+        self._path = cfg.CONF.blob_store.filesystem_path
+
+    def _get_file_path(self, key):
+        if not _KEY_PATTERN.match(key):
+            raise exc.BlobStoreException('Invalid blob key: %s' % key)
+
+        return os.path.join(self._path, key[:2], key)
+
+    def put(self, key, data):
+        file_path = self._get_file_path(key)
+
+        if os.path.exists(file_path):
+            # Make sure the blob is not purged as an unreferenced one.
+            os.utime(file_path)
+
+            return
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+        # Write a temporary file first so that readers never see
+        # a partially written blob.
+        tmp_path = '%s.%s.tmp' % (file_path, uuid.uuid4().hex)
+
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+
+        os.replace(tmp_path, file_path)
+
+    def get(self, key):
+        try:
+            with open(self._get_file_path(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise exc.BlobStoreException('Blob not found: %s' % key)
+
+    def delete(self, key):
+        try:
+            os.remove(self._get_file_path(key))
+        except FileNotFoundError:
+            pass
+
+    def list(self, older_than):
+        if not os.path.isdir(self._path):
+            return
+
+        for dir_entry in os.scandir(self._path):
+            if not dir_entry.is_dir():
+                continue
+
+            for entry in os.scandir(dir_entry.path):
+                if (_KEY_PATTERN.match(entry.name) and
+                        entry.stat().st_mtime < older_than):
+                    yield entry.name
@@ -135,6 +135,15 @@ api_opts = [
         help='Mistral API server host'
     ),
     cfg.PortOpt('port', default=8989, help='Mistral API server port'),
+    cfg.IntOpt(
+        'server_threads',
+        default=10,
+        min=1,
+        help=_('The number of threads of the WSGI server of the Mistral API '
+               'service, i.e. the max number of requests it handles at the '
+               'same time. Requests waiting for execution state changes '
+               'hold a thread so it must be larger than "max_watchers".')
+    ),
     cfg.IntOpt(
         'max_limit',
         default=1000,
@@ -145,6 +154,75 @@ api_opts = [
                'marker to fetch further pages. Prevents unbounded result '
                'sets from exhausting the API/DB memory.')
     ),
+    cfg.IntOpt(
+        'stream_page_size',
+        default=1000,
+        min=1,
+        help=_('The number of resources read by one database transaction '
+               'when a list of executions, tasks or action executions is '
+               'streamed as newline delimited JSON (requested with the '
+               '"Accept: application/x-ndjson" header). Streamed lists '
+               'are not limited by "max_limit".')
+    ),
+    cfg.IntOpt(
+        'response_cache_size',
+        default=0,
+        min=0,
+        help=_('The max number of responses of "GET /v2/executions/{id}" '
+               'and "GET /v2/executions/{id}/tasks" kept in the memory of '
+               'an API worker. These responses get an ETag header and '
+               'serving them from the cache, or answering a request with a '
+               'matching "If-None-Match" header with a 304 status, only '
+               'reads the IDs and update times of the resources. 0 '
+               'disables the cache and the ETag headers.')
+    ),
+    cfg.IntOpt(
+        'response_cache_min_age',
+        default=2,
+        min=1,
+        help=_('The number of seconds the resources of a response must not '
+               'have changed for to cache it. Update times are stored with '
+               'a one second precision so changes made within the same '
+               'second can not be told apart. It must also cover the clock '
+               'differences between the Mistral nodes.')
+    ),
+    cfg.StrOpt(
+        'execution_watcher',
+        default='none',
+        choices=['none', 'local', 'rpc'],
+        help=_('The way API workers learn about state changes of workflow '
+               'and task executions, needed to answer requests with the '
+               '"wait_for_state_change" parameter without querying the '
+               'database in a loop. "local" only sees the changes made by '
+               'the engines of the API process, "rpc" makes engines send '
+               'them to all API workers with RPC fanout casts. "none" '
+               'disables waiting. Every waiting request holds a thread of '
+               'the WSGI server, see "max_watchers".')
+    ),
+    cfg.StrOpt(
+        'topic',
+        default='mistral_api',
+        help=_('The message topic API workers listen on for execution '
+               'state changes when "execution_watcher" is "rpc".')
+    ),
+    cfg.IntOpt(
+        'max_watch_timeout',
+        default=60,
+        min=1,
+        help=_('The max number of seconds a request can wait for a state '
+               'change of an execution.')
+    ),
+    cfg.IntOpt(
+        'max_watchers',
+        default=5,
+        min=0,
+        help=_('The max number of requests of an API worker that can wait '
+               'for state changes of executions at the same time. Further '
+               'requests are rejected with a 429 error. Each waiting request '
+               'holds a thread of the WSGI server so it must be lower than '
+               'the number of threads of the server ("server_threads" for '
+               'the Mistral API service) to keep serving other requests.')
+    ),
     cfg.BoolOpt(
         'allow_action_execution_deletion',
         default=False,
@@ -202,6 +280,38 @@ js_impl_opt = cfg.StrOpt(
            'action to evaluate scripts.')
 )
 
+json_codec_opt = cfg.StrOpt(
+    'json_codec',
+    default='auto',
+    choices=['auto', 'stdlib', 'orjson'],
+    help=_('The codec used to convert JSON columns of the database (e.g. '
+           'contexts, inputs and outputs of executions) to strings and '
+           'back. "orjson" decodes them with the "orjson" library, which '
+           'is much faster than the standard library, and encodes them '
+           'exactly as "stdlib". "auto" selects "orjson" if the library '
+           'is installed and "stdlib" otherwise.')
+)
+
+json_compression_opts = [
+    cfg.BoolOpt(
+        'json_compression',
+        default=False,
+        help=_('Compress large JSON columns (e.g. contexts, inputs and '
+               'outputs of executions, variables of environments) with '
+               'zlib when they are written to the database. Compressed '
+               'and plain values can be read whatever the value of this '
+               'option, the "mistral-db-manage recompress" command '
+               'converts existing values.')
+    ),
+    cfg.IntOpt(
+        'json_compression_threshold',
+        default=4096,
+        min=0,
+        help=_('The min length of a JSON column value, in characters, to '
+               'compress it.')
+    )
+]
+
 expiration_token_duration = cfg.IntOpt(
     'expiration_token_duration',
     default=30,
@@ -287,6 +397,53 @@ engine_opts = [
                ' execution integrity checker can process in a single'
                ' iteration.')
     ),
+    cfg.IntOpt(
+        'post_tx_workers',
+        default=16,
+        min=0,
+        help=_('The number of threads the engine server uses to run '
+               'operations registered during the processing of an engine '
+               'call after its transaction completes. 0 makes the engine '
+               'start a new thread for every such call.')
+    ),
+    cfg.IntOpt(
+        'post_tx_queue_size',
+        default=1000,
+        min=1,
+        help=_('The max number of engine calls whose post transaction '
+               'operations can wait for a free worker. When the queue is '
+               'full, engine calls block until there is room in it, which '
+               'slows down the engine instead of piling up work.')
+    ),
+    cfg.IntOpt(
+        'with_items_batch_size',
+        default=500,
+        min=1,
+        help=_('The max number of actions of a "with-items" task that are '
+               'scheduled at once. Action executions of a batch are '
+               'inserted into the database with one statement and handed '
+               'over to the executor together.')
+    ),
+    cfg.StrOpt(
+        'named_lock_backend',
+        default='table',
+        choices=['table', 'advisory'],
+        help=_('How the engine implements named locks (e.g. the locks '
+               'serializing the processing of a task). "table" inserts '
+               'and deletes rows of the "named_locks" table. "advisory" '
+               'uses the advisory locks of the database: '
+               'pg_advisory_xact_lock() on PostgreSQL and GET_LOCK() on '
+               'MySQL/MariaDB. With other databases "advisory" falls back '
+               'to "table".')
+    ),
+    cfg.IntOpt(
+        'advisory_lock_timeout',
+        default=50,
+        min=0,
+        help=_('The max number of seconds to wait for a MySQL/MariaDB '
+               'advisory lock, after that the transaction fails and is '
+               'retried as with any lock wait timeout.')
+    ),
     cfg.IntOpt(
         'action_definition_cache_time',
         default=60,
@@ -343,13 +500,44 @@ executor_opts = [
         'version',
         default='1.0',
         help=_('The version of the executor.')
+    ),
+    cfg.IntOpt(
+        'action_workers',
+        default=64,
+        min=1,
+        help=_('The max number of actions an executor runs concurrently. '
+               'Actions are run by a pool of threads of this size, the '
+               'ones that can\'t start right away wait in a queue. The '
+               'timeout of an action includes the time it spent in the '
+               'queue.')
+    ),
+    cfg.StrOpt(
+        'execution_mode',
+        default='threads',
+        choices=['threads', 'asyncio'],
+        help=_('How the executor runs actions. In the "threads" mode every '
+               'action runs on a worker thread. In the "asyncio" mode the '
+               'actions supporting it (e.g. std.http, std.mistral_http and '
+               'std.echo) run as coroutines on a single event loop of the '
+               'executor, so they don\'t hold a thread while waiting for '
+               'I/O, and the other actions still run on worker threads. '
+               'The asynchronous HTTP actions require the "aiohttp" '
+               'library, without it they run on threads.')
+    ),
+    cfg.BoolOpt(
+        'batched_rpc',
+        default=False,
+        help=_('Send the actions of a "with-items" batch to the executor '
+               'in one RPC call instead of one call per action. Enable it '
+               'only when all executors support the "run_actions" RPC '
+               'method.')
     )
 ]
 
 scheduler_type_opt = cfg.StrOpt(
     'scheduler_type',
     default='legacy',
-    choices=['legacy', 'default'],
+    choices=['legacy', 'default', 'timing_wheel'],
     help=_('The name of the scheduler implementation used in the system.')
 )
 
@@ -425,6 +613,51 @@ scheduler_opts = [
              'scheduler process crashed. In this case another scheduler '
              'instance will pick it up from the Job Store, but not earlier '
              'than 12:01:00 and try to process it.'
+    ),
+    cfg.FloatOpt(
+        'timing_wheel_tick',
+        default=0.1,
+        min=0.01,
+        help=(
+            'The resolution of the timing wheels used by the "timing_wheel" '
+            'scheduler, in seconds. In-memory jobs run at most this much '
+            'later than their execution time.'
+        )
+    ),
+    cfg.IntOpt(
+        'timing_wheel_shards',
+        default=16,
+        min=1,
+        help=(
+            'The number of timing wheels, each with its own lock, the '
+            '"timing_wheel" scheduler spreads in-memory jobs across. Jobs '
+            'with the same key always go to the same wheel.'
+        )
+    ),
+    cfg.StrOpt(
+        'job_notifier',
+        default='none',
+        choices=['none', 'local', 'rpc'],
+        help=(
+            'The way schedulers are notified about persistent jobs. '
+            'If set to "local" or "rpc", every scheduled job notifies all '
+            'schedulers (of the current process for "local", of all engines '
+            'for "rpc") about the moment when the job becomes eligible for '
+            'pickup from the Job Store, so they check the Job Store exactly '
+            'at that moment instead of polling it every "fixed_delay" '
+            'seconds. If set to "none", schedulers only poll the Job Store.'
+        )
+    ),
+    cfg.FloatOpt(
+        'notified_fixed_delay',
+        default=30,
+        min=0.1,
+        help=(
+            'The delay between Job Store checks, in seconds, used instead '
+            'of "fixed_delay" when "job_notifier" is enabled. Polling is '
+            'still needed to pick up jobs whose notifications were lost, '
+            'but it can run much less often.'
+        )
     )
 ]
 
@@ -570,6 +803,53 @@ execution_expiration_policy_opts = [
         help='The states that the expiration policy will filter '
              'out and will not delete.'
              'Valid values are, [{}]'.format(sorted(states.TERMINAL_STATES))
+    ),
+    cfg.BoolOpt(
+        'bulk_purge',
+        default=False,
+        help=_('Delete expired executions with set-based statements '
+               'instead of one execution at a time. Root executions are '
+               'selected in batches of "batch_size" and their action, task '
+               'and workflow executions are deleted level by level, at '
+               'most "bulk_purge_rows_per_transaction" rows per '
+               'transaction.')
+    ),
+    cfg.IntOpt(
+        'bulk_purge_rows_per_transaction',
+        default=1000,
+        min=1,
+        help=_('The max number of rows deleted by one transaction in the '
+               'bulk purge mode.')
+    ),
+    cfg.IntOpt(
+        'bulk_purge_time_budget',
+        default=0,
+        min=0,
+        help=_('The max duration of one run of the expiration policy in '
+               'the bulk purge mode, in seconds. The remaining executions '
+               'are deleted by the next runs. 0 means no limit.')
+    )
+]
+
+execution_archive_policy_opts = [
+    cfg.IntOpt(
+        'evaluation_interval',
+        help=_('How often finished executions are moved to the archive '
+               '(in minutes). By default the archive policy is disabled.')
+    ),
+    cfg.IntOpt(
+        'older_than',
+        min=1,
+        help=_('Archive root workflow executions that finished this many '
+               'minutes ago or more, together with their task, action and '
+               'sub-workflow executions.')
+    ),
+    cfg.IntOpt(
+        'batch_size',
+        default=100,
+        min=1,
+        help=_('The number of root workflow executions moved to the '
+               'archive by one transaction.')
     )
 ]
 
@@ -611,6 +891,30 @@ action_heartbeat_opts = [
                'first_heartbeat_timeout = 3600, wait 3600 seconds before '
                'closing the action executions that never received a heartbeat.'
                )
+    ),
+    cfg.FloatOpt(
+        'flush_interval',
+        min=0.01,
+        default=0.5,
+        help=_('How often (in seconds) an executor sends the first '
+               'heartbeats of the actions it started since the last time. '
+               'Heartbeats of new actions are buffered and sent to the '
+               'engine in one request instead of one request per action.')
+    ),
+    cfg.IntOpt(
+        'flush_batch_size',
+        min=1,
+        default=100,
+        help=_('The number of buffered first heartbeats that makes an '
+               'executor send them right away without waiting for '
+               '"flush_interval".')
+    ),
+    cfg.IntOpt(
+        'update_chunk_size',
+        min=1,
+        default=500,
+        help=_('The max number of action executions whose heartbeats the '
+               'engine updates with a single database statement.')
     )
 ]
 
@@ -662,6 +966,48 @@ context_versioning_opts = [
     )
 ]
 
+blob_store_opts = [
+    cfg.BoolOpt(
+        'enabled',
+        default=False,
+        help=_('Store large JSON columns (e.g. action results, contexts, '
+               'variables of environments) in a blob store instead of the '
+               'database. The database keeps a reference to the blob. '
+               'All the Mistral services must have access to the same '
+               'blob store.')
+    ),
+    cfg.StrOpt(
+        'driver',
+        default='filesystem',
+        help=_('The blob store driver, one of the "mistral.blob_stores" '
+               'entry points.')
+    ),
+    cfg.IntOpt(
+        'offload_threshold_kb',
+        default=256,
+        min=0,
+        help=_('The min size in KB of a JSON column value to move it to '
+               'the blob store. Offloaded values are not subject to the '
+               '[engine] execution_field_size_limit_kb limit.')
+    ),
+    cfg.IntOpt(
+        'cache_size_mb',
+        default=64,
+        min=0,
+        help=_('The max total size in MiB of blobs cached in memory. '
+               'Blobs never change once written so the cache avoids '
+               'reading them again, e.g. when the results of tasks are '
+               'published. 0 disables the cache.')
+    ),
+    cfg.StrOpt(
+        'filesystem_path',
+        default='/var/lib/mistral/blobs',
+        help=_('The directory where the "filesystem" driver stores blobs. '
+               'When Mistral services run on several hosts it must be a '
+               'shared file system.')
+    )
+]
+
 profiler_opts = profiler.list_opts()[0][1]
 profiler_opts.append(
     cfg.StrOpt(
@@ -729,6 +1075,16 @@ expression_opts = [
                '"allowed_languages = yaql"), not a Python list literal; an '
                'unknown value is rejected at startup.')
     ),
+    cfg.IntOpt(
+        'cache_size',
+        default=1000,
+        min=0,
+        help=_('The maximum number of compiled YAQL and Jinja expressions '
+               'kept in the in-memory LRU cache shared by the expression '
+               'evaluators. The same expression is then parsed only once '
+               'per process instead of on every evaluation. 0 disables '
+               'the cache.')
+    ),
 ]
 
 action_std_http_opts = [
@@ -888,9 +1244,11 @@ EVENT_ENGINE_GROUP = 'event_engine'
 NOTIFIER_GROUP = 'notifier'
 PECAN_GROUP = 'pecan'
 EXECUTION_EXPIRATION_POLICY_GROUP = 'execution_expiration_policy'
+EXECUTION_ARCHIVE_POLICY_GROUP = 'execution_archive_policy'
 ACTION_HEARTBEAT_GROUP = 'action_heartbeat'
 ACTION_LOGGING_GROUP = 'action_logging'
 CONTEXT_VERSIONING_GROUP = 'context_versioning'
+BLOB_STORE_GROUP = 'blob_store'
 PROFILER_GROUP = profiler.list_opts()[0][0]
 KEYCLOAK_OIDC_GROUP = "keycloak_oidc"
 YAQL_GROUP = "yaql"
@@ -904,6 +1262,8 @@ CONF.register_opt(wf_trace_log_name_opt)
 CONF.register_opt(auth_type_opt)
 CONF.register_opt(scheduler_type_opt)
 CONF.register_opt(js_impl_opt)
+CONF.register_opt(json_codec_opt)
+CONF.register_opts(json_compression_opts)
 CONF.register_opt(expiration_token_duration)
 
 CONF.register_opts(action_providers_opts, group=ACTION_PROVIDERS_GROUP)
@@ -920,12 +1280,17 @@ CONF.register_opts(
     execution_expiration_policy_opts,
     group=EXECUTION_EXPIRATION_POLICY_GROUP
 )
+CONF.register_opts(
+    execution_archive_policy_opts,
+    group=EXECUTION_ARCHIVE_POLICY_GROUP
+)
 CONF.register_opts(
     action_heartbeat_opts,
     group=ACTION_HEARTBEAT_GROUP
 )
 CONF.register_opts(action_logging_opts, group=ACTION_LOGGING_GROUP)
 CONF.register_opts(context_versioning_opts, group=CONTEXT_VERSIONING_GROUP)
+CONF.register_opts(blob_store_opts, group=BLOB_STORE_GROUP)
 CONF.register_opts(event_engine_opts, group=EVENT_ENGINE_GROUP)
 CONF.register_opts(notifier_opts, group=NOTIFIER_GROUP)
 CONF.register_opts(pecan_opts, group=PECAN_GROUP)
@@ -946,8 +1311,9 @@ default_group_opts = CLI_OPTS + [
     auth_type_opt,
     scheduler_type_opt,
     js_impl_opt,
+    json_codec_opt,
     expiration_token_duration
-]
+] + json_compression_opts
 
 
 _DEFAULT_LOG_LEVELS = [
@@ -973,6 +1339,7 @@ def list_opts():
         (NOTIFIER_GROUP, notifier_opts),
         (PECAN_GROUP, pecan_opts),
         (EXECUTION_EXPIRATION_POLICY_GROUP, execution_expiration_policy_opts),
+        (EXECUTION_ARCHIVE_POLICY_GROUP, execution_archive_policy_opts),
         (PROFILER_GROUP, profiler_opts),
         (KEYCLOAK_OIDC_GROUP, keycloak_oidc_opts),
         (YAQL_GROUP, yaql_opts),
@@ -982,6 +1349,7 @@ def list_opts():
         (ACTION_HEARTBEAT_GROUP, action_heartbeat_opts),
         (ACTION_LOGGING_GROUP, action_logging_opts),
         (CONTEXT_VERSIONING_GROUP, context_versioning_opts),
+        (BLOB_STORE_GROUP, blob_store_opts),
         (None, default_group_opts)
     ]
 
@@ -1025,7 +1393,8 @@ def set_cors_middleware_defaults():
                        'X-Tenant-Id',
                        'X-Project-Id',
                        'X-User-Name',
-                       'X-Project-Name'],
+                       'X-Project-Name',
+                       'X-Read-From-Primary'],
         allow_methods=['GET',
                        'PUT',
                        'POST',
@@ -22,6 +22,7 @@ from oslo_context import context as oslo_context
 from oslo_log import log as logging
 import oslo_messaging as messaging
 from oslo_serialization import jsonutils
+from oslo_utils import strutils
 from osprofiler import profiler
 import pecan
 from pecan import hooks
@@ -52,7 +53,8 @@ class MistralContext(oslo_context.RequestContext):
     def __init__(self, auth_uri=None, auth_cacert=None, insecure=False,
                  service_catalog=None, region_name=None, is_trust_scoped=False,
                  redelivered=False, expires_at=None, trust_id=None,
-                 is_target=False, root_execution_id=None, **kwargs):
+                 is_target=False, root_execution_id=None, use_db_reader=None,
+                 **kwargs):
         self.auth_uri = auth_uri
         self.auth_cacert = auth_cacert
         self.insecure = insecure
@@ -65,6 +67,11 @@ class MistralContext(oslo_context.RequestContext):
         self.is_target = is_target
         self.root_execution_id = root_execution_id
 
+        # True if all database sessions must use the reader connection,
+        # False if none must, None to let read only transactions use it.
+        # It only applies to the current process so it's not serialized.
+        self.use_db_reader = use_db_reader
+
         # We still use Mistral thread local variable. Maybe could consider
         # using the variable provided by oslo_context in future.
         super(MistralContext, self).__init__(overwrite=False, **kwargs)
@@ -136,6 +143,7 @@ class MistralContext(oslo_context.RequestContext):
             kwargs['service_catalog'] = token_info.get('token', {})
         kwargs['expires_at'] = (token_info['token']['expires_at']
                                 if token_info else None)
+        kwargs['use_db_reader'] = _get_use_db_reader(headers, env)
 
         context = super(MistralContext, cls).from_environ(env, **kwargs)
         context.is_admin = True if 'admin' in context.roles else False
@@ -166,6 +174,18 @@ def set_ctx(new_ctx):
     utils.set_thread_local(_CTX_THREAD_LOCAL_NAME, new_ctx)
 
 
+def _get_use_db_reader(headers, env):
+    # Clients which need to read what they've just written can ask to read
+    # from the primary database.
+    if strutils.bool_from_string(headers.get('X-Read-From-Primary')):
+        return False
+
+    if env.get('REQUEST_METHOD') in ('GET', 'HEAD'):
+        return True
+
+    return None
+
+
 def _extract_mistral_auth_params(headers):
     service_catalog = None
 
@@ -23,6 +23,7 @@ import osprofiler.sqlalchemy
 import sqlalchemy as sa
 from sqlalchemy.sql import column
 
+from mistral import context
 from mistral.db.sqlalchemy import sqlite_lock
 from mistral import exceptions as exc
 from mistral_lib import utils
@@ -39,6 +40,7 @@ _DB_SESSION_THREAD_LOCAL_NAME = "__db_sql_alchemy_session__"
 _TX_SCOPED_CACHE_THREAD_LOCAL_NAME = "__tx_scoped_cache__"
 
 _facade = None
+_reader_facade = None
 
 # NOTE(amorin) Create a reentrant lock so only one thread can create a SQL
 # session at a time.
@@ -59,12 +61,17 @@ tx_lock = threading.RLock()
 
 def _get_facade():
     global _facade
+    global _reader_facade
 
     if not _facade:
         ctx = enginefacade.transaction_context()
         ctx.configure(sqlite_fk=True)
         _facade = ctx.writer
 
+        # The reader uses [database] slave_connection if it's configured,
+        # the same engine as the writer otherwise.
+        _reader_facade = ctx.reader
+
         # NOTE(amorin): Mistral requires the READ COMMITTED transaction
         # isolation level: the named lock synchronization pattern (see
         # named_lock() in db/v2/sqlalchemy/api.py, used e.g. to create
@@ -82,33 +89,69 @@ def _get_facade():
         # not allowed for production).
         engine = _facade.get_engine()
 
-        if engine.url.get_backend_name() != 'sqlite':
-            engine.update_execution_options(
-                isolation_level='READ COMMITTED'
-            )
+        _configure_engine(engine)
 
-            LOG.info(
-                "Set the database transaction isolation level to "
-                "READ COMMITTED"
-            )
+        reader_engine = _reader_facade.get_engine()
 
-        if cfg.CONF.profiler.enabled:
-            if cfg.CONF.profiler.trace_sqlalchemy:
-                osprofiler.sqlalchemy.add_tracing(
-                    sa,
-                    engine,
-                    'db'
-                )
+        if reader_engine is not engine:
+            _configure_engine(reader_engine)
+
+            LOG.info("Read only database sessions use the reader connection")
 
     return _facade
 
 
+def _configure_engine(engine):
+    if engine.url.get_backend_name() != 'sqlite':
+        engine.update_execution_options(
+            isolation_level='READ COMMITTED'
+        )
+
+        LOG.info(
+            "Set the database transaction isolation level to "
+            "READ COMMITTED"
+        )
+
+    if cfg.CONF.profiler.enabled:
+        if cfg.CONF.profiler.trace_sqlalchemy:
+            osprofiler.sqlalchemy.add_tracing(
+                sa,
+                engine,
+                'db'
+            )
+
+
+def _get_reader_facade():
+    _get_facade()
+
+    return _reader_facade
+
+
 def get_engine():
     return _get_facade().get_engine()
 
 
-def _get_session():
-    sessionmaker = _get_facade().get_sessionmaker()
+def use_reader(read_only=False):
+    """Tells whether a new session must use the reader connection.
+
+    :param read_only: True if the session is only used to read data, in
+        which case it may see data a bit older than the writer does.
+    :return: The value of 'use_db_reader' of the current context if it's
+        set, the value of 'read_only' otherwise.
+    """
+    if context.has_ctx():
+        use_db_reader = context.ctx().use_db_reader
+
+        if use_db_reader is not None:
+            return use_db_reader
+
+    return read_only
+
+
+def _get_session(read_only=False):
+    facade = _get_reader_facade() if use_reader(read_only) else _get_facade()
+
+    sessionmaker = facade.get_sessionmaker()
     return sessionmaker()
 
 
@@ -182,18 +225,21 @@ def session_aware(param_name="session"):
 # Transaction management.
 
 
-def start_tx():
+def start_tx(read_only=False):
     """Starts transaction.
 
     Opens new database session and starts new transaction assuming
     there wasn't any opened sessions within the same thread.
+
+    :param read_only: True if the transaction doesn't write anything, it
+        can then use the reader connection, see use_reader().
     """
     if _get_thread_local_session():
         raise exc.DataAccessException(
             "Database transaction has already been started."
         )
 
-    _set_thread_local_session(_get_session())
+    _set_thread_local_session(_get_session(read_only))
 
 
 def release_locks_if_sqlite(session):
@@ -0,0 +1,57 @@
+# Copyright 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Create archived executions table.
+
+Revision ID: 046
+Revises: 045
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from mistral.db.sqlalchemy import types as st
+
+# revision identifiers, used by Alembic.
+revision = '046'
+down_revision = '045'
+
+
+def upgrade():
+    op.create_table(
+        'archived_executions_v2',
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('scope', sa.String(length=80), nullable=True),
+        sa.Column('project_id', sa.String(length=80), nullable=True),
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('type', sa.String(length=10), nullable=True),
+        sa.Column('name', sa.String(length=255), nullable=True),
+        sa.Column('state', sa.String(length=20), nullable=True),
+        sa.Column('root_execution_id', sa.String(length=36), nullable=True),
+        sa.Column('parent_id', sa.String(length=36), nullable=True),
+        sa.Column('archived_at', sa.DateTime(), nullable=True),
+        sa.Column('data', st.JsonLongDictType(), nullable=True),
+
+        sa.PrimaryKeyConstraint('id'),
+
+        sa.Index('archived_executions_v2_project_id', 'project_id'),
+        sa.Index(
+            'archived_executions_v2_root_execution_id',
+            'root_execution_id'
+        ),
+        sa.Index('archived_executions_v2_parent_id', 'parent_id')
+    )
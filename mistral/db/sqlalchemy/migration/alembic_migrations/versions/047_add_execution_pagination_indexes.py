@@ -0,0 +1,54 @@
+# Copyright 2026 OpenStack Foundation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Add indexes for the pagination of executions.
+
+Revision ID: 047
+Revises: 046
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '047'
+down_revision = '046'
+
+
+def upgrade():
+    # Lists of executions are sorted by (created_at, id) by default.
+    for table_name in ('workflow_executions_v2',
+                       'task_executions_v2',
+                       'action_executions_v2'):
+        op.create_index(
+            '%s_created_at_id' % table_name,
+            table_name,
+            ['created_at', 'id'],
+            unique=False
+        )
+
+    op.create_index(
+        'task_executions_v2_workflow_execution_id_created_at_id',
+        'task_executions_v2',
+        ['workflow_execution_id', 'created_at', 'id'],
+        unique=False
+    )
+
+    op.create_index(
+        'action_executions_v2_task_execution_id_created_at_id',
+        'action_executions_v2',
+        ['task_execution_id', 'created_at', 'id'],
+        unique=False
+    )
@@ -29,6 +29,8 @@ from oslo_log import log as logging
 from oslo_utils import importutils
 import sys
 
+from mistral.blob_stores import base as blob_stores
+from mistral.db.v2 import api as db_api
 from mistral.services import action_manager
 from mistral.services import workflows
 
@@ -85,6 +87,30 @@ def do_populate_actions(config, cmd):
     action_manager.sync_db()
 
 
+def do_recompress(config, cmd):
+    LOG.info(
+        "Recompressing long JSON columns [compression=%s,"
+        " blob_store=%s]",
+        CONF.json_compression,
+        CONF.blob_store.enabled
+    )
+
+    updated = db_api.recompress_json_columns(
+        batch_size=CONF.command.batch_size
+    )
+
+    LOG.info("Recompressed %s rows", updated)
+
+
+def do_purge_blobs(config, cmd):
+    LOG.info("Purging unreferenced blobs")
+
+    blob_stores.purge(
+        db_api.get_json_blob_keys(),
+        CONF.command.min_age
+    )
+
+
 def do_revision(config, cmd):
     do_alembic_command(
         config, cmd,
@@ -112,6 +138,16 @@ def add_command_parsers(subparsers):
     parser = subparsers.add_parser('populate_actions')
     parser.set_defaults(func=do_populate_actions)
 
+    parser = subparsers.add_parser('recompress')
+    parser.add_argument('--batch-size', dest='batch_size', type=int,
+                        default=100)
+    parser.set_defaults(func=do_recompress)
+
+    parser = subparsers.add_parser('purge-blobs')
+    parser.add_argument('--min-age', dest='min_age', type=int,
+                        default=86400)
+    parser.set_defaults(func=do_purge_blobs)
+
     parser = subparsers.add_parser('stamp')
     parser.add_argument('--sql', action='store_true')
     parser.add_argument('revision', nargs='?')
@@ -20,7 +20,8 @@ import sqlalchemy as sa
 from sqlalchemy.dialects import mysql
 from sqlalchemy.ext import mutable
 
-from mistral import utils
+from mistral.blob_stores import base as blob_stores
+from mistral.utils import json_codec
 
 
 class JsonEncoded(sa.TypeDecorator):
@@ -30,10 +31,10 @@ class JsonEncoded(sa.TypeDecorator):
     cache_ok = True
 
     def process_bind_param(self, value, dialect):
-        return utils.to_json_str(value)
+        return json_codec.encode(value)
 
     def process_result_value(self, value, dialect):
-        return utils.from_json_str(value)
+        return json_codec.decode(value)
 
 
 class MutableList(mutable.Mutable, list):
@@ -98,8 +99,29 @@ def LongText():
 
 
 class JsonEncodedLongText(JsonEncoded):
+    """JSON string that is compressed or offloaded when it's long enough.
+
+    See the "json_compression" option and the "blob_store" group.
+    """
+
     impl = LongText()
 
+    def process_bind_param(self, value, dialect):
+        return blob_stores.offload(
+            json_codec.compress(
+                super(JsonEncodedLongText, self).process_bind_param(
+                    value,
+                    dialect
+                )
+            )
+        )
+
+    def process_result_value(self, value, dialect):
+        return super(JsonEncodedLongText, self).process_result_value(
+            json_codec.decompress(blob_stores.load(value)),
+            dialect
+        )
+
 
 def JsonLongDictType():
     return mutable.MutableDict.as_mutable(JsonEncodedLongText)
@@ -322,6 +322,10 @@ def create_action_execution(values):
     return IMPL.create_action_execution(values)
 
 
+def create_action_executions(values_list):
+    return IMPL.create_action_executions(values_list)
+
+
 def update_action_execution(id, values, insecure=False):
     return IMPL.update_action_execution(id, values, insecure)
 
@@ -334,6 +338,10 @@ def update_action_execution_heartbeat(id):
     return IMPL.update_action_execution_heartbeat(id)
 
 
+def update_action_executions_heartbeat(ids, chunk_size=500):
+    return IMPL.update_action_executions_heartbeat(ids, chunk_size=chunk_size)
+
+
 def delete_action_execution(id):
     return IMPL.delete_action_execution(id)
 
@@ -380,6 +388,26 @@ def delete_workflow_execution(id):
     return IMPL.delete_workflow_execution(id)
 
 
+def get_execution_tree(wf_ex_id, max_depth=-1, errors_only=False):
+    return IMPL.get_execution_tree(
+        wf_ex_id,
+        max_depth=max_depth,
+        errors_only=errors_only
+    )
+
+
+def get_execution_trees_nodes(wf_ex_ids):
+    return IMPL.get_execution_trees_nodes(wf_ex_ids)
+
+
+def delete_execution_nodes(nodes):
+    return IMPL.delete_execution_nodes(nodes)
+
+
+def delete_execution_trees(wf_ex_ids):
+    return IMPL.delete_execution_trees(wf_ex_ids)
+
+
 def delete_workflow_executions(**kwargs):
     IMPL.delete_workflow_executions(**kwargs)
 
@@ -454,6 +482,24 @@ def update_task_execution_state(**kwargs):
     return IMPL.update_task_execution_state(**kwargs)
 
 
+# Archived executions.
+
+def archive_execution_trees(wf_ex_ids):
+    return IMPL.archive_execution_trees(wf_ex_ids)
+
+
+def load_archived_execution(id, ex_type=None):
+    return IMPL.load_archived_execution(id, ex_type=ex_type)
+
+
+def get_archived_executions(**kwargs):
+    return IMPL.get_archived_executions(**kwargs)
+
+
+def delete_archived_executions(**kwargs):
+    return IMPL.delete_archived_executions(**kwargs)
+
+
 # Delayed calls.
 
 def get_delayed_calls_to_start(time, batch_size=None):
@@ -498,6 +544,10 @@ def get_scheduled_jobs_to_start(time, batch_size=None):
     return IMPL.get_scheduled_jobs_to_start(time, batch_size)
 
 
+def capture_scheduled_jobs(time, batch_size=None):
+    return IMPL.capture_scheduled_jobs(time, batch_size)
+
+
 def create_scheduled_job(values):
     return IMPL.create_scheduled_job(values)
 
@@ -574,6 +624,22 @@ def get_superfluous_executions(max_finished_executions, limit=None,
     )
 
 
+def get_completed_root_execution_keys(updated_before=None, max_key=None,
+                                      marker=None, limit=None,
+                                      ignored_states=None):
+    return IMPL.get_completed_root_execution_keys(
+        updated_before=updated_before,
+        max_key=max_key,
+        marker=marker,
+        limit=limit,
+        ignored_states=ignored_states
+    )
+
+
+def get_superfluous_executions_max_key(max_finished_executions):
+    return IMPL.get_superfluous_executions_max_key(max_finished_executions)
+
+
 def create_cron_trigger(values):
     return IMPL.create_cron_trigger(values)
 
@@ -708,6 +774,16 @@ def delete_event_triggers(**kwargs):
     return IMPL.delete_event_triggers(**kwargs)
 
 
+# JSON columns.
+
+def recompress_json_columns(batch_size=100):
+    return IMPL.recompress_json_columns(batch_size=batch_size)
+
+
+def get_json_blob_keys():
+    return IMPL.get_json_blob_keys()
+
+
 # Locks.
 
 def create_named_lock(name):
@@ -728,6 +804,10 @@ def named_lock(name):
         yield
 
 
+def get_named_lock_stats():
+    return IMPL.get_named_lock_stats()
+
+
 def get_maintenance_status():
     return IMPL.get_maintenance_status()
 
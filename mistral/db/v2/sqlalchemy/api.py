@@ -15,11 +15,16 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
 import contextlib
 import datetime
+import hashlib
+import itertools
 import re
 import sys
 import threading
+import time
+import types
 
 from oslo_config import cfg
 from oslo_db import exception as db_exc
@@ -28,17 +33,22 @@ from oslo_db.sqlalchemy import utils as db_utils
 from oslo_log import log as logging
 from oslo_utils import uuidutils  # noqa
 import sqlalchemy as sa
+from sqlalchemy.orm import attributes as orm_attrs
+from sqlalchemy.orm import util as orm_util
 
+from mistral.blob_stores import base as blob_stores
 from mistral import context
 from mistral.db.sqlalchemy import base as b
 from mistral.db.sqlalchemy import model_base as mb
 from mistral.db.sqlalchemy import sqlite_lock
+from mistral.db.sqlalchemy import types as st
 from mistral.db import utils as m_dbutils
 from mistral.db.v2.sqlalchemy import filters as db_filters
 from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral.services import maintenance as m
 from mistral.services import security
+from mistral.utils import json_codec
 from mistral.workflow import states
 from mistral_lib import utils
 
@@ -48,6 +58,15 @@ LOG = logging.getLogger(__name__)
 _SCHEMA_LOCK = threading.RLock()
 _initialized = False
 
+_MYSQL_ADVISORY_LOCKS_KEY = 'mistral_advisory_locks'
+
+_UUID_PATTERN = re.compile(
+    '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+)
+
+_NAMED_LOCK_STATS = {}
+_NAMED_LOCK_STATS_LOCK = threading.Lock()
+
 
 def get_backend():
     """Consumed by openstack common code.
@@ -93,8 +112,8 @@ def drop_db():
 
 # Transaction management.
 
-def start_tx():
-    b.start_tx()
+def start_tx(read_only=False):
+    b.start_tx(read_only)
 
 
 def commit_tx():
@@ -112,7 +131,7 @@ def end_tx():
 @contextlib.contextmanager
 def transaction(read_only=False):
     with b.tx_lock:
-        start_tx()
+        start_tx(read_only)
 
         try:
             yield
@@ -232,8 +251,63 @@ def _secure_query(model, *columns):
     return query
 
 
+def _get_keyset_criterion(model, sort_keys, sort_dirs, marker):
+    """Returns the criterion selecting the rows following a marker.
+
+    For the sort keys (a, b, c) it's a >= x AND (a > x OR a = x AND b > y
+    OR a = x AND b = y AND c > z) where (x, y, z) are the values of the
+    marker. Unlike the criterion built by oslo.db, the first term lets
+    the database seek directly in an index starting with the sort keys.
+
+    :param marker: Dict of sort key values of the last row of the
+        previous page.
+    """
+    descriptors = sa.inspect(model).all_orm_descriptors
+
+    for key in sort_keys:
+        if key not in descriptors:
+            raise db_exc.InvalidSortKey(key)
+
+    def _after(key, sort_dir, inclusive=False):
+        attr = getattr(model, key)
+        value = marker[key]
+
+        if sort_dir.startswith('desc'):
+            return attr <= value if inclusive else attr < value
+
+        return attr >= value if inclusive else attr > value
+
+    criteria = []
+
+    for i, (key, sort_dir) in enumerate(zip(sort_keys, sort_dirs)):
+        prev_keys = sort_keys[:i]
+
+        criteria.append(
+            sa.and_(
+                *[getattr(model, k) == marker[k] for k in prev_keys],
+                _after(key, sort_dir)
+            )
+        )
+
+    criterion = sa.or_(*criteria)
+
+    if len(sort_keys) > 1:
+        criterion = sa.and_(
+            _after(sort_keys[0], sort_dirs[0], inclusive=True),
+            criterion
+        )
+
+    return criterion
+
+
 def _paginate_query(model, limit=None, marker=None, sort_keys=None,
                     sort_dirs=None, query=None):
+    """Sorts and paginates a query.
+
+    :param marker: Optional. The last object of the previous page or a
+        dict of the sort key values of it. A dict lets the query seek the
+        next page without loading the object.
+    """
     if not query:
         query = _secure_query(model)
 
@@ -246,6 +320,21 @@ def _paginate_query(model, limit=None, marker=None, sort_keys=None,
         sort_keys.append('id')
         sort_dirs.append('asc') if sort_dirs else None
 
+    if isinstance(marker, dict):
+        sort_dirs = sort_dirs or ['asc'] * len(sort_keys)
+
+        values = [marker[k] for k in sort_keys]
+
+        # Comparisons with NULL values and booleans are left to oslo.db.
+        if any(v is None or isinstance(v, bool) for v in values):
+            marker = types.SimpleNamespace(**marker)
+        else:
+            query = query.filter(
+                _get_keyset_criterion(model, sort_keys, sort_dirs, marker)
+            )
+
+            marker = None
+
     query = db_utils.paginate_query(
         query,
         model,
@@ -268,7 +357,8 @@ def _delete_all(model, **kwargs):
 
 
 def _get_collection(model, insecure=False, limit=None, marker=None,
-                    sort_keys=None, sort_dirs=None, fields=None, **filters):
+                    sort_keys=None, sort_dirs=None, fields=None,
+                    yield_per=None, **filters):
     # Allow admin to retrieve all objects by overwriting insecure
     if context.has_ctx():
         insecure = context.ctx().is_admin or insecure
@@ -291,6 +381,11 @@ def _get_collection(model, insecure=False, limit=None, marker=None,
         query
     )
 
+    if yield_per:
+        # Rows are fetched from a server side cursor while the result
+        # is iterated so it must be iterated within the transaction.
+        return query.yield_per(yield_per)
+
     return query.all()
 
 
@@ -1003,6 +1098,54 @@ def create_action_execution(values, session=None):
     return a_ex
 
 
+@b.session_aware()
+def create_action_executions(values_list, session=None):
+    """Creates action executions with one multi-row INSERT statement.
+
+    Unlike create_action_execution() it doesn't build model objects so
+    the new action executions must have their ids in the given values.
+    """
+    if not values_list:
+        return
+
+    project_id = security.get_project_id()
+
+    mappings = []
+
+    for values in values_list:
+        # Model attribute events are not triggered by bulk operations so
+        # do what they would do explicitly.
+        models.validate_long_type_length(
+            models.ActionExecution,
+            'input',
+            values.get('input')
+        )
+
+        mapping = values.copy()
+        mapping['project_id'] = project_id
+
+        mappings.append(mapping)
+
+    try:
+        session.bulk_insert_mappings(models.ActionExecution, mappings)
+    except db_exc.DBDuplicateEntry as e:
+        raise exc.DBDuplicateEntryError(
+            "Duplicate entry for ActionExecution ID: {}".format(e.value)
+        )
+
+    # Task executions of the session may have their action executions
+    # already loaded, make them reload the collection on next access.
+    task_ex_ids = set(v.get('task_execution_id') for v in values_list)
+
+    for task_ex_id in task_ex_ids - {None}:
+        task_ex = session.identity_map.get(
+            orm_util.identity_key(models.TaskExecution, task_ex_id)
+        )
+
+        if task_ex is not None:
+            session.expire(task_ex, ['action_executions'])
+
+
 @b.session_aware()
 def update_action_execution(id, values, insecure=False, session=None):
     # Allow admin to retrieve all objects by overwriting insecure
@@ -1035,6 +1178,36 @@ def update_action_execution_heartbeat(id, session=None):
         update({'last_heartbeat': now})
 
 
+@b.session_aware()
+def update_action_executions_heartbeat(ids, chunk_size=500, session=None):
+    """Updates heartbeats of the given action executions.
+
+    Issues one UPDATE statement per chunk of ids instead of one per id.
+
+    :param ids: Action execution ids. Empty values are ignored.
+    :param chunk_size: Max number of ids in one statement.
+    :return: Number of updated action executions.
+    """
+    ids = sorted(set(id for id in ids if id))
+
+    now = utils.utc_now_sec()
+
+    updated = 0
+
+    for i in range(0, len(ids), chunk_size):
+        stmt = sa.update(models.ActionExecution).where(
+            models.ActionExecution.id.in_(ids[i:i + chunk_size])
+        ).values(
+            last_heartbeat=now
+        ).execution_options(
+            synchronize_session=False
+        )
+
+        updated += session.execute(stmt).rowcount
+
+    return updated
+
+
 @b.session_aware()
 def delete_action_execution(id, session=None):
     count = _secure_query(models.ActionExecution).filter(
@@ -1164,34 +1337,230 @@ def is_mariadb_max_depth_error(e):
     return re.match(pattern, str(e))
 
 
-def delete_workflow_execution_recurse(wf_ex_id):
-    sub_wf_ex_ids = _get_all_direct_subworkflows(wf_ex_id)
+@b.session_aware()
+def delete_workflow_execution_recurse(wf_ex_id, session=None):
+    wf_ex_ids_by_depth = collections.defaultdict(list)
+
+    for node in get_execution_tree(wf_ex_id):
+        if node.type == 'workflow':
+            wf_ex_ids_by_depth[node.depth].append(node.id)
+
+    if not wf_ex_ids_by_depth:
+        raise exc.DBEntityNotFoundError(
+            "WorkflowExecution not found [id=%s]" % wf_ex_id
+        )
 
-    for sub_wf_ex_id in sub_wf_ex_ids:
-        delete_workflow_execution(sub_wf_ex_id)
+    # Delete the deepest workflow executions first so that none of the
+    # statements cascades through more than one level of nesting.
+    for depth in sorted(wf_ex_ids_by_depth, reverse=True):
+        b.model_query(models.WorkflowExecution).filter(
+            models.WorkflowExecution.id.in_(wf_ex_ids_by_depth[depth])
+        ).delete(synchronize_session=False)
+
+
+@b.session_aware()
+def get_execution_tree(wf_ex_id, max_depth=-1, errors_only=False,
+                       session=None):
+    """Returns all the executions of a workflow execution subtree.
+
+    The whole subtree is fetched with one recursive query.
+
+    :param wf_ex_id: The id of the root workflow execution.
+    :param max_depth: The nesting level of the deepest workflow executions
+        to return, the root workflow execution has level 0. Tasks and
+        actions of deeper workflow executions are not returned either.
+        A negative value means no limit.
+    :param errors_only: If True, only task executions in the ERROR state
+        are returned, along with their action and workflow executions.
+    :return: A list of rows with the fields "id", "type" ("workflow",
+        "task" or "action"), "parent_id" (the id of the parent task
+        execution for workflow and action executions, the id of the
+        workflow execution for task executions), "depth" (the nesting
+        level of the workflow execution the row belongs to) and "state".
+        Empty if the root workflow execution is not found.
+    """
+    # Allow admin to retrieve all objects by overwriting insecure
+    insecure = context.has_ctx() and context.ctx().is_admin
+
+    return session.execute(
+        _get_execution_trees_query(
+            [wf_ex_id],
+            max_depth,
+            errors_only,
+            insecure
+        )
+    ).fetchall()
 
-    delete_workflow_execution(wf_ex_id)
 
+def _get_execution_trees_query(wf_ex_ids, max_depth=-1, errors_only=False,
+                               insecure=False):
+    wf_table = models.WorkflowExecution.__table__
+    task_table = models.TaskExecution.__table__
+    action_table = models.ActionExecution.__table__
 
-def _get_all_direct_subworkflows(wf_ex_id):
     model = models.WorkflowExecution
-    # Allow admin to retrieve all objects by overwriting insecure
-    insecure = False
-    if context.has_ctx():
-        insecure = context.ctx().is_admin or insecure
 
-    if insecure:
-        query = b.model_query(model, [model.id])
-    else:
-        query = _secure_query(model, model.id)
-    query = query.join(
-        models.TaskExecution,
-        models.WorkflowExecution.task_execution_id == models.TaskExecution.id
-    ).filter(
-        models.TaskExecution.workflow_execution_id == wf_ex_id
+    # Only the access to the root is checked, nested workflow executions
+    # always belong to the same project.
+    columns = (
+        model.id,
+        model.task_execution_id.label('parent_id'),
+        sa.literal_column('0', sa.Integer).label('depth'),
+        model.state
+    )
+
+    anchor = (
+        b.model_query(model, columns) if insecure
+        else _secure_query(model, *columns)
+    ).filter(model.id.in_(wf_ex_ids)).statement
+
+    tree = anchor.cte('execution_tree', recursive=True)
+
+    recursive_part = sa.select(
+        wf_table.c.id,
+        wf_table.c.task_execution_id,
+        tree.c.depth + 1,
+        wf_table.c.state
+    ).select_from(
+        wf_table.join(
+            task_table,
+            wf_table.c.task_execution_id == task_table.c.id
+        ).join(
+            tree,
+            task_table.c.workflow_execution_id == tree.c.id
+        )
+    )
+
+    if max_depth >= 0:
+        recursive_part = recursive_part.where(tree.c.depth < max_depth)
+
+    if errors_only:
+        recursive_part = recursive_part.where(
+            task_table.c.state == states.ERROR
+        )
+
+    tree = tree.union_all(recursive_part)
+
+    wf_query = sa.select(
+        tree.c.id,
+        sa.literal_column("'workflow'", sa.String).label('type'),
+        tree.c.parent_id,
+        tree.c.depth,
+        tree.c.state
+    )
+
+    task_query = sa.select(
+        task_table.c.id,
+        sa.literal_column("'task'", sa.String),
+        task_table.c.workflow_execution_id,
+        tree.c.depth,
+        task_table.c.state
+    ).select_from(
+        task_table.join(
+            tree,
+            task_table.c.workflow_execution_id == tree.c.id
+        )
+    )
+
+    action_query = sa.select(
+        action_table.c.id,
+        sa.literal_column("'action'", sa.String),
+        action_table.c.task_execution_id,
+        tree.c.depth,
+        action_table.c.state
+    ).select_from(
+        action_table.join(
+            task_table,
+            action_table.c.task_execution_id == task_table.c.id
+        ).join(
+            tree,
+            task_table.c.workflow_execution_id == tree.c.id
+        )
     )
 
-    return [i[0] for i in query.all()]
+    if errors_only:
+        task_query = task_query.where(task_table.c.state == states.ERROR)
+        action_query = action_query.where(
+            task_table.c.state == states.ERROR
+        )
+
+    return sa.union_all(wf_query, task_query, action_query)
+
+
+_EXECUTION_MODELS = {
+    'workflow': models.WorkflowExecution,
+    'task': models.TaskExecution,
+    'action': models.ActionExecution
+}
+
+
+def _get_deletion_order_key(node):
+    # Actions first, then tasks and workflow executions from the deepest
+    # level up, so that deleting a row never cascades to other rows.
+    return (
+        node.type != 'action',
+        -node.depth,
+        node.type == 'workflow'
+    )
+
+
+@b.session_aware()
+def get_execution_trees_nodes(wf_ex_ids, session=None):
+    """Gets the executions of execution trees in deletion order.
+
+    Executions are returned regardless of their project, from the leaves
+    to the roots, so that deleting any leading part of them with
+    delete_execution_nodes() leaves consistent trees behind.
+
+    :param wf_ex_ids: The ids of the root workflow executions.
+    :return: A list of nodes with the "id", "type", "parent_id", "depth"
+        and "state" attributes.
+    """
+    nodes = session.execute(
+        _get_execution_trees_query(wf_ex_ids, insecure=True)
+    ).fetchall()
+
+    return sorted(nodes, key=_get_deletion_order_key)
+
+
+@b.session_aware()
+def delete_execution_nodes(nodes, session=None):
+    """Deletes executions returned by get_execution_trees_nodes().
+
+    Executions are deleted with one statement per level and execution
+    type, so that none of the statements cascades if the nodes are in
+    deletion order.
+
+    :param nodes: The nodes of the executions to delete.
+    :return: A dict with the numbers of deleted rows by execution type
+        ("workflow", "task" and "action").
+    """
+    deleted = {'workflow': 0, 'task': 0, 'action': 0}
+
+    for (ex_type, _), group in itertools.groupby(
+            nodes,
+            key=lambda n: (n.type, n.depth)):
+        model = _EXECUTION_MODELS[ex_type]
+
+        deleted[ex_type] += b.model_query(model).filter(
+            model.id.in_([n.id for n in group])
+        ).delete(synchronize_session=False)
+
+    return deleted
+
+
+@b.session_aware()
+def delete_execution_trees(wf_ex_ids, session=None):
+    """Deletes workflow executions along with all their nested executions.
+
+    :param wf_ex_ids: The ids of the root workflow executions.
+    :return: A dict with the numbers of deleted rows by execution type
+        ("workflow", "task" and "action").
+    """
+    return delete_execution_nodes(
+        get_execution_trees_nodes(wf_ex_ids, session=session),
+        session=session
+    )
 
 
 @b.session_aware()
@@ -1379,6 +1748,134 @@ def update_task_execution_state(id, cur_state, state):
     return update_on_match(id, specimen, values={'state': state}, attempts=1)
 
 
+# Archived executions.
+
+# The max number of ids in one IN list when executions are archived.
+ARCHIVE_QUERY_BATCH_SIZE = 1000
+
+_ARCHIVE_TYPE_RANKS = {'workflow': 0, 'task': 1, 'action': 2}
+
+
+def _get_archive_order_key(node):
+    # Parents come before their children in this order.
+    return node.depth, _ARCHIVE_TYPE_RANKS[node.type]
+
+
+def _get_archived_execution_values(ex_type, row, node, root_id,
+                                   archived_at):
+    data = {
+        k: v.isoformat() if isinstance(v, datetime.datetime) else v
+        for k, v in row.items()
+    }
+
+    return {
+        'id': row['id'],
+        'type': ex_type,
+        'name': row['name'],
+        'state': row['state'],
+        'root_execution_id': root_id,
+        'parent_id': node.parent_id,
+        'scope': row['scope'],
+        'project_id': row['project_id'],
+        'created_at': row['created_at'],
+        'updated_at': row['updated_at'],
+        'archived_at': archived_at,
+        'data': data
+    }
+
+
+@b.session_aware()
+def archive_execution_trees(wf_ex_ids, session=None):
+    """Moves workflow executions with their nested executions to the archive.
+
+    Executions are archived regardless of their project. Rows are copied
+    with a few INSERT statements and then deleted from the execution
+    tables, see delete_execution_nodes().
+
+    :param wf_ex_ids: The ids of the root workflow executions.
+    :return: The number of archived executions.
+    """
+    nodes = session.execute(
+        _get_execution_trees_query(wf_ex_ids, insecure=True)
+    ).fetchall()
+
+    nodes = sorted(nodes, key=_get_archive_order_key)
+
+    root_ids = {}
+
+    for node in nodes:
+        root_ids[node.id] = root_ids.get(node.parent_id, node.id)
+
+    archived_at = utils.utc_now_sec()
+    archive_table = models.ArchivedExecution.__table__
+
+    count = 0
+
+    for ex_type, model in _EXECUTION_MODELS.items():
+        table = model.__table__
+
+        type_nodes = {n.id: n for n in nodes if n.type == ex_type}
+        ids = list(type_nodes)
+
+        for i in range(0, len(ids), ARCHIVE_QUERY_BATCH_SIZE):
+            # Deferred columns are only deferred by the ORM so selecting
+            # the table loads all of them at once.
+            rows = session.execute(
+                sa.select(table).where(
+                    table.c.id.in_(ids[i:i + ARCHIVE_QUERY_BATCH_SIZE])
+                )
+            ).mappings()
+
+            values = [
+                _get_archived_execution_values(
+                    ex_type,
+                    row,
+                    type_nodes[row['id']],
+                    root_ids[row['id']],
+                    archived_at
+                )
+                for row in rows
+            ]
+
+            if values:
+                session.execute(sa.insert(archive_table), values)
+
+            count += len(values)
+
+    delete_execution_nodes(
+        sorted(nodes, key=_get_deletion_order_key),
+        session=session
+    )
+
+    return count
+
+
+@b.session_aware()
+def load_archived_execution(id, ex_type=None, session=None):
+    """Returns an archived execution or None if it doesn't exist.
+
+    :param id: Execution id.
+    :param ex_type: If set, only an execution of this type ("workflow",
+        "task" or "action") is returned.
+    """
+    arch_ex = _get_db_object_by_id(models.ArchivedExecution, id)
+
+    if arch_ex and ex_type and arch_ex.type != ex_type:
+        return None
+
+    return arch_ex
+
+
+@b.session_aware()
+def get_archived_executions(session=None, **kwargs):
+    return _get_collection(models.ArchivedExecution, **kwargs)
+
+
+@b.session_aware()
+def delete_archived_executions(session=None, **kwargs):
+    return _delete_all(models.ArchivedExecution, **kwargs)
+
+
 # Delayed calls.
 
 @b.session_aware()
@@ -1493,12 +1990,24 @@ def create_scheduled_job(values, session=None):
     return job
 
 
-@b.session_aware()
-def get_scheduled_jobs_to_start(time, batch_size=None, session=None):
+def _get_capturable_filter(now):
+    # Filter by captured time accounting for a configured captured job timeout.
+    captured_at_col = models.ScheduledJob.captured_at
+
+    min_captured_at = (
+        now - datetime.timedelta(seconds=CONF.scheduler.captured_job_timeout)
+    )
+
+    return sa.or_(
+        captured_at_col == sa.null(),
+        captured_at_col <= min_captured_at
+    )
+
+
+def _get_scheduled_jobs_to_start_query(time, batch_size):
     query = b.model_query(models.ScheduledJob)
 
     execute_at_col = models.ScheduledJob.execute_at
-    captured_at_col = models.ScheduledJob.captured_at
 
     # Filter by execution time accounting for a configured job pickup interval.
     # TODO(rakhmerov): Configuration options should not be accessed here.
@@ -1507,23 +2016,77 @@ def get_scheduled_jobs_to_start(time, batch_size=None, session=None):
         time - datetime.timedelta(seconds=CONF.scheduler.pickup_job_after)
     )
 
-    # Filter by captured time accounting for a configured captured job timeout.
-    min_captured_at = (
-        utils.utc_now_sec() -
-        datetime.timedelta(seconds=CONF.scheduler.captured_job_timeout)
-    )
+    query = query.filter(_get_capturable_filter(utils.utc_now_sec()))
 
-    query = query.filter(
-        sa.or_(
-            captured_at_col == sa.null(),
-            captured_at_col <= min_captured_at
+    query = query.order_by(execute_at_col)
+    query = query.limit(batch_size)
+
+    return query
+
+
+@b.session_aware()
+def get_scheduled_jobs_to_start(time, batch_size=None, session=None):
+    return _get_scheduled_jobs_to_start_query(time, batch_size).all()
+
+
+@b.session_aware()
+def capture_scheduled_jobs(time, batch_size=None, session=None):
+    """Selects and captures a batch of scheduled jobs to start.
+
+    Unlike capturing the jobs returned by get_scheduled_jobs_to_start()
+    one by one, all jobs are captured with a single conditional UPDATE.
+    On MySQL and PostgreSQL the selected rows are locked with
+    "SELECT ... FOR UPDATE SKIP LOCKED" so that concurrent schedulers
+    pick up different batches instead of waiting for each other. If the
+    database supports "UPDATE ... RETURNING" only the jobs actually
+    updated by the statement are returned.
+
+    :param time: Current time used to select jobs to start.
+    :param batch_size: Max number of jobs to capture.
+    :return: List of captured jobs.
+    """
+    query = _get_scheduled_jobs_to_start_query(time, batch_size)
+
+    if b.get_dialect_name() in ('mysql', 'postgresql'):
+        query = query.with_for_update(skip_locked=True)
+
+    jobs = query.all()
+
+    if not jobs:
+        return []
+
+    now = utils.utc_now_sec()
+
+    stmt = sa.update(models.ScheduledJob).where(
+        sa.and_(
+            models.ScheduledJob.id.in_([j.id for j in jobs]),
+            _get_capturable_filter(now)
         )
+    ).values(
+        captured_at=now
+    ).execution_options(
+        synchronize_session=False
     )
 
-    query = query.order_by(execute_at_col)
-    query = query.limit(batch_size)
+    if getattr(session.bind.dialect, 'update_returning', False):
+        stmt = stmt.returning(models.ScheduledJob.id)
 
-    return query.all()
+        captured_ids = set(row[0] for row in session.execute(stmt))
+    else:
+        # The rows are either locked by the SELECT above or the database
+        # doesn't allow concurrent writers so all of them are updated.
+        session.execute(stmt)
+
+        captured_ids = set(j.id for j in jobs)
+
+    captured_jobs = [j for j in jobs if j.id in captured_ids]
+
+    for job in captured_jobs:
+        # Update the loaded objects without marking them as dirty,
+        # the new value has already been written.
+        orm_attrs.set_committed_value(job, 'captured_at', now)
+
+    return captured_jobs
 
 
 @b.session_aware()
@@ -1644,11 +2207,91 @@ def get_superfluous_executions(max_finished_executions, limit=None, columns=(),
     return query.all()
 
 
-def _get_completed_root_executions_query(columns):
+@b.session_aware()
+def get_completed_root_execution_keys(updated_before=None, max_key=None,
+                                      marker=None, limit=None,
+                                      ignored_states=None, session=None):
+    """Returns keys of completed root workflow executions.
+
+    Keys are (updated_at, id) tuples, they are sorted in ascending order
+    so that executions can be paginated without scanning the skipped ones
+    again.
+
+    :param updated_before: If set, only executions updated before this
+        time are returned.
+    :param max_key: If set, only executions with keys lower than or equal
+        to this key are returned.
+    :param marker: If set, only executions with keys greater than this
+        key are returned.
+    :param limit: The max number of keys to return.
+    :param ignored_states: States of the executions to skip, the states
+        ignored by the expiration policy by default.
+    :return: A list of rows with the fields "updated_at" and "id".
+    """
+    model = models.WorkflowExecution
+
+    query = _get_completed_root_executions_query(
+        (model.updated_at, model.id),
+        ignored_states=ignored_states
+    )
+
+    if updated_before:
+        query = query.filter(model.updated_at < updated_before)
+
+    if max_key:
+        query = query.filter(
+            sa.or_(
+                model.updated_at < max_key[0],
+                sa.and_(model.updated_at == max_key[0], model.id <= max_key[1])
+            )
+        )
+
+    if marker:
+        query = query.filter(
+            sa.or_(
+                model.updated_at > marker[0],
+                sa.and_(model.updated_at == marker[0], model.id > marker[1])
+            )
+        )
+
+    query = query.order_by(model.updated_at, model.id)
+
+    if limit:
+        query = query.limit(limit)
+
+    return query.all()
+
+
+@b.session_aware()
+def get_superfluous_executions_max_key(max_finished_executions,
+                                       session=None):
+    """Returns the key of the latest superfluous root workflow execution.
+
+    Completed root workflow executions with keys lower than or equal to
+    this one are superfluous, see get_superfluous_executions().
+
+    :return: (updated_at, id) row or None if there are no superfluous
+        executions.
+    """
+    if not max_finished_executions:
+        return None
+
+    model = models.WorkflowExecution
+
+    query = _get_completed_root_executions_query((model.updated_at, model.id))
+
+    query = query.order_by(model.updated_at.desc(), model.id.desc())
+
+    return query.offset(max_finished_executions).limit(1).first()
+
+
+def _get_completed_root_executions_query(columns, ignored_states=None):
     query = b.model_query(models.WorkflowExecution, columns=columns)
 
-    # This is an empty list by default.
-    ignored_states = CONF.execution_expiration_policy.ignored_states
+    if ignored_states is None:
+        # This is an empty list by default.
+        ignored_states = CONF.execution_expiration_policy.ignored_states
+
     desired_states = states.TERMINAL_STATES - set(ignored_states)
 
     # Only workflow executions that are not a child of
@@ -2143,6 +2786,132 @@ def delete_event_triggers(session=None, **kwargs):
     return _delete_all(models.EventTrigger, **kwargs)
 
 
+# JSON columns.
+
+def _get_long_json_columns(table):
+    return [
+        c for c in table.columns
+        if isinstance(c.type, st.JsonEncodedLongText)
+    ]
+
+
+def _get_long_json_tables():
+    # All the tables with long JSON columns, not only the execution ones,
+    # so that no blob still referenced is ever considered unused.
+    return [
+        t for t in models.WorkflowExecution.metadata.sorted_tables
+        if _get_long_json_columns(t)
+    ]
+
+
+def recompress_json_columns(batch_size=100):
+    """Converts long JSON columns to the configured encoding.
+
+    Depending on the "json_compression" option and the "blob_store" group
+    long enough values are compressed or moved to the blob store, other
+    values are decompressed or loaded back into the database. Rows are
+    processed in batches, each in a separate transaction.
+
+    :param batch_size: The number of rows processed in one transaction.
+    :return: The number of updated rows.
+    """
+    updated = 0
+
+    for table in _get_long_json_tables():
+        columns = _get_long_json_columns(table)
+
+        marker = None
+
+        while True:
+            with transaction():
+                marker, count = _recompress_json_batch(
+                    table,
+                    columns,
+                    marker,
+                    batch_size
+                )
+
+            updated += count
+
+            if marker is None:
+                break
+
+        LOG.info("Recompressed JSON columns of %s", table.name)
+
+    return updated
+
+
+@b.session_aware()
+def _recompress_json_batch(table, columns, marker, batch_size, session=None):
+    # Read and write the raw strings, so that values don't need to be
+    # parsed and keep their exact JSON representation.
+    query = sa.select(
+        table.c.id,
+        *[sa.type_coerce(c, sa.Text).label(c.name) for c in columns]
+    ).order_by(table.c.id).limit(batch_size)
+
+    if marker is not None:
+        query = query.where(table.c.id > marker)
+
+    rows = session.execute(query).fetchall()
+
+    updated = 0
+
+    for row in rows:
+        values = {}
+
+        for c in columns:
+            raw = row._mapping[c.name]
+
+            new = blob_stores.offload(
+                json_codec.compress(
+                    json_codec.decompress(blob_stores.load(raw))
+                )
+            )
+
+            if new != raw:
+                values[c.name] = sa.type_coerce(new, sa.Text)
+
+        if values:
+            # Recompressing doesn't really modify the row.
+            values['updated_at'] = table.c.updated_at
+
+            session.execute(
+                table.update().where(table.c.id == row.id).values(values)
+            )
+
+            updated += 1
+
+    marker = rows[-1].id if len(rows) == batch_size else None
+
+    return marker, updated
+
+
+@b.session_aware()
+def get_json_blob_keys(session=None):
+    """Returns the keys of all blobs referenced by JSON columns."""
+    keys = set()
+
+    for table in _get_long_json_tables():
+        columns = [
+            sa.type_coerce(c, sa.Text)
+            for c in _get_long_json_columns(table)
+        ]
+
+        query = sa.select(*columns).where(
+            sa.or_(
+                *[c.like(blob_stores.REFERENCE_PREFIX + '%') for c in columns]
+            )
+        )
+
+        for row in session.execute(query):
+            for value in row:
+                if blob_stores.is_reference(value):
+                    keys.add(blob_stores.get_key(value))
+
+    return keys
+
+
 # Locks.
 
 @b.session_aware()
@@ -2196,6 +2965,142 @@ def delete_named_lock(lock_id, name, session=None):
         sqlite_lock.release_lock(name, session)
 
 
+def _get_advisory_lock_dialect():
+    """Returns the name of the dialect to use advisory locks with.
+
+    :return: "postgresql", "mysql" or None if named locks should be
+        implemented with the "named_locks" table.
+    """
+    if CONF.engine.named_lock_backend != 'advisory':
+        return None
+
+    dialect = b.get_dialect_name()
+
+    if dialect == 'postgresql':
+        return dialect
+
+    if dialect in ('mysql', 'mariadb'):
+        return 'mysql'
+
+    return None
+
+
+def _get_pg_advisory_lock_key(name):
+    # PostgreSQL advisory locks are identified by a 64-bit integer.
+    digest = hashlib.blake2b(name.encode('utf-8'), digest_size=8).digest()
+
+    return int.from_bytes(digest, 'big', signed=True)
+
+
+def _get_mysql_advisory_lock_name(name):
+    # MySQL limits lock names to 64 characters.
+    return 'mistral-%s' % hashlib.sha1(name.encode('utf-8')).hexdigest()
+
+
+def _release_mysql_advisory_locks(dbapi_conn, conn_record):
+    # Unlike PostgreSQL transaction level advisory locks, MySQL locks are
+    # bound to a connection and survive the end of a transaction. They are
+    # released when the connection is returned to the pool, i.e. after
+    # the transaction has been committed or rolled back, so that the next
+    # lock owner sees all changes made under the lock.
+    lock_names = conn_record.info.pop(_MYSQL_ADVISORY_LOCKS_KEY, None)
+
+    if not lock_names or dbapi_conn is None:
+        return
+
+    cursor = dbapi_conn.cursor()
+
+    try:
+        for lock_name in lock_names:
+            cursor.execute('SELECT RELEASE_LOCK(%s)', (lock_name,))
+    except Exception:
+        # The locks go away along with the connection anyway.
+        LOG.exception("Failed to release MySQL advisory locks.")
+
+        conn_record.invalidate()
+    finally:
+        cursor.close()
+
+
+@b.session_aware()
+def _acquire_advisory_lock(name, dialect, session=None):
+    if dialect == 'postgresql':
+        session.execute(
+            sa.text('SELECT pg_advisory_xact_lock(:key)'),
+            {'key': _get_pg_advisory_lock_key(name)}
+        )
+
+        return
+
+    engine = session.get_bind()
+
+    # Registering the listener twice is harmless, the locks of a
+    # connection are released only once.
+    if not sa.event.contains(engine, 'checkin', _release_mysql_advisory_locks):
+        sa.event.listen(engine, 'checkin', _release_mysql_advisory_locks)
+
+    lock_name = _get_mysql_advisory_lock_name(name)
+
+    conn = session.connection()
+
+    acquired = conn.execute(
+        sa.text('SELECT GET_LOCK(:name, :timeout)'),
+        {'name': lock_name, 'timeout': CONF.engine.advisory_lock_timeout}
+    ).scalar()
+
+    if acquired != 1:
+        # Treat it as a lock wait timeout so that the transaction is retried.
+        raise db_exc.DBDeadlock(
+            "Failed to acquire the named lock: %s" % name
+        )
+
+    conn.info.setdefault(_MYSQL_ADVISORY_LOCKS_KEY, []).append(lock_name)
+
+
+def _get_named_lock_kind(name):
+    # Lock names usually contain object ids, the stats are aggregated
+    # by the name part preceding the first id.
+    parts = _UUID_PATTERN.split(name, 1)
+
+    return parts[0] + '<id>' if len(parts) > 1 else name
+
+
+def _update_named_lock_stats(name, wait_time):
+    kind = _get_named_lock_kind(name)
+
+    with _NAMED_LOCK_STATS_LOCK:
+        stats = _NAMED_LOCK_STATS.setdefault(
+            kind,
+            {'acquired': 0, 'total_wait': 0.0, 'max_wait': 0.0}
+        )
+
+        stats['acquired'] += 1
+        stats['total_wait'] += wait_time
+        stats['max_wait'] = max(stats['max_wait'], wait_time)
+
+
+def get_named_lock_stats():
+    """Returns wait time statistics of named locks.
+
+    :return: A dictionary mapping lock kinds, i.e. lock names with the
+        object id replaced by "<id>" (e.g. "with-items-<id>"), to
+        dictionaries with the number of acquisitions and the total, max
+        and average time (in seconds) spent waiting for the lock.
+    """
+    with _NAMED_LOCK_STATS_LOCK:
+        result = {k: dict(v) for k, v in _NAMED_LOCK_STATS.items()}
+
+    for stats in result.values():
+        stats['avg_wait'] = stats['total_wait'] / stats['acquired']
+
+    return result
+
+
+def reset_named_lock_stats():
+    with _NAMED_LOCK_STATS_LOCK:
+        _NAMED_LOCK_STATS.clear()
+
+
 @contextlib.contextmanager
 def named_lock(name):
     # NOTE(rakhmerov): We can't use the well-known try-finally pattern here
@@ -2204,8 +3109,24 @@ def named_lock(name):
     # All we can do here is to let the exception bubble up so that the
     # transaction management code could rollback the transaction.
 
+    started = time.monotonic()
+
+    dialect = _get_advisory_lock_dialect()
+
+    if dialect:
+        # Advisory locks are released when the transaction ends.
+        _acquire_advisory_lock(name, dialect)
+
+        _update_named_lock_stats(name, time.monotonic() - started)
+
+        yield
+
+        return
+
     lock_id = create_named_lock(name)
 
+    _update_named_lock_stats(name, time.monotonic() - started)
+
     yield
 
     delete_named_lock(lock_id, name)
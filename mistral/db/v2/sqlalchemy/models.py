@@ -26,6 +26,7 @@ from sqlalchemy import event
 from sqlalchemy.orm import backref
 from sqlalchemy.orm import relationship
 
+from mistral.blob_stores import base as blob_stores
 from mistral.db.sqlalchemy import model_base as mb
 from mistral.db.sqlalchemy import types as st
 from mistral import exceptions as exc
@@ -66,6 +67,11 @@ def validate_long_type_length(cls, field_name, value):
 
         size_kb = int(sys.getsizeof(str(value)) / 1024)
 
+        # Values moved to the blob store don't take space in the database.
+        if (blob_stores.is_enabled() and
+                size_kb >= cfg.CONF.blob_store.offload_threshold_kb):
+            return
+
         if size_kb > size_limit_kb:
             msg = (
                 "Field size limit exceeded"
@@ -296,7 +302,8 @@ class ActionExecution(Execution):
         sa.Index('%s_project_id' % __tablename__, 'project_id'),
         sa.Index('%s_scope' % __tablename__, 'scope'),
         sa.Index('%s_state' % __tablename__, 'state'),
-        sa.Index('%s_updated_at' % __tablename__, 'updated_at')
+        sa.Index('%s_updated_at' % __tablename__, 'updated_at'),
+        sa.Index('%s_created_at_id' % __tablename__, 'created_at', 'id')
     )
 
     # Main properties.
@@ -323,6 +330,7 @@ class WorkflowExecution(Execution):
         sa.Index('%s_scope' % __tablename__, 'scope'),
         sa.Index('%s_state' % __tablename__, 'state'),
         sa.Index('%s_updated_at' % __tablename__, 'updated_at'),
+        sa.Index('%s_created_at_id' % __tablename__, 'created_at', 'id')
     )
 
     # Main properties.
@@ -351,6 +359,7 @@ class TaskExecution(Execution):
         sa.Index('%s_scope' % __tablename__, 'scope'),
         sa.Index('%s_state' % __tablename__, 'state'),
         sa.Index('%s_updated_at' % __tablename__, 'updated_at'),
+        sa.Index('%s_created_at_id' % __tablename__, 'created_at', 'id'),
         sa.UniqueConstraint('unique_key')
     )
 
@@ -443,6 +452,13 @@ sa.Index(
     'task_execution_id'
 )
 
+sa.Index(
+    '%s_task_execution_id_created_at_id' % ActionExecution.__tablename__,
+    ActionExecution.task_execution_id,
+    ActionExecution.created_at,
+    ActionExecution.id
+)
+
 # Many-to-one for 'WorkflowExecution' and 'TaskExecution'.
 
 WorkflowExecution.task_execution_id = sa.Column(
@@ -505,6 +521,69 @@ sa.Index(
     TaskExecution.workflow_execution_id, TaskExecution.name
 )
 
+sa.Index(
+    '%s_workflow_execution_id_created_at_id' % TaskExecution.__tablename__,
+    TaskExecution.workflow_execution_id,
+    TaskExecution.created_at,
+    TaskExecution.id
+)
+
+
+class ArchivedExecution(mb.MistralSecureModelBase):
+    """Contains a finished execution moved out of the execution tables.
+
+    Executions are archived as whole trees: a root workflow execution
+    along with its task, action and sub-workflow executions. Column values
+    of an execution are kept in "data" and "created_at"/"updated_at" are
+    the ones of the original execution.
+    """
+
+    __tablename__ = 'archived_executions_v2'
+
+    __table_args__ = (
+        sa.Index('%s_project_id' % __tablename__, 'project_id'),
+        sa.Index('%s_root_execution_id' % __tablename__, 'root_execution_id'),
+        sa.Index('%s_parent_id' % __tablename__, 'parent_id')
+    )
+
+    id = mb.id_column()
+    type = sa.Column(sa.String(10))
+    name = sa.Column(sa.String(255))
+    state = sa.Column(sa.String(20))
+    root_execution_id = sa.Column(sa.String(36))
+
+    # Workflow execution of a task execution, task execution of
+    # an action or a workflow execution.
+    parent_id = sa.Column(sa.String(36), nullable=True)
+
+    archived_at = sa.Column(sa.DateTime)
+    data = sa.Column(st.JsonLongDictType())
+
+    def to_execution(self):
+        """Builds an execution object detached from any session."""
+        model = ARCHIVED_EXECUTION_MODELS[self.type]
+
+        ex = model()
+
+        for col in model.__table__.columns:
+            value = self.data.get(col.name)
+
+            if value is not None and isinstance(col.type, sa.DateTime):
+                value = datetime.datetime.fromisoformat(value)
+
+            # Setting committed values bypasses attribute events which
+            # would otherwise validate the values and reset "project_id".
+            sa.orm.attributes.set_committed_value(ex, col.name, value)
+
+        return ex
+
+
+ARCHIVED_EXECUTION_MODELS = {
+    'workflow': WorkflowExecution,
+    'task': TaskExecution,
+    'action': ActionExecution
+}
+
 
 # Other objects.
 
@@ -138,7 +138,7 @@ class Action(object, metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
-    def _prepare_execution_context(self):
+    def _prepare_execution_context(self, action_ex_id=None):
         res = {}
 
         if self.task_ex:
@@ -149,9 +149,12 @@ class Action(object, metaclass=abc.ABCMeta):
             res['workflow_name'] = wf_ex.name
 
         if self.action_ex:
-            res['action_execution_id'] = self.action_ex.id
+            action_ex_id = self.action_ex.id
+
+        if action_ex_id:
+            res['action_execution_id'] = action_ex_id
             res['callback_url'] = (
-                '/v2/action_executions/%s' % self.action_ex.id
+                '/v2/action_executions/%s' % action_ex_id
             )
 
         return res
@@ -160,6 +163,26 @@ class Action(object, metaclass=abc.ABCMeta):
                                  desc='', action_ex_id=None, is_sync=True):
         action_ex_id = action_ex_id or utils.generate_unicode_uuid()
 
+        values = self._get_action_execution_values(
+            input_dict,
+            runtime_ctx,
+            action_ex_id,
+            desc=desc,
+            is_sync=is_sync
+        )
+
+        LOG.info("Create action execution [action_name=%s, action_ex_id=%s]",
+                 self.action_desc.name, action_ex_id)
+
+        self.action_ex = db_api.create_action_execution(values)
+
+        if self.task_ex:
+            # Add to collection explicitly so that it's in a proper
+            # state within the current session.
+            self.task_ex.action_executions.append(self.action_ex)
+
+    def _get_action_execution_values(self, input_dict, runtime_ctx,
+                                     action_ex_id, desc='', is_sync=True):
         values = {
             'id': action_ex_id,
             'name': self.action_desc.name,
@@ -184,15 +207,7 @@ class Action(object, metaclass=abc.ABCMeta):
                 'project_id': security.get_project_id(),
             })
 
-        LOG.info("Create action execution [action_name=%s, action_ex_id=%s]",
-                 self.action_desc.name, action_ex_id)
-
-        self.action_ex = db_api.create_action_execution(values)
-
-        if self.task_ex:
-            # Add to collection explicitly so that it's in a proper
-            # state within the current session.
-            self.task_ex.action_executions.append(self.action_ex)
+        return values
 
     @profiler.trace('action-log-result', hide_args=True)
     def _log_result(self, prev_state, result):
@@ -247,27 +262,7 @@ class RegularAction(Action):
                  timeout=None):
         assert not self.action_ex
 
-        self.action_desc.check_parameters(input_dict)
-
-        wf_ex = self.task_ex.workflow_execution if self.task_ex else None
-
-        wf_ctx = data_flow.ContextView(
-            self.task_ctx,
-            data_flow.get_workflow_environment_dict(wf_ex),
-            wf_ex.context if wf_ex else {}
-        )
-
-        try:
-            action = self.action_desc.instantiate(input_dict, wf_ctx)
-        except Exception as e:
-            # NOTE: never include input_dict here, it may contain secrets
-            # (ssh password/private_key, http Authorization headers, smtp
-            # password, ...). This message also ends up in the persisted,
-            # API-visible task state_info.
-            raise exc.InvalidActionException(
-                'Failed to instantiate an action [action_desc=%s]'
-                % self.action_desc
-            ) from e
+        action = self._instantiate_for_schedule(input_dict)
 
         # Assign the action execution ID here to minimize database calls.
         # Otherwise, the input property of the action execution DB object needs
@@ -299,6 +294,29 @@ class RegularAction(Action):
         # on an executor outside of the main DB transaction.
         post_tx_queue.register_operation(_run_action)
 
+    def _instantiate_for_schedule(self, input_dict):
+        self.action_desc.check_parameters(input_dict)
+
+        wf_ex = self.task_ex.workflow_execution if self.task_ex else None
+
+        wf_ctx = data_flow.ContextView(
+            self.task_ctx,
+            data_flow.get_workflow_environment_dict(wf_ex),
+            wf_ex.context if wf_ex else {}
+        )
+
+        try:
+            return self.action_desc.instantiate(input_dict, wf_ctx)
+        except Exception as e:
+            # NOTE: never include input_dict here, it may contain secrets
+            # (ssh password/private_key, http Authorization headers, smtp
+            # password, ...). This message also ends up in the persisted,
+            # API-visible task state_info.
+            raise exc.InvalidActionException(
+                'Failed to instantiate an action [action_desc=%s]'
+                % self.action_desc
+            ) from e
+
     @profiler.trace('action-run', hide_args=True)
     def run(self, input_dict, target, index=0, desc='', save=True,
             safe_rerun=False, timeout=None):
@@ -355,6 +373,71 @@ class RegularAction(Action):
         return {'index': index, 'safe_rerun': safe_rerun}
 
 
+@profiler.trace('actions-schedule-batch', hide_args=True)
+def schedule_batch(batch, safe_rerun=False, timeout=None):
+    """Schedules runs of several regular actions at once.
+
+    Works as calling RegularAction.schedule() for every action but inserts
+    all action executions with one statement and hands all actions over
+    to the executor with one post transaction operation. Note that the
+    "action_ex" attribute of the actions is not set.
+
+    :param batch: A list of tuples (action, input_dict, target, index)
+        where "action" is a RegularAction that hasn't been scheduled yet.
+    :param safe_rerun: If true, actions would be re-run if executor dies
+        during execution.
+    :param timeout: A period of time in seconds after which execution of
+        an action will be interrupted.
+    """
+    values_list = []
+    action_requests = []
+
+    for action, input_dict, target, index in batch:
+        assert not action.action_ex
+
+        mistral_action = action._instantiate_for_schedule(input_dict)
+
+        action_ex_id = utils.generate_unicode_uuid()
+
+        values_list.append(
+            action._get_action_execution_values(
+                input_dict,
+                action._prepare_runtime_context(index, safe_rerun),
+                action_ex_id,
+                is_sync=mistral_action.is_sync()
+            )
+        )
+
+        action_requests.append({
+            'action': mistral_action,
+            'action_ex_id': action_ex_id,
+            'safe_rerun': safe_rerun,
+            'exec_ctx': action._prepare_execution_context(action_ex_id),
+            'target': target,
+            'timeout': timeout
+        })
+
+    if not values_list:
+        return
+
+    LOG.info(
+        "Create action executions [count=%s, task_ex_id=%s]",
+        len(values_list),
+        values_list[0].get('task_execution_id')
+    )
+
+    db_api.create_action_executions(values_list)
+
+    def _run_actions():
+        executor = exe.get_executor(cfg.CONF.executor.type)
+
+        executor.run_actions(action_requests)
+
+    # Register an asynchronous command to run the actions
+    # on an executor outside of the main DB transaction.
+    post_tx_queue.register_operation(_run_actions)
+
+
 class WorkflowAction(Action):
     """Workflow action."""
 
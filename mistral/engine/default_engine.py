@@ -248,16 +248,10 @@ class DefaultEngine(base.Engine):
     @db_utils.retry_on_db_error
     @post_tx_queue.run
     def process_action_heartbeats(self, action_ex_ids):
+        # Unknown ids are ignored, heartbeats of all the others are
+        # updated with one statement per chunk.
         with db_api.transaction():
-            for exec_id in action_ex_ids:
-                try:
-                    db_api.update_action_execution_heartbeat(exec_id)
-                except exceptions.DBEntityNotFoundError:
-                    LOG.debug(
-                        "Action execution heartbeat update failed. {}",
-                        exec_id,
-                        exc_info=True
-                    )
-                    # Ignore this error and continue with the
-                    # remaining ids.
-                    pass
+            db_api.update_action_executions_heartbeat(
+                action_ex_ids,
+                chunk_size=cfg.CONF.action_heartbeat.update_chunk_size
+            )
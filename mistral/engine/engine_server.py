@@ -16,12 +16,15 @@ from oslo_log import log as logging
 
 from mistral import config as cfg
 from mistral.engine import default_engine
+from mistral.engine import post_tx_queue
 from mistral import exceptions as exc
 from mistral.rpc import base as rpc
 from mistral.scheduler import base as sched_base
+from mistral.scheduler import job_notifier
 from mistral.service import base as service_base
 from mistral.services import action_heartbeat_checker
 from mistral.services import action_heartbeat_sender
+from mistral.services import archive_policy
 from mistral.services import expiration_policy
 from mistral.utils import profiler as profiler_utils
 from mistral.utils import resource_limits
@@ -54,6 +57,7 @@ class EngineServer(service_base.MistralService):
         self._rpc_server = None
         self._scheduler = None
         self._expiration_policy_tg = None
+        self._archive_policy_tg = None
 
     def start(self):
         super(EngineServer, self).start()
@@ -62,10 +66,17 @@ class EngineServer(service_base.MistralService):
 
         resource_limits.apply_memory_limit(CONF.engine.memory_limit_mb)
 
+        if CONF.engine.post_tx_workers:
+            post_tx_queue.start_workers(
+                CONF.engine.post_tx_workers,
+                CONF.engine.post_tx_queue_size
+            )
+
         self._scheduler = sched_base.get_system_scheduler()
         self._scheduler.start()
 
         self._expiration_policy_tg = expiration_policy.setup()
+        self._archive_policy_tg = archive_policy.setup()
 
         action_heartbeat_checker.start()
 
@@ -105,6 +116,8 @@ class EngineServer(service_base.MistralService):
         if self._rpc_server:
             self._rpc_server.stop(graceful)
 
+        post_tx_queue.stop_workers(graceful)
+
         action_heartbeat_checker.stop(graceful)
 
         if CONF.executor.type == 'local':
@@ -118,6 +131,9 @@ class EngineServer(service_base.MistralService):
         if self._expiration_policy_tg:
             self._expiration_policy_tg.stop(graceful)
 
+        if self._archive_policy_tg:
+            self._archive_policy_tg.stop(graceful)
+
     def wait(self):
         LOG.info("Waiting for an engine server to exit...")
 
@@ -339,6 +355,23 @@ class EngineServer(service_base.MistralService):
 
         return self.engine.process_action_heartbeats(action_ex_ids)
 
+    def scheduler_job_available(self, rpc_ctx, delay):
+        """Receives calls over RPC to wake up the local schedulers.
+
+        :param rpc_ctx: RPC request context.
+        :param delay: Number of seconds after which a persistent job
+            becomes eligible for pickup from the Job Store.
+        """
+        LOG.debug(
+            "Received RPC request 'scheduler_job_available'[delay=%s]",
+            delay
+        )
+
+        notifier = job_notifier.get_job_notifier()
+
+        if notifier:
+            notifier.dispatch(delay)
+
 
 def get_oslo_service(setup_profiler=True):
     return EngineServer(
@@ -17,7 +17,9 @@ import functools
 from oslo_config import cfg
 from oslo_log import log as logging
 from osprofiler import profiler
+import queue as std_queue
 import threading
+import time
 
 from mistral import context
 from mistral.db import utils as db_utils
@@ -36,24 +38,229 @@ LOG = logging.getLogger(__name__)
 
 
 _THREAD_LOCAL_NAME = "__operation_queue_thread_local"
+_KEYS_THREAD_LOCAL_NAME = "__operation_queue_keys_thread_local"
+
+_WORKER_POOL = None
+
+# How often (in seconds) idle workers of a stopped pool check whether
+# they can exit, in case the stop markers didn't fit into the queue.
+_STOP_CHECK_INTERVAL = 1
+
+
+class _WorkerPool(object):
+    """A bounded pool of threads running post transaction operations.
+
+    Every item of the pool queue is the whole list of operations
+    registered by one engine call, so they still run sequentially and
+    in the registration order.
+    """
+
+    def __init__(self, size, queue_size):
+        self._queue = std_queue.Queue(maxsize=queue_size)
+
+        self._threads = [
+            threading.Thread(
+                target=self._worker,
+                name='post-tx-worker-%s' % i,
+                daemon=True
+            )
+            for i in range(size)
+        ]
+
+        self._stopped = False
+
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            'processed': 0,
+            'blocked': 0,
+            'inline': 0,
+            'total_latency': 0.0,
+            'max_latency': 0.0
+        }
+
+    def start(self):
+        for t in self._threads:
+            t.start()
+
+    def stop(self, graceful=False):
+        # Operations submitted before stopping are still processed,
+        # the workers exit once they reach the stop markers or find
+        # the queue empty.
+        self._stopped = True
+
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except std_queue.Full:
+                break
+
+        if graceful:
+            for t in self._threads:
+                t.join()
+
+    def submit(self, auth_ctx, queue):
+        item = (time.monotonic(), auth_ctx, queue)
+
+        try:
+            self._queue.put_nowait(item)
+
+            return
+        except std_queue.Full:
+            pass
+
+        if threading.current_thread() in self._threads:
+            # Operations registered by another operation. Blocking a worker
+            # on a full queue could deadlock the pool, run them right away.
+            with self._stats_lock:
+                self._stats['inline'] += 1
+
+            _run_operations(auth_ctx, queue)
+
+            return
+
+        # Backpressure: block the engine call until a worker is free.
+        with self._stats_lock:
+            self._stats['blocked'] += 1
+
+        self._queue.put(item)
+
+    def get_stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+
+        stats['workers'] = len(self._threads)
+        stats['queue_depth'] = self._queue.qsize()
+        stats['avg_latency'] = (
+            stats['total_latency'] / stats['processed']
+            if stats['processed'] else 0.0
+        )
+
+        return stats
+
+    def _worker(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=_STOP_CHECK_INTERVAL)
+            except std_queue.Empty:
+                if self._stopped:
+                    return
+
+                continue
+
+            if item is None:
+                return
+
+            submitted_at, auth_ctx, queue = item
+
+            latency = time.monotonic() - submitted_at
+
+            with self._stats_lock:
+                self._stats['processed'] += 1
+                self._stats['total_latency'] += latency
+                self._stats['max_latency'] = max(
+                    self._stats['max_latency'],
+                    latency
+                )
+
+            try:
+                _run_operations(auth_ctx, queue)
+            except Exception:
+                # Already logged by _process_queue(), the worker must
+                # survive it.
+                pass
+
+
+def start_workers(size, queue_size):
+    """Starts the pool of threads running post transaction operations.
+
+    Until it's started (or once it's stopped) every engine call that
+    registered operations runs them in a new thread.
+
+    :param size: Number of worker threads.
+    :param queue_size: Max number of engine calls waiting for a worker.
+    """
+    global _WORKER_POOL
+
+    # A previously started pool would never be stopped otherwise.
+    stop_workers()
+
+    pool = _WorkerPool(size, queue_size)
+
+    pool.start()
+
+    _WORKER_POOL = pool
+
+
+def stop_workers(graceful=False):
+    global _WORKER_POOL
+
+    pool = _WORKER_POOL
+
+    _WORKER_POOL = None
+
+    if pool:
+        pool.stop(graceful)
+
+
+def get_worker_stats():
+    """Returns statistics of the post transaction worker pool.
+
+    :return: A dictionary with the number of workers, the current queue
+        depth, the number of processed, blocked (backpressure) and inline
+        submissions and the average and max time (in seconds) operations
+        waited in the queue, or None if the pool isn't started.
+    """
+    pool = _WORKER_POOL
+
+    return pool.get_stats() if pool else None
 
 
 def _prepare():
     # Register queue for both transactional and non transactional operations.
     utils.set_thread_local(_THREAD_LOCAL_NAME, list())
 
+    # Maps operation keys to their positions in the queue.
+    utils.set_thread_local(_KEYS_THREAD_LOCAL_NAME, dict())
+
 
 def _clear():
     utils.set_thread_local(_THREAD_LOCAL_NAME, None)
+    utils.set_thread_local(_KEYS_THREAD_LOCAL_NAME, None)
 
 
-def register_operation(func, args=None, in_tx=False):
+def register_operation(func, args=None, in_tx=False, key=None):
     """Register an operation.
 
     An operation can be transactional (in_tx=True) or not.
+
+    :param func: Function to call.
+    :param args: Function arguments.
+    :param in_tx: Whether to call the function in a new transaction.
+    :param key: Optional deduplication key. Operations registered with
+        the same key within one queue run only once, at the position of
+        the first registration, with the function and arguments of the
+        last one.
     """
 
-    _get_queue().append((func, args or [], in_tx))
+    queue = _get_queue()
+
+    op = (func, args or [], in_tx)
+
+    if key is None:
+        queue.append(op)
+
+        return
+
+    keys = utils.get_thread_local(_KEYS_THREAD_LOCAL_NAME)
+
+    idx = keys.get(key)
+
+    if idx is None:
+        keys[key] = len(queue)
+
+        queue.append(op)
+    else:
+        queue[idx] = op
 
 
 def _get_queue():
@@ -90,22 +297,16 @@ def run(func):
 
             auth_ctx = context.ctx() if context.has_ctx() else None
 
-            def _within_new_thread():
-                # This is a new thread so we need to init a profiler again.
-                if cfg.CONF.profiler.enabled:
-                    profiler.init(cfg.CONF.profiler.hmac_keys)
-
-                old_auth_ctx = context.ctx() if context.has_ctx() else None
-
-                context.set_ctx(auth_ctx)
-
-                try:
-                    _process_queue(queue)
-                finally:
-                    context.set_ctx(old_auth_ctx)
+            pool = _WORKER_POOL
 
-            t = threading.Thread(target=_within_new_thread)
-            t.start()
+            if pool:
+                pool.submit(auth_ctx, queue)
+            else:
+                t = threading.Thread(
+                    target=_run_operations,
+                    args=(auth_ctx, queue)
+                )
+                t.start()
         finally:
             _clear()
 
@@ -114,6 +315,28 @@ def run(func):
     return decorate
 
 
+def _run_operations(auth_ctx, queue):
+    old_auth_ctx = context.ctx() if context.has_ctx() else None
+
+    context.set_ctx(auth_ctx)
+
+    # Operations run in another thread than the engine call so they need
+    # a profiler of their own. Operations run inline by a worker keep the
+    # profiler of the operation which registered them.
+    init_profiler = cfg.CONF.profiler.enabled and profiler.get() is None
+
+    if init_profiler:
+        profiler.init(cfg.CONF.profiler.hmac_keys)
+
+    try:
+        _process_queue(queue)
+    finally:
+        if init_profiler:
+            profiler.clean()
+
+        context.set_ctx(old_auth_ctx)
+
+
 @db_utils.retry_on_db_error
 @run
 def _process_queue(queue):
@@ -360,7 +360,8 @@ def _check_affected_tasks(task):
         post_tx_queue.register_operation(
             _schedule_if_needed,
             args=[t_ex.id],
-            in_tx=True
+            in_tx=True,
+            key=('schedule_refresh_task_state', t_ex.id)
         )
 
 
@@ -34,6 +34,7 @@ from mistral import expressions as expr
 from mistral.notifiers import base as notif
 from mistral.notifiers import notification_events as events
 from mistral.services import actions as action_service
+from mistral.services import execution_watcher
 from mistral.utils import wf_trace
 from mistral.workflow import base as wf_base
 from mistral.workflow import commands
@@ -68,6 +69,8 @@ class Task(object, metaclass=abc.ABCMeta):
         self.state_changed = False
 
     def _notify(self, from_state, to_state):
+        execution_watcher.notify_state_change(self.task_ex.id, to_state)
+
         publishers = self.wf_ex.params.get('notify')
 
         if not publishers and not isinstance(publishers, list):
@@ -155,7 +158,7 @@ class Task(object, metaclass=abc.ABCMeta):
             self.wf_ex.input,
         )
 
-    def evaluate(self, data, ctx=None):
+    def evaluate(self, data, ctx=None, plan=None):
         """Evaluates data against the task context.
 
         The data is evaluated against the standard task context that includes
@@ -166,12 +169,14 @@ class Task(object, metaclass=abc.ABCMeta):
         :param data: Data (a string, dict or a list) that possibly contain
             YAQL/Jinja expressions to evaluate.
         :param ctx: Additional context.
+        :param plan: Optional expression plan of the data.
         :return:
         """
 
         return expr.evaluate_recursively(
             data,
-            self.get_expression_context(ctx)
+            self.get_expression_context(ctx),
+            plan=plan
         )
 
     def set_runtime_context_value(self, key, value):
@@ -441,7 +446,11 @@ class Task(object, metaclass=abc.ABCMeta):
             wf_handler.check_and_complete(self.wf_ex.id)
 
         if wf_ctrl.may_complete_workflow(self.task_ex):
-            post_tx_queue.register_operation(_check, in_tx=True)
+            post_tx_queue.register_operation(
+                _check,
+                in_tx=True,
+                key=('check_and_complete', self.wf_ex.id)
+            )
 
     @profiler.trace('task-update')
     def update(self, state, state_info=None):
@@ -724,7 +733,8 @@ class RegularTask(Task):
 
         return expr.evaluate_recursively(
             self.task_spec.get_target(),
-            ctx_view
+            ctx_view,
+            copy_on_write=True
         )
 
     @profiler.trace('regular-task-get-action-input', hide_args=True)
@@ -732,7 +742,8 @@ class RegularTask(Task):
         input_spec = self.task_spec.get_input()
 
         input_dict = (
-            self.evaluate(input_spec, ctx) if input_spec else {}
+            self.evaluate(input_spec, ctx, self.task_spec.get_input_plan())
+            if input_spec else {}
         )
 
         if not isinstance(input_dict, dict):
@@ -821,7 +832,11 @@ class RegularTask(Task):
                 wf_ex.input
             )
 
-            timeout = expr.evaluate_recursively(data=timeout, context=ctx_view)
+            timeout = expr.evaluate_recursively(
+                data=timeout,
+                context=ctx_view,
+                copy_on_write=True
+            )
 
         return timeout if timeout > 0 else None
 
@@ -899,23 +914,61 @@ class WithItemsTask(RegularTask):
             return
 
         try:
-            for i, input_dict in input_dicts:
-                target = self._get_target(input_dict)
+            if self.task_spec.get_workflow_name():
+                self._schedule_workflow_actions(input_dicts)
+            else:
+                self._schedule_regular_actions(input_dicts)
+        except exc.MistralException as e:
+            self.complete(states.ERROR, e.message)
+            return
+
+    def _schedule_workflow_actions(self, input_dicts):
+        for i, input_dict in input_dicts:
+            target = self._get_target(input_dict)
+
+            action = self._build_action()
+
+            action.schedule(
+                input_dict,
+                target,
+                index=i,
+                safe_rerun=self._get_safe_rerun(),
+                timeout=self._get_timeout()
+            )
 
-                action = self._build_action()
+            self._decrease_capacity(1)
 
-                action.schedule(
+    def _schedule_regular_actions(self, input_dicts):
+        # NOTE: For big "with-items" scheduling actions one by one is
+        # expensive, every action costs a separate INSERT and a separate
+        # RPC call. So actions are scheduled in batches instead.
+        action_desc = self._get_action_descriptor()
+        safe_rerun = self._get_safe_rerun()
+        timeout = self._get_timeout()
+        batch_size = cfg.CONF.engine.with_items_batch_size
+
+        for start in range(0, len(input_dicts), batch_size):
+            batch = [
+                (
+                    actions.RegularAction(
+                        action_desc=action_desc,
+                        task_ex=self.task_ex,
+                        task_ctx=self.ctx
+                    ),
                     input_dict,
-                    target,
-                    index=i,
-                    safe_rerun=self._get_safe_rerun(),
-                    timeout=self._get_timeout()
+                    self._get_target(input_dict),
+                    i
                 )
+                for i, input_dict in input_dicts[start:start + batch_size]
+            ]
 
-                self._decrease_capacity(1)
-        except exc.MistralException as e:
-            self.complete(states.ERROR, e.message)
-            return
+            actions.schedule_batch(
+                batch,
+                safe_rerun=safe_rerun,
+                timeout=timeout
+            )
+
+            self._decrease_capacity(len(batch))
 
     def _get_with_items_values(self):
         """Returns all values evaluated from 'with-items' expression.
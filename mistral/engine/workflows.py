@@ -32,6 +32,7 @@ from mistral.lang import parser as spec_parser
 from mistral.notifiers import base as notif
 from mistral.notifiers import notification_events as events
 from mistral.rpc import clients as rpc
+from mistral.services import execution_watcher
 from mistral.services import triggers
 from mistral.services import workflows as wf_service
 from mistral.utils import wf_trace
@@ -65,6 +66,8 @@ class Workflow(object, metaclass=abc.ABCMeta):
             self.wf_spec = None
 
     def _notify(self, from_state, to_state):
+        execution_watcher.notify_state_change(self.wf_ex.id, to_state)
+
         publishers = self.wf_ex.params.get('notify')
 
         if not publishers and not isinstance(publishers, list):
@@ -493,7 +496,8 @@ class Workflow(object, metaclass=abc.ABCMeta):
         output = data_flow.evaluate_workflow_output(
             self.wf_ex,
             self.wf_spec.get_output(),
-            final_context
+            final_context,
+            plan=self.wf_spec.get_output_plan()
         )
 
         # Set workflow execution to success after output is evaluated.
@@ -515,7 +519,8 @@ class Workflow(object, metaclass=abc.ABCMeta):
             output_on_error = data_flow.evaluate_workflow_output(
                 self.wf_ex,
                 self.wf_spec.get_output_on_error(),
-                final_context
+                final_context,
+                plan=self.wf_spec.get_output_on_error_plan()
             )
         except exc.MistralException as e:
             msg = (
@@ -634,7 +639,14 @@ def _get_environment(params):
             not params['evaluate_env']):
         return env_dict
     else:
-        return expr.evaluate_recursively(env_dict, {'__env': env_dict})
+        # The environment isn't modified afterwards (it's also returned
+        # as is if it's not evaluated) so its unchanged parts can be
+        # shared instead of copying a potentially large structure.
+        return expr.evaluate_recursively(
+            env_dict,
+            {'__env': env_dict},
+            copy_on_write=True
+        )
 
 
 def _build_fail_info_message(wf_ctrl, wf_ex):
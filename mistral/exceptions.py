@@ -189,6 +189,11 @@ class NotAllowedException(MistralException):
     message = "Operation forbidden (insufficient permissions)"
 
 
+class TooManyRequestsException(MistralException):
+    http_code = 429
+    message = "Too many requests"
+
+
 class UnauthorizedException(MistralException):
     http_code = 401
     message = "Unauthorized"
@@ -213,3 +218,7 @@ class InvalidStateTransitionException(MistralException):
 
 class MaintenanceException(MistralException):
     http_code = 500
+
+
+class BlobStoreException(MistralException):
+    http_code = 500
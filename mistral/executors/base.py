@@ -14,10 +14,13 @@
 
 import abc
 
+from mistral_lib import utils
 from stevedore import driver
 
 _EXECUTORS = {}
 
+_CANCEL_EVENT_THREAD_LOCAL_NAME = "__action_cancel_event_thread_local"
+
 
 def cleanup():
     global _EXECUTORS
@@ -39,6 +42,22 @@ def get_executor(exec_type):
     return _EXECUTORS[exec_type]
 
 
+def set_cancel_event(event):
+    utils.set_thread_local(_CANCEL_EVENT_THREAD_LOCAL_NAME, event)
+
+
+def is_action_cancelled():
+    """Tells if the action running in the current thread was cancelled.
+
+    Long running actions may check it periodically and return early once
+    the executor gave up on them, e.g. after their timeout expired. Always
+    returns False outside of an executor thread.
+    """
+    event = utils.get_thread_local(_CANCEL_EVENT_THREAD_LOCAL_NAME)
+
+    return event is not None and event.is_set()
+
+
 class Executor(object, metaclass=abc.ABCMeta):
     """Action executor interface."""
 
@@ -63,3 +82,32 @@ class Executor(object, metaclass=abc.ABCMeta):
         :return: Action result.
         """
         raise NotImplementedError()
+
+    def stop(self):
+        """Releases the resources held by the executor."""
+        pass
+
+    def run_actions(self, action_requests, redelivered=False):
+        """Runs the given actions in asynchronous mode.
+
+        :param action_requests: A list of dictionaries with the keys
+            "action", "action_ex_id", "safe_rerun", "exec_ctx", "target"
+            and "timeout" having the meaning of the corresponding
+            parameters of run_action().
+        :param redelivered: Tells if given actions were run before on
+            another executor.
+        """
+        # Only pass "redelivered" when it's set so that implementations
+        # of run_action() that don't take it keep working.
+        kwargs = {'redelivered': True} if redelivered else {}
+
+        for req in action_requests:
+            self.run_action(
+                req['action'],
+                req['action_ex_id'],
+                req['safe_rerun'],
+                req['exec_ctx'],
+                target=req.get('target'),
+                timeout=req.get('timeout'),
+                **kwargs
+            )
@@ -13,7 +13,13 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
+from concurrent import futures
+import functools
+import threading
+
 from mistral_lib import actions as mistral_lib
+from oslo_config import cfg
 from oslo_log import log as logging
 from osprofiler import profiler
 
@@ -22,15 +28,89 @@ from mistral import exceptions as exc
 from mistral.executors import base
 from mistral.rpc import clients as rpc
 from mistral.services import action_heartbeat_sender
-from mistral.utils import ThreadWithException
 
 LOG = logging.getLogger(__name__)
 
+CONF = cfg.CONF
+
+# Returned by _do_run_action() when the action keeps running on the event
+# loop and its result is sent to the engine once it completes.
+_DETACHED = object()
+
+# Threads sending the results of actions run on the event loop.
+_COMPLETION_WORKERS = 4
+
+# Max number of seconds to wait for the event loop resources to be released
+# when the executor stops.
+_LOOP_CLEANUP_TIMEOUT = 10
+
 
 class DefaultExecutor(base.Executor):
     def __init__(self):
         self._engine_client = rpc.get_engine_client()
 
+        # Actions run on a pool of "action_workers" threads created on
+        # the first run. In the "asyncio" execution mode the actions
+        # supporting it run on an event loop instead. The counters below
+        # are guarded by "_lock".
+        self._lock = threading.Lock()
+        self._pool = None
+        self._loop = None
+        self._completion_pool = None
+        self._dispatch_pool = None
+        self._stats = {
+            'queued': 0,
+            'running': 0,
+            'running_async': 0,
+            'timed_out': 0
+        }
+
+    def get_stats(self):
+        """Returns statistics of the action worker pool.
+
+        :return: A dictionary with the number of workers, the number of
+            actions waiting for a worker (queued), the number of actions
+            running on workers and on the event loop (running_async) and
+            the number of actions that timed out.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+
+        stats['workers'] = CONF.executor.action_workers
+
+        return stats
+
+    def _get_pool(self):
+        with self._lock:
+            if not self._pool:
+                self._pool = futures.ThreadPoolExecutor(
+                    max_workers=CONF.executor.action_workers,
+                    thread_name_prefix='action-worker'
+                )
+
+            return self._pool
+
+    def _update_stats(self, **deltas):
+        with self._lock:
+            for k, v in deltas.items():
+                self._stats[k] += v
+
+    def _run_in_pool(self, fn, auth_ctx, action_ctx, cancel_event):
+        self._update_stats(queued=-1, running=1)
+
+        # As we are running in a different thread, we need to set
+        # our auth_context correctly.
+        context.set_ctx(auth_ctx)
+        base.set_cancel_event(cancel_event)
+
+        try:
+            return fn(action_ctx)
+        finally:
+            base.set_cancel_event(None)
+            context.set_ctx(None)
+
+            self._update_stats(running=-1)
+
     @profiler.trace('default-executor-run-action', hide_args=True)
     def run_action(self, action, action_ex_id, safe_rerun, exec_ctx,
                    redelivered=False, target=None, async_=True, timeout=None):
@@ -51,10 +131,12 @@ class DefaultExecutor(base.Executor):
         :return: Action result.
         """
 
-        try:
-            action_heartbeat_sender.add_action(action_ex_id)
+        action_heartbeat_sender.add_action(action_ex_id)
 
-            return self._do_run_action(
+        detached = False
+
+        try:
+            result = self._do_run_action(
                 action,
                 action_ex_id,
                 exec_ctx,
@@ -62,32 +144,71 @@ class DefaultExecutor(base.Executor):
                 safe_rerun,
                 timeout
             )
+
+            detached = result is _DETACHED
+
+            return None if detached else result
         finally:
-            action_heartbeat_sender.remove_action(action_ex_id)
+            # A detached action keeps sending heartbeats until it completes.
+            if not detached:
+                action_heartbeat_sender.remove_action(action_ex_id)
 
-    def _do_run_action(self, action, action_ex_id, exec_ctx,
-                       redelivered, safe_rerun,
-                       timeout):
-        def send_error_back(error_msg):
-            error_result = mistral_lib.Result(error=error_msg)
+    def run_actions(self, action_requests, redelivered=False):
+        """Runs the given actions in asynchronous mode.
 
-            if action_ex_id:
-                self._engine_client.on_action_complete(
-                    action_ex_id,
-                    error_result
+        Unlike run_action() it doesn't wait for the actions to complete,
+        their results are sent to the engine.
+
+        :param action_requests: A list of dictionaries describing actions
+            to run, see mistral.executors.base.Executor.run_actions().
+        :param redelivered: Tells if given actions were run before on
+            another executor.
+        """
+        auth_ctx = context.ctx() if context.has_ctx() else None
+
+        pool = self._get_dispatch_pool()
+
+        for req in action_requests:
+            # Make sure heartbeats are sent for the actions still waiting
+            # for a dispatch thread.
+            action_heartbeat_sender.add_action(req['action_ex_id'])
+
+            pool.submit(self._dispatch_action, req, redelivered, auth_ctx)
+
+    def _get_dispatch_pool(self):
+        with self._lock:
+            if not self._dispatch_pool:
+                self._dispatch_pool = futures.ThreadPoolExecutor(
+                    max_workers=CONF.executor.action_workers,
+                    thread_name_prefix='action-dispatch'
                 )
 
-                return None
+            return self._dispatch_pool
 
-            return error_result
+    def _dispatch_action(self, req, redelivered, auth_ctx):
+        context.set_ctx(auth_ctx)
 
-        def _thread_run_action(fn, auth_ctx, action_ctx, result):
-            # Run an action in a thread and keep track of the result
-            # As we are running in a different thread, we need to set
-            # our auth_context correctly
-            context.set_ctx(auth_ctx)
-            result['r'] = fn(action_ctx)
+        try:
+            self.run_action(
+                req['action'],
+                req['action_ex_id'],
+                req['safe_rerun'],
+                req['exec_ctx'],
+                redelivered=redelivered,
+                target=req.get('target'),
+                timeout=req.get('timeout')
+            )
+        except Exception:
+            LOG.exception(
+                "Failed to run action [action_ex_id=%s]",
+                req['action_ex_id']
+            )
+        finally:
+            context.set_ctx(None)
 
+    def _do_run_action(self, action, action_ex_id, exec_ctx,
+                       redelivered, safe_rerun,
+                       timeout):
         if redelivered and not safe_rerun:
             msg = (
                 "Request to run an action was redelivered, but it cannot "
@@ -95,7 +216,7 @@ class DefaultExecutor(base.Executor):
                 "it [action=%s]." % action
             )
 
-            return send_error_back(msg)
+            return self._send_error_back(action_ex_id, msg)
 
         # Run action.
         try:
@@ -105,39 +226,40 @@ class DefaultExecutor(base.Executor):
                 action_ctx = context.create_action_context(exec_ctx)
             else:
                 action_ctx = None
-            # NOTE(amorin) we need a dict type to store the result so python
-            # will give pointer to this object and not copy the value into a
-            # new memory space
-            result_ptr = {}
-            thread = ThreadWithException(
-                target=_thread_run_action,
-                args=[action.run, context.ctx(), action_ctx, result_ptr]
-            )
-            thread.start()
-            thread.join(timeout=timeout)
-            # Get back result
-            result = result_ptr.get('r')
-
-            if thread.is_alive():
-                # The action is taking too long.
-                # There is no proper way to kill a thread, so we have two
-                # options:
-                # - Leave the thread alone without taking care
-                # - Wait for it to finish now (thread.join())
-                # amorin: I decided to wait for the thread to finish, it's a
-                # safer decision as we are giving "result" to our thread
-                # and we dont want another thread to overwrite this later
-                # if we don't wait
-                # We may block this mistral thread for an infinite time,
-                # but, it's the safest option I came to for now.
-                # Note: we were using eventlet here before, and eventlet
-                # allowed us to kill the greenthread
-                # Let's print a log message about this, so at least, we can
-                # identify that we are stuck from logs
-                LOG.warning("The action %s timed out, we are now waiting for "
-                            "the action thread to finish...", (action_ex_id))
-                thread.join()
-                raise Exception("Timeout after %s seconds" % (timeout))
+
+            if self._runs_on_event_loop(action):
+                future = asyncio.run_coroutine_threadsafe(
+                    self._run_coroutine(action, action_ctx, timeout),
+                    self._get_event_loop()
+                )
+
+                if action_ex_id:
+                    # The engine receives the result with
+                    # on_action_complete() anyway so there's no need to
+                    # hold the current thread until the action completes.
+                    future.add_done_callback(
+                        functools.partial(
+                            self._on_coroutine_done,
+                            action,
+                            action_ex_id,
+                            timeout
+                        )
+                    )
+
+                    return _DETACHED
+
+                result = self._get_coroutine_result(
+                    future,
+                    action_ex_id,
+                    timeout
+                )
+            else:
+                result = self._run_on_pool(
+                    action,
+                    action_ctx,
+                    action_ex_id,
+                    timeout
+                )
 
             # Note: it's made for backwards compatibility with already
             # existing Mistral actions which don't return result as
@@ -151,9 +273,187 @@ class DefaultExecutor(base.Executor):
                 "msg='%s']" % (action, action_ex_id, e)
             )
             LOG.warning(msg, exc_info=True)
-            return send_error_back(msg)
+            return self._send_error_back(action_ex_id, msg)
+
+        return self._send_result(action, action_ex_id, result)
+
+    def _run_on_pool(self, action, action_ctx, action_ex_id, timeout):
+        cancel_event = threading.Event()
+
+        self._update_stats(queued=1)
+
+        future = self._get_pool().submit(
+            self._run_in_pool,
+            action.run,
+            context.ctx(),
+            action_ctx,
+            cancel_event
+        )
+
+        try:
+            return future.result(timeout=timeout)
+        except futures.TimeoutError:
+            # There is no proper way to kill a thread. If the action
+            # hasn't started yet it will never run, otherwise we ask it
+            # to stop and leave it alone. Cooperative actions check
+            # base.is_action_cancelled() and return early, the others
+            # keep their worker busy until they finish. Either way the
+            # result is not used anymore.
+            if future.cancel():
+                self._update_stats(queued=-1)
+
+            cancel_event.set()
+
+            self._update_stats(timed_out=1)
+
+            LOG.warning(
+                "The action %s timed out, it has been cancelled.",
+                action_ex_id
+            )
+
+            raise Exception("Timeout after %s seconds" % (timeout))
+
+    @staticmethod
+    def _runs_on_event_loop(action):
+        if CONF.executor.execution_mode != 'asyncio':
+            return False
+
+        supports_async = getattr(action, 'supports_async', None)
+
+        return callable(supports_async) and supports_async()
+
+    def _get_event_loop(self):
+        with self._lock:
+            if not self._loop:
+                self._loop = asyncio.new_event_loop()
+
+                thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name='action-event-loop',
+                    daemon=True
+                )
+                thread.start()
+
+            return self._loop
+
+    @staticmethod
+    async def _cleanup_event_loop():
+        # Import it here to avoid a circular import.
+        from mistral.actions import std_actions
+
+        await std_actions.close_aiohttp_session()
+
+        await asyncio.get_running_loop().shutdown_default_executor()
+
+    def stop(self):
+        with self._lock:
+            loop = self._loop
+
+            self._loop = None
+
+        if not loop:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._cleanup_event_loop(),
+                loop
+            ).result(timeout=_LOOP_CLEANUP_TIMEOUT)
+        except Exception as e:
+            LOG.warning("Failed to clean up the action event loop: %s", e)
+
+        loop.call_soon_threadsafe(loop.stop)
+
+    async def _run_coroutine(self, action, action_ctx, timeout):
+        # NOTE: Coroutines of all actions share the event loop thread so
+        # the auth context isn't set for them, they must rely on the
+        # action context only.
+        self._update_stats(running_async=1)
+
+        try:
+            coro = action.run_async(action_ctx)
+
+            if timeout:
+                # Unlike threads, coroutines can really be cancelled.
+                return await asyncio.wait_for(coro, timeout)
+
+            return await coro
+        finally:
+            self._update_stats(running_async=-1)
+
+    def _get_coroutine_result(self, future, action_ex_id, timeout):
+        try:
+            return future.result()
+        except asyncio.TimeoutError:
+            self._update_stats(timed_out=1)
+
+            LOG.warning(
+                "The action %s timed out, it has been cancelled.",
+                action_ex_id
+            )
+
+            raise Exception("Timeout after %s seconds" % (timeout))
+
+    def _on_coroutine_done(self, action, action_ex_id, timeout, future):
+        # Called in the event loop thread, sending the result may block.
+        self._get_completion_pool().submit(
+            self._complete_coroutine,
+            action,
+            action_ex_id,
+            timeout,
+            future
+        )
+
+    def _get_completion_pool(self):
+        with self._lock:
+            if not self._completion_pool:
+                self._completion_pool = futures.ThreadPoolExecutor(
+                    max_workers=_COMPLETION_WORKERS,
+                    thread_name_prefix='action-completion'
+                )
+
+            return self._completion_pool
+
+    def _complete_coroutine(self, action, action_ex_id, timeout, future):
+        try:
+            try:
+                result = self._get_coroutine_result(
+                    future,
+                    action_ex_id,
+                    timeout
+                )
+
+                if not isinstance(result, mistral_lib.Result):
+                    result = mistral_lib.Result(data=result)
+            except BaseException as e:
+                msg = (
+                    "The action raised an exception [action=%s, "
+                    "action_ex_id=%s, msg='%s']" % (action, action_ex_id, e)
+                )
+                LOG.warning(msg, exc_info=True)
+
+                self._send_error_back(action_ex_id, msg)
+
+                return
+
+            self._send_result(action, action_ex_id, result)
+        finally:
+            action_heartbeat_sender.remove_action(action_ex_id)
+
+    def _send_error_back(self, action_ex_id, error_msg):
+        error_result = mistral_lib.Result(error=error_msg)
+
+        if action_ex_id:
+            self._engine_client.on_action_complete(
+                action_ex_id,
+                error_result
+            )
+
+            return None
+
+        return error_result
 
-        # Send action result.
+    def _send_result(self, action, action_ex_id, result):
         try:
             if action_ex_id and (action.is_sync() or result.is_error()):
                 self._engine_client.on_action_complete(
@@ -176,7 +476,7 @@ class DefaultExecutor(base.Executor):
 
             LOG.exception(msg)
 
-            return send_error_back(msg)
+            return self._send_error_back(action_ex_id, msg)
         except Exception as e:
             # If it's not a Mistral exception all we can do is only
             # log the error.
@@ -12,6 +12,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from mistral_lib import serialization
 from oslo_log import log as logging
 
 from mistral import config as cfg
@@ -69,6 +70,8 @@ class ExecutorServer(service_base.MistralService):
         if self._rpc_server:
             self._rpc_server.stop(graceful)
 
+        self.executor.stop()
+
     def run_action(self, rpc_ctx, action, action_ex_id, safe_rerun, exec_ctx,
                    timeout):
 
@@ -112,6 +115,29 @@ class ExecutorServer(service_base.MistralService):
 
         return res
 
+    def run_actions(self, rpc_ctx, action_requests):
+        """Receives calls over RPC to run several actions on executor.
+
+        :param rpc_ctx: RPC request context dictionary.
+        :param action_requests: A list of dictionaries with the keys
+            "action" (serialized action), "action_ex_id", "safe_rerun",
+            "exec_ctx" and "timeout".
+        """
+        LOG.debug(
+            "Received RPC request 'run_actions' [count=%s]",
+            len(action_requests)
+        )
+
+        p_serializer = serialization.get_polymorphic_serializer()
+
+        for req in action_requests:
+            req['action'] = p_serializer.deserialize(req['action'])
+
+        self.executor.run_actions(
+            action_requests,
+            redelivered=rpc_ctx.redelivered or False
+        )
+
 
 def get_oslo_service(setup_profiler=True):
     return ExecutorServer(
@@ -15,6 +15,7 @@
 #    limitations under the License.
 
 import copy
+import re
 
 from oslo_config import cfg
 from oslo_log import log as logging
@@ -32,13 +33,28 @@ _mgr = extension.ExtensionManager(
 )
 
 _evaluators = []
+_evaluators_by_name = {}
 patterns = {}
 
+# {language name => pattern matching all kinds of expressions of the
+# language}. Used to split a string into its literal and expression parts.
+_split_patterns = {}
+
 for name in sorted(_mgr.names()):
     evaluator = _mgr[name].plugin
     _evaluators.append((name, evaluator))
+    _evaluators_by_name[name] = evaluator
     patterns[name] = evaluator.find_expression_pattern.pattern
 
+    _split_patterns[name] = re.compile(
+        '|'.join(
+            p.pattern for p in (
+                evaluator.find_expression_pattern,
+                getattr(evaluator, 'find_block_pattern', None)
+            ) if p is not None
+        )
+    )
+
 
 def _is_language_allowed(name):
     # Read the configuration lazily: the option may not be registered or
@@ -75,22 +91,205 @@ def validate(expression):
                 expression_found = name
 
 
-def evaluate(expression, context):
+def _find_language(expression):
     for name, evaluator in _evaluators:
-        # Check if the passed value is expression so we don't need to do this
-        # every time on a caller side.
-        if (isinstance(expression, str) and
-                evaluator.is_expression(expression)):
-            if not _is_language_allowed(name):
-                raise exc.EvaluationException(
-                    "The '%s' expression language is disabled by the "
-                    "operator." % name)
+        if evaluator.is_expression(expression):
+            return name, evaluator
+
+    return None, None
+
+
+def _evaluate_with(name, evaluator, expression, context):
+    if not _is_language_allowed(name):
+        raise exc.EvaluationException(
+            "The '%s' expression language is disabled by the "
+            "operator." % name)
+
+    return evaluator.evaluate(expression, context)
 
-            return evaluator.evaluate(expression, context)
+
+def evaluate(expression, context):
+    # Check if the passed value is expression so we don't need to do this
+    # every time on a caller side.
+    if isinstance(expression, str):
+        name, evaluator = _find_language(expression)
+
+        if evaluator:
+            return _evaluate_with(name, evaluator, expression, context)
 
     return expression
 
 
+class ExpressionPlan(object):
+    """Precomputed layout of the expressions found in a data structure.
+
+    A plan mirrors the structure of the data it was built for. A string
+    that contains expressions gets a plan with the name of the expression
+    language and its literal and expression parts, e.g. 'Hi <% $.name %>!'
+    has literal parts ['Hi ', '!'] and expression parts ['<% $.name %>'].
+    A dictionary or a list gets a plan holding the plans of only those
+    children that contain expressions, so that everything else can be
+    skipped during evaluation.
+
+    A plan is only valid for the data it was built from and must be
+    rebuilt if that data changes.
+    """
+
+    __slots__ = ('language', 'literal_parts', 'expression_parts', 'children')
+
+    def __init__(self, language=None, literal_parts=None,
+                 expression_parts=None, children=None):
+        self.language = language
+        self.literal_parts = literal_parts or []
+        self.expression_parts = expression_parts or []
+        self.children = children or {}
+
+    @property
+    def is_literal(self):
+        """True if the data contains no expressions."""
+        return self.language is None and not self.children
+
+    def __repr__(self):
+        return "ExpressionPlan(language=%s, expressions=%s, children=%s)" % (
+            self.language,
+            self.expression_parts,
+            self.children
+        )
+
+
+_LITERAL_PLAN = ExpressionPlan()
+
+
+def build_plan(data):
+    """Builds an expression plan for the given data.
+
+    :param data: Data (a string, dict or a list) that possibly contains
+        YAQL/Jinja expressions.
+    :return: Expression plan of the data.
+    """
+    if isinstance(data, str):
+        name, _ = _find_language(data)
+
+        if not name:
+            return _LITERAL_PLAN
+
+        literal_parts = []
+        expression_parts = []
+        pos = 0
+
+        for m in _split_patterns[name].finditer(data):
+            literal_parts.append(data[pos:m.start()])
+            expression_parts.append(m.group(0))
+
+            pos = m.end()
+
+        literal_parts.append(data[pos:])
+
+        return ExpressionPlan(
+            language=name,
+            literal_parts=literal_parts,
+            expression_parts=expression_parts
+        )
+
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list):
+        items = enumerate(data)
+    else:
+        return _LITERAL_PLAN
+
+    children = {}
+
+    for key, item in items:
+        plan = build_plan(item)
+
+        if not plan.is_literal:
+            children[key] = plan
+
+    return ExpressionPlan(children=children) if children else _LITERAL_PLAN
+
+
+def _copy_literal(data):
+    # A faster equivalent of copy.deepcopy() for JSON-like data that
+    # doesn't need to keep the memo of already copied objects.
+    data_type = type(data)
+
+    if data_type is dict:
+        return {k: _copy_literal(v) for k, v in data.items()}
+    elif data_type is list:
+        return [_copy_literal(v) for v in data]
+    elif data_type in (str, int, float, bool, type(None)):
+        return data
+
+    return copy.deepcopy(data)
+
+
+def _share_literal(data):
+    return data
+
+
+def _evaluate_by_plan(data, context, plan, copy_func=_copy_literal):
+    if plan.is_literal:
+        return copy_func(data)
+
+    if plan.language:
+        evaluator = _evaluators_by_name[plan.language]
+
+        try:
+            return _evaluate_with(plan.language, evaluator, data, context)
+        except AttributeError as e:
+            # NOTE: never log the context, it may contain sensitive data
+            # such as the auth token.
+            LOG.debug(
+                "Expression %s is not evaluated: %s",
+                data,
+                e
+            )
+            return data
+
+    children = plan.children
+
+    if isinstance(data, dict):
+        return {
+            k: (_evaluate_by_plan(v, context, children[k], copy_func)
+                if k in children else copy_func(v))
+            for k, v in data.items()
+        }
+
+    return [
+        (_evaluate_by_plan(v, context, children[i], copy_func)
+         if i in children else copy_func(v))
+        for i, v in enumerate(data)
+    ]
+
+
+def _evaluate_shared(data, context):
+    # Containers are rebuilt (shallow copied) only if at least one of
+    # their items has changed after evaluation, everything else is shared.
+    if isinstance(data, str):
+        return _evaluate_item(data, context)
+
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list):
+        items = enumerate(data)
+    else:
+        return data
+
+    result = None
+
+    for key, item in items:
+        evaluated = _evaluate_shared(item, context)
+
+        if evaluated is not item:
+            if result is None:
+                result = copy.copy(data)
+
+            result[key] = evaluated
+
+    return data if result is None else result
+
+
 def _evaluate_item(item, context):
     if isinstance(item, str):
         try:
@@ -108,7 +307,37 @@ def _evaluate_item(item, context):
         return evaluate_recursively(item, context)
 
 
-def evaluate_recursively(data, context):
+def evaluate_recursively(data, context, plan=None, copy_on_write=False):
+    """Evaluates all expressions found in the given data.
+
+    :param data: Data (a string, dict or a list) that possibly contains
+        YAQL/Jinja expressions to evaluate. It's not modified.
+    :param context: Data context.
+    :param plan: Optional expression plan built for the data with
+        build_plan(). If given, subtrees that contain no expressions
+        are not scanned for expressions again.
+    :param copy_on_write: If True, the data is not copied. Only the
+        containers on the paths to evaluated expressions are rebuilt
+        and all other parts of the result are shared with the data, so
+        the result must be treated as read-only. If nothing has been
+        evaluated the data itself is returned.
+    :return: The data with all expressions evaluated.
+    """
+    if copy_on_write:
+        if not context:
+            return data
+
+        if plan is not None:
+            return _evaluate_by_plan(data, context, plan, _share_literal)
+
+        return _evaluate_shared(data, context)
+
+    if plan is not None:
+        if not context:
+            return _copy_literal(data)
+
+        return _evaluate_by_plan(data, context, plan)
+
     data = copy.deepcopy(data)
 
     if not context:
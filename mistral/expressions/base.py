@@ -14,10 +14,23 @@
 #    limitations under the License.
 
 import abc
+import threading
 
+import cachetools
+from oslo_config import cfg
 from stevedore import extension
 
 
+CONF = cfg.CONF
+
+# {(language, expression, ...) => compiled expression}. The cache is created
+# lazily because the configuration may not be parsed yet on import.
+_EXPR_CACHE = None
+_EXPR_CACHE_LOCK = threading.RLock()
+
+_EXPR_CACHE_STATS = {'hits': 0, 'misses': 0}
+
+
 class Evaluator(object):
     """Expression evaluator interface.
 
@@ -74,3 +87,74 @@ def get_custom_functions():
         result[name] = mgr[name].plugin
 
     return result
+
+
+def _get_expression_cache():
+    global _EXPR_CACHE
+
+    size = CONF.expressions.cache_size
+
+    if _EXPR_CACHE is None or _EXPR_CACHE.maxsize != size:
+        _EXPR_CACHE = cachetools.LRUCache(maxsize=size) if size else None
+
+    return _EXPR_CACHE
+
+
+def get_compiled_expression(key, compile_func):
+    """Gets a compiled expression from the cache or compiles it.
+
+    :param key: Hashable cache key. It must contain the expression
+        language and the expression text, plus anything else the
+        compiled result depends on (e.g. the YAQL engine).
+    :param compile_func: Function returning a compiled expression. It's
+        called only on a cache miss and its result is reused by all
+        subsequent calls with the same key.
+    :return: Compiled expression.
+    """
+    with _EXPR_CACHE_LOCK:
+        cache = _get_expression_cache()
+
+        if cache is not None:
+            compiled = cache.get(key)
+
+            if compiled is not None:
+                _EXPR_CACHE_STATS['hits'] += 1
+
+                return compiled
+
+        _EXPR_CACHE_STATS['misses'] += 1
+
+    # NOTE: compile outside of the lock so that a slow compilation
+    # doesn't block evaluation of other expressions. In the worst case
+    # the same expression gets compiled twice by concurrent threads.
+    compiled = compile_func()
+
+    if cache is not None:
+        with _EXPR_CACHE_LOCK:
+            cache[key] = compiled
+
+    return compiled
+
+
+def get_expression_cache_stats():
+    """Returns the compiled expression cache counters.
+
+    :return: Dictionary with the number of cache hits, misses and the
+        current number of cached expressions.
+    """
+    with _EXPR_CACHE_LOCK:
+        return dict(
+            _EXPR_CACHE_STATS,
+            size=len(_EXPR_CACHE) if _EXPR_CACHE is not None else 0
+        )
+
+
+def clear_expression_cache():
+    """Clears the compiled expression cache and resets its counters."""
+    global _EXPR_CACHE
+
+    with _EXPR_CACHE_LOCK:
+        _EXPR_CACHE = None
+
+        _EXPR_CACHE_STATS['hits'] = 0
+        _EXPR_CACHE_STATS['misses'] = 0
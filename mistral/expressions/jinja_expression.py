@@ -88,8 +88,9 @@ class JinjaEvaluator(base.Evaluator):
         ctx = get_jinja_context(data_context)
 
         try:
-            result = cls._env.compile_expression(
-                expression, **JINJA_OPTS
+            result = base.get_compiled_expression(
+                ('jinja', expression),
+                lambda: cls._env.compile_expression(expression, **JINJA_OPTS)
             )(**ctx)
 
             # For StrictUndefined values, UndefinedError only gets raised
@@ -156,7 +157,10 @@ class InlineJinjaEvaluator(base.Evaluator):
             else:
                 ctx = get_jinja_context(data_context)
 
-                result = cls._env.from_string(expression).render(**ctx)
+                result = base.get_compiled_expression(
+                    ('jinja_template', expression),
+                    lambda: cls._env.from_string(expression)
+                ).render(**ctx)
         except Exception as e:
             # NOTE(rakhmerov): if we hit a database error then we need to
             # re-raise the initial exception so that upper layers had a
@@ -14,6 +14,8 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import collections
+
 from oslo_log import log as logging
 from oslo_serialization import jsonutils
 
@@ -138,7 +140,7 @@ def task_(context, task_name=None):
     return _convert_to_user_model(task_ex)
 
 
-def _should_pass_filter(t, state, flat):
+def _should_pass_filter(t, state, flat, nested_execs=None):
     # Start from assuming all is true, check only if needed.
     state_match = True
     flat_match = True
@@ -153,9 +155,10 @@ def _should_pass_filter(t, state, flat):
         is_action = t['type'] == lang_tasks.ACTION_TASK_TYPE
 
         if not is_action:
-            nested_execs = db_api.get_workflow_executions(
-                task_execution_id=t.id
-            )
+            if nested_execs is None:
+                nested_execs = db_api.get_workflow_executions(
+                    task_execution_id=t.id
+                )
 
             for n in nested_execs:
                 flat_match = flat_match and n.state != t.state
@@ -165,59 +168,82 @@ def _should_pass_filter(t, state, flat):
 
 def _get_tasks_from_db(workflow_execution_id=None, recursive=False, state=None,
                        flat=False):
-    task_execs = []
-    nested_task_exs = []
+    # If there is no workflow execution id, we already have all we need, and
+    # doing more queries will just create duplication in the results.
+    if recursive and workflow_execution_id:
+        return _get_tasks_from_db_recursive(workflow_execution_id, state, flat)
 
     kwargs = {}
 
     if workflow_execution_id:
         kwargs['workflow_execution_id'] = workflow_execution_id
 
-    # We can't add state to query if we want to filter by workflow_execution_id
-    # recursively. There might be a workflow_execution in one state with a
-    # nested workflow execution that has a task in the desired state until we
-    # have an optimization for queering all workflow executions under a given
-    # top level workflow execution, this is the way to go.
-    if state and not (workflow_execution_id and recursive):
+    if state:
         kwargs['state'] = state
 
-    task_execs.extend(db_api.get_task_executions(**kwargs))
+    task_execs = db_api.get_task_executions(**kwargs)
+
+    if state or flat:
+        # Filter by state and flat.
+        task_execs = [
+            t for t in task_execs if _should_pass_filter(t, state, flat)
+        ]
+
+    return task_execs
+
+
+def _get_tasks_from_db_recursive(workflow_execution_id, state, flat):
+    # Get the ids of all nested workflow executions with one query and
+    # then their tasks with another one instead of walking the hierarchy
+    # level by level.
+    tree = db_api.get_execution_tree(workflow_execution_id)
+
+    wf_ex_ids = []
+    nested_wf_exs = collections.defaultdict(list)
+
+    for node in sorted(tree, key=lambda n: n.id):
+        if node.type == 'workflow':
+            wf_ex_ids.append(node.id)
+
+            if node.id != workflow_execution_id:
+                nested_wf_exs[node.parent_id].append(node)
+
+    if not wf_ex_ids:
+        return []
+
+    wf_ex_task_execs = collections.defaultdict(list)
+
+    # We can't add state to query because a workflow execution in one
+    # state can have a nested workflow execution that has a task in the
+    # desired state.
+    for t in db_api.get_task_executions(
+            workflow_execution_id={'in': wf_ex_ids}):
+        wf_ex_task_execs[t.workflow_execution_id].append(t)
 
     # To break cyclic dependency.
     from mistral.lang.v2 import tasks as lang_tasks
 
-    # If it is not recursive no need to check nested workflows.
-    # If there is no workflow execution id, we already have all we need, and
-    # doing more queries will just create duplication in the results.
-    if recursive and workflow_execution_id:
+    def _collect(wf_ex_id):
+        task_execs = wf_ex_task_execs[wf_ex_id]
+        nested_task_exs = []
+
         for t in task_execs:
             if t.type == lang_tasks.WORKFLOW_TASK_TYPE:
-                # Get nested workflow execution that matches the task.
-                nested_workflow_executions = db_api.get_workflow_executions(
-                    task_execution_id=t.id
-                )
-
                 # There might be zero nested executions.
-                for nested_workflow_execution in nested_workflow_executions:
-                    nested_task_exs.extend(
-                        _get_tasks_from_db(
-                            nested_workflow_execution.id,
-                            recursive,
-                            state,
-                            flat
-                        )
-                    )
+                for nested_wf_ex in nested_wf_exs[t.id]:
+                    nested_task_exs.extend(_collect(nested_wf_ex.id))
 
-    if state or flat:
-        # Filter by state and flat.
-        task_execs = [
-            t for t in task_execs if _should_pass_filter(t, state, flat)
-        ]
+        if state or flat:
+            # Filter by state and flat.
+            task_execs = [
+                t for t in task_execs
+                if _should_pass_filter(t, state, flat, nested_wf_exs[t.id])
+            ]
 
-    # The nested tasks were already filtered, since this is a recursion.
-    task_execs.extend(nested_task_exs)
+        # The nested tasks were already filtered, since this is a recursion.
+        return task_execs + nested_task_exs
 
-    return task_execs
+    return _collect(workflow_execution_id)
 
 
 @db_utils.tx_cached(ignore_args='context')
@@ -125,6 +125,17 @@ def get_yaql_engine_class():
     return YAQL_ENGINE
 
 
+def _compile(expression):
+    engine = get_yaql_engine_class()
+
+    # The engine is a part of the key since the parsed expression
+    # depends on the engine options.
+    return base.get_compiled_expression(
+        ('yaql', expression, engine),
+        lambda: engine(expression)
+    )
+
+
 def _sanitize_yaql_result(result):
     # Expression output conversion can be disabled but we can still
     # do some basic unboxing if we got an internal YAQL type.
@@ -146,7 +157,7 @@ class YAQLEvaluator(base.Evaluator):
     @classmethod
     def validate(cls, expression):
         try:
-            get_yaql_engine_class()(expression)
+            _compile(expression)
         except (yaql_exc.YaqlException, KeyError, ValueError, TypeError) as e:
             raise exc.YaqlGrammarException(getattr(e, 'message', e))
 
@@ -155,7 +166,7 @@ class YAQLEvaluator(base.Evaluator):
         expression = expression.strip() if expression else expression
 
         try:
-            result = get_yaql_engine_class()(expression).evaluate(
+            result = _compile(expression).evaluate(
                 context=get_yaql_context(data_context)
             )
         except Exception as e:
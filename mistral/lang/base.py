@@ -18,6 +18,7 @@ import json
 import jsonschema
 from osprofiler import profiler
 import re
+import weakref
 
 from mistral import exceptions as exc
 from mistral import expressions as expr
@@ -54,6 +55,10 @@ PARAMS_PTRN = re.compile(r"([-_\w]+)=(%s)" % "|".join(ALL))
 # {(base_spec_cls, polymorphic_value): spec_cls}
 _POLYMORPHIC_CACHE = {}
 
+# {spec: {prop_name: expression plan}}. The plans are kept outside of
+# specification objects so that they don't get serialized along with them.
+_EXPR_PLANS = weakref.WeakKeyDictionary()
+
 
 @profiler.trace('lang-base-instantiate-spec', hide_args=True)
 def instantiate_spec(spec_cls, data, validate=False):
@@ -255,6 +260,34 @@ class BaseSpec(object):
                 if isinstance(expression, str):
                     expr.validate(expression)
 
+    def _get_expression_plan(self, prop_name, prop_val):
+        """Gets the expression plan of a specification property.
+
+        The plan is built on first access and then reused by all
+        subsequent evaluations of the property so that the parts of
+        it that don't contain expressions don't need to be scanned again.
+
+        :param prop_name: Property name used as a key of the plan.
+        :param prop_val: Property value the plan is built for.
+        :return: Expression plan.
+        """
+        plans = _EXPR_PLANS.get(self)
+
+        if plans is None:
+            plans = _EXPR_PLANS.setdefault(self, {})
+
+        plan = plans.get(prop_name)
+
+        if plan is None:
+            plan = expr.build_plan(prop_val)
+
+            plans[prop_name] = plan
+
+        return plan
+
+    def _reset_expression_plans(self):
+        _EXPR_PLANS.pop(self, None)
+
     def _spec_property(self, prop_name, spec_cls):
         prop_val = self._data.get(prop_name)
 
@@ -55,14 +55,23 @@ class PublishSpec(base.BaseSpec):
     def get_branch(self):
         return self._branch
 
+    def get_branch_plan(self):
+        return self._get_expression_plan('branch', self._branch)
+
     def get_global(self):
         return self._global
 
+    def get_global_plan(self):
+        return self._get_expression_plan('global', self._global)
+
     def get_atomic(self):
         return self._atomic
 
     def merge(self, spec_to_merge):
         if spec_to_merge:
+            # The merged data needs new expression plans.
+            self._reset_expression_plans()
+
             if spec_to_merge.get_branch():
                 utils.merge_dicts(self._branch, spec_to_merge.get_branch())
             if spec_to_merge.get_global():
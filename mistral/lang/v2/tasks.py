@@ -17,6 +17,7 @@
 import copy
 import json
 import re
+import weakref
 
 from mistral import exceptions as exc
 from mistral import expressions
@@ -40,6 +41,12 @@ WITH_ITEMS_PTRN = re.compile(
     r"\s*([\w\d_\-]+)\s*in\s*(\[.+\]|%s)" % '|'.join(_expr_ptrns)
 )
 
+# {task spec: {state: publish spec}}. Merging publish specs resets their
+# expression plans so they are built once per state. Like expression
+# plans, they are kept outside of specification objects so that they
+# don't get serialized along with them.
+_PUBLISH_SPECS = weakref.WeakKeyDictionary()
+
 MAX_LENGTH_TASK_NAME = 255
 # Length of a join task name must be less than or equal to maximum
 # of task_executions unique_key and named_locks name. Their
@@ -241,6 +248,9 @@ class TaskSpec(base.BaseSpec):
     def get_input(self):
         return self._input
 
+    def get_input_plan(self):
+        return self._get_expression_plan('input', self._input)
+
     def get_with_items(self):
         return self._with_items
 
@@ -251,6 +261,17 @@ class TaskSpec(base.BaseSpec):
         return self._target
 
     def get_publish(self, state):
+        specs = _PUBLISH_SPECS.get(self)
+
+        if specs is None:
+            specs = _PUBLISH_SPECS.setdefault(self, {})
+
+        if state not in specs:
+            specs[state] = self._build_publish(state)
+
+        return specs[state]
+
+    def _build_publish(self, state):
         spec = None
 
         if state == states.SUCCESS and self._publish:
@@ -343,8 +364,8 @@ class DirectWorkflowTaskSpec(TaskSpec):
         [self.validate_expr(t)
             for t in ([val] if isinstance(val, str) else val)]
 
-    def get_publish(self, state):
-        spec = super(DirectWorkflowTaskSpec, self).get_publish(state)
+    def _build_publish(self, state):
+        spec = super(DirectWorkflowTaskSpec, self)._build_publish(state)
 
         if self._on_complete and self._on_complete.get_publish():
             if spec:
@@ -132,12 +132,24 @@ class WorkflowSpec(base.BaseSpec):
     def get_output(self):
         return self._output
 
+    def get_output_plan(self):
+        return self._get_expression_plan('output', self._output)
+
     def get_output_on_error(self):
         return self._output_on_error
 
+    def get_output_on_error_plan(self):
+        return self._get_expression_plan(
+            'output-on-error',
+            self._output_on_error
+        )
+
     def get_vars(self):
         return self._vars
 
+    def get_vars_plan(self):
+        return self._get_expression_plan('vars', self._vars)
+
     def get_task_defaults(self):
         return self._task_defaults
 
@@ -16,6 +16,7 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from mistral_lib import serialization
 from oslo_config import cfg
 from oslo_log import log as logging
 from osprofiler import profiler
@@ -43,6 +44,9 @@ _EVENT_ENGINE_CLIENT_LOCK = threading.Lock()
 _NOTIFIER_CLIENT = None
 _NOTIFIER_CLIENT_LOCK = threading.Lock()
 
+_EXECUTION_WATCHER_CLIENT = None
+_EXECUTION_WATCHER_CLIENT_LOCK = threading.Lock()
+
 
 def cleanup():
     """Clean all the RPC clients.
@@ -56,11 +60,13 @@ def cleanup():
     global _EXECUTOR_CLIENT
     global _EVENT_ENGINE_CLIENT
     global _NOTIFIER_CLIENT
+    global _EXECUTION_WATCHER_CLIENT
 
     _ENGINE_CLIENT = None
     _EXECUTOR_CLIENT = None
     _EVENT_ENGINE_CLIENT = None
     _NOTIFIER_CLIENT = None
+    _EXECUTION_WATCHER_CLIENT = None
 
     base.cleanup()
 
@@ -109,6 +115,17 @@ def get_notifier_client():
     return _NOTIFIER_CLIENT
 
 
+def get_execution_watcher_client():
+    global _EXECUTION_WATCHER_CLIENT
+    global _EXECUTION_WATCHER_CLIENT_LOCK
+
+    with _EXECUTION_WATCHER_CLIENT_LOCK:
+        if not _EXECUTION_WATCHER_CLIENT:
+            _EXECUTION_WATCHER_CLIENT = ExecutionWatcherClient(cfg.CONF.api)
+
+    return _EXECUTION_WATCHER_CLIENT
+
+
 class EngineClient(eng.Engine):
     """RPC Engine client."""
 
@@ -421,6 +438,25 @@ class EngineClient(eng.Engine):
             action_ex_ids=action_ex_ids
         )
 
+    def scheduler_job_available(self, delay):
+        """Notifies all engine schedulers about a persistent job.
+
+        :param delay: Number of seconds after which the job becomes
+            eligible for pickup from the Job Store.
+        """
+
+        LOG.debug(
+            "Send RPC request 'scheduler_job_available'[delay=%s]",
+            delay
+        )
+
+        return self._client.async_call(
+            auth_ctx.ctx(),
+            'scheduler_job_available',
+            delay=delay,
+            fanout=True
+        )
+
 
 class ExecutorClient(exe.Executor):
     """RPC Executor client."""
@@ -472,6 +508,50 @@ class ExecutorClient(exe.Executor):
 
         return rpc_client_method(auth_ctx.ctx(), 'run_action', **rpc_kwargs)
 
+    @profiler.trace('executor-client-run-actions')
+    def run_actions(self, action_requests, redelivered=False):
+        """Sends a request to run several actions to executor.
+
+        Unless batched RPC is enabled, it's a shortcut for sending a
+        separate 'run_action' request for every action.
+
+        :param action_requests: A list of dictionaries describing actions
+            to run, see mistral.executors.base.Executor.run_actions().
+        :param redelivered: Tells if given actions were run before on
+            another executor.
+        """
+        if not cfg.CONF.executor.batched_rpc:
+            return super(ExecutorClient, self).run_actions(
+                action_requests,
+                redelivered=redelivered
+            )
+
+        # The RPC serializer only knows how to serialize the top level
+        # arguments so actions within the list are serialized explicitly.
+        p_serializer = serialization.get_polymorphic_serializer()
+
+        rpc_requests = [
+            {
+                'action': p_serializer.serialize(req['action']),
+                'action_ex_id': req['action_ex_id'],
+                'safe_rerun': req['safe_rerun'],
+                'exec_ctx': req['exec_ctx'],
+                'timeout': req.get('timeout')
+            }
+            for req in action_requests
+        ]
+
+        LOG.info(
+            "Send RPC request 'run_actions' [count=%s]",
+            len(rpc_requests)
+        )
+
+        return self._client.async_call(
+            auth_ctx.ctx(),
+            'run_actions',
+            action_requests=rpc_requests
+        )
+
 
 class EventEngineClient(evt_eng.EventEngine):
     """RPC EventEngine client."""
@@ -539,3 +619,30 @@ class NotifierClient(notif.Notifier):
             )
         except Exception:
             LOG.exception('Unable to send notification.')
+
+
+class ExecutionWatcherClient(object):
+    """RPC client of the execution watchers of API workers."""
+
+    def __init__(self, rpc_conf_dict):
+        self._client = base.get_rpc_client_driver()(rpc_conf_dict)
+
+    def execution_state_changed(self, ex_id, state):
+        """Notifies all API workers about a state change of an execution.
+
+        :param ex_id: Workflow or task execution id.
+        :param state: New state.
+        """
+        LOG.debug(
+            "Send RPC request 'execution_state_changed'[ex_id=%s, state=%s]",
+            ex_id,
+            state
+        )
+
+        return self._client.async_call(
+            auth_ctx.ctx(),
+            'execution_state_changed',
+            ex_id=ex_id,
+            state=state,
+            fanout=True
+        )
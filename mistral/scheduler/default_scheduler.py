@@ -30,6 +30,7 @@ from mistral.db import utils as db_utils
 from mistral.db.v2 import api as db_api
 from mistral import exceptions as exc
 from mistral.scheduler import base
+from mistral.scheduler import job_notifier
 from mistral_lib import utils
 
 
@@ -44,13 +45,31 @@ class DefaultScheduler(base.Scheduler):
 
         :param conf: The "scheduler" configuration group. It provides
             fixed_delay/random_delay (how often the job store is polled),
-            batch_size (how many jobs are picked up per poll) and
-            in_memory_workers (the size of the local execution thread pool).
+            batch_size (how many jobs are picked up per poll),
+            in_memory_workers (the size of the local execution thread pool)
+            and job_notifier/notified_fixed_delay (event driven Job Store
+            checks).
         """
 
         self._fixed_delay = conf.fixed_delay
         self._random_delay = conf.random_delay
         self._batch_size = conf.batch_size
+        self._pickup_job_after = conf.pickup_job_after
+        self._notified_fixed_delay = conf.notified_fixed_delay
+
+        # If a job notifier is configured, every scheduled job tells all
+        # schedulers when it becomes eligible for pickup from the Job Store.
+        # The Job Store checker then sleeps until the earliest of those
+        # moments (or "notified_fixed_delay" at most) instead of polling
+        # every "fixed_delay" seconds. "_store_check_times" is a heap of
+        # monotonic times guarded by "_notify_lock", "_notified_dues" holds
+        # the due seconds already announced by this scheduler so that jobs
+        # becoming eligible within the same second produce one notification.
+        self._job_notifier = job_notifier.get_job_notifier()
+        self._notify_lock = threading.Lock()
+        self._store_check_times = []
+        self._notified_dues = set()
+        self._wakeup = threading.Event()
 
         # In-memory jobs waiting for local execution. "_heap" orders them by
         # execution time for the dispatcher; "in_memory_jobs" maps a job id to
@@ -82,6 +101,9 @@ class DefaultScheduler(base.Scheduler):
     def start(self):
         self._stopped = False
 
+        if self._job_notifier:
+            self._job_notifier.subscribe(self._on_job_available)
+
         self._dispatcher_thread.start()
         self._job_store_checker_thread.start()
 
@@ -95,6 +117,11 @@ class DefaultScheduler(base.Scheduler):
             self.in_memory_jobs = {}
             self._cond.notify_all()
 
+        if self._job_notifier:
+            self._job_notifier.unsubscribe(self._on_job_available)
+
+        self._wakeup.set()
+
         self._executor.shutdown(wait=graceful)
 
         if graceful:
@@ -133,11 +160,13 @@ class DefaultScheduler(base.Scheduler):
                 "Starting Scheduler Job Store checker [scheduler=%s]...", self
             )
 
-            time.sleep(
-                self._fixed_delay +
-                random.Random().randint(
-                    0, int(self._random_delay * 1000)) * 0.001
-            )
+            if self._job_notifier:
+                self._wait_for_store_check()
+            else:
+                time.sleep(self._fixed_delay + self._get_random_delay())
+
+            if self._stopped:
+                return
 
             try:
                 self._process_store_jobs()
@@ -147,38 +176,135 @@ class DefaultScheduler(base.Scheduler):
                     " due to unexpected exception."
                 )
 
+    def _get_random_delay(self):
+        return random.Random().randint(
+            0, int(self._random_delay * 1000)) * 0.001
+
+    def _wait_for_store_check(self):
+        """Waits until the Job Store has to be checked.
+
+        Returns when a notified job becomes eligible for pickup or, at the
+        latest, after "notified_fixed_delay" seconds so that jobs whose
+        notifications were lost are still picked up.
+        """
+        deadline = (
+            time.monotonic() +
+            self._notified_fixed_delay +
+            self._get_random_delay()
+        )
+
+        while not self._stopped:
+            # Clear the event before looking at the heap so that
+            # a notification arriving in between is not missed.
+            self._wakeup.clear()
+
+            now = time.monotonic()
+
+            with self._notify_lock:
+                due = False
+
+                while (self._store_check_times and
+                       self._store_check_times[0] <= now):
+                    heapq.heappop(self._store_check_times)
+
+                    due = True
+
+                wake_at = (
+                    min(deadline, self._store_check_times[0])
+                    if self._store_check_times else deadline
+                )
+
+            if due or now >= deadline:
+                return
+
+            self._wakeup.wait(timeout=wake_at - now)
+
+    def _on_job_available(self, delay):
+        with self._notify_lock:
+            heapq.heappush(self._store_check_times, time.monotonic() + delay)
+
+        self._wakeup.set()
+
+    def _notify_job_available(self, run_after):
+        # "+ 1" accounts for the second resolution of "execute_at" and the
+        # strict comparison used when selecting jobs from the Job Store.
+        delay = run_after + self._pickup_job_after + 1
+
+        now = time.time()
+        due_sec = int(now + delay)
+
+        with self._notify_lock:
+            if due_sec in self._notified_dues:
+                return
+
+            self._notified_dues = {
+                d for d in self._notified_dues if d > now
+            }
+            self._notified_dues.add(due_sec)
+
+        self._job_notifier.notify(delay)
+
     def _process_store_jobs(self):
-        # Select and capture eligible jobs.
+        # Select and capture eligible jobs with a single statement.
         with db_api.transaction():
-            candidate_jobs = db_api.get_scheduled_jobs_to_start(
+            captured_jobs = db_api.capture_scheduled_jobs(
                 utils.utc_now_sec(),
                 self._batch_size
             )
 
-            captured_jobs = [
-                job for job in candidate_jobs
-                if self._capture_scheduled_job(job)
-            ]
+        if not captured_jobs:
+            return
 
-        # Invoke and delete scheduled jobs.
-        for job in captured_jobs:
-            auth_ctx, func, func_args = self._prepare_job(job)
+        # Invoke the jobs concurrently on the pool that also runs
+        # in-memory jobs.
+        job_futures = {}
 
-            self._invoke_job(auth_ctx, func, func_args)
+        with self._cond:
+            # Submitting under the lock guarantees we never submit after
+            # stop() has shut the executor down. Jobs that are not
+            # submitted stay captured in the store and will be recaptured
+            # after "captured_job_timeout".
+            if not self._stopped:
+                for job in captured_jobs:
+                    job_futures[job.id] = self._executor.submit(
+                        self._run_store_job,
+                        job
+                    )
+
+        futures.wait(list(job_futures.values()))
+
+        processed_ids = []
+
+        for job_id, future in job_futures.items():
+            if future.exception():
+                LOG.error(
+                    "Failed to prepare a scheduled job [id=%s]: %s",
+                    job_id,
+                    future.exception()
+                )
+            else:
+                processed_ids.append(job_id)
+
+        # Delete all processed jobs with one statement.
+        if processed_ids:
+            self._delete_scheduled_jobs(processed_ids)
+
+    def _run_store_job(self, scheduled_job):
+        auth_ctx, func, func_args = self._prepare_job(scheduled_job)
 
-            self._delete_scheduled_job(job)
+        self._invoke_job(auth_ctx, func, func_args)
 
     def schedule(self, job):
         scheduled_job = self._persist_job(job)
 
         self._schedule_in_memory(scheduled_job)
 
+        if self._job_notifier:
+            self._notify_job_available(job.run_after)
+
     def has_scheduled_jobs(self, **filters):
         # Checking in-memory jobs first.
-        with self._cond:
-            in_memory_jobs = list(self.in_memory_jobs.values())
-
-        for j in in_memory_jobs:
+        for j in self._get_in_memory_jobs(filters):
             if filters and 'key' in filters and filters['key'] != j.key:
                 continue
 
@@ -195,6 +321,19 @@ class DefaultScheduler(base.Scheduler):
 
         return db_api.get_scheduled_jobs_count(**filters) > 0
 
+    def _get_in_memory_jobs(self, filters):
+        """Returns in-memory jobs that may match the given filters.
+
+        The result is a superset of the matching jobs, the filters are
+        checked again by the caller.
+        """
+        with self._cond:
+            return list(self.in_memory_jobs.values())
+
+    def _forget_in_memory_job(self, scheduled_job):
+        with self._cond:
+            self.in_memory_jobs.pop(scheduled_job.id, None)
+
     @staticmethod
     def _persist_job(job):
         ctx_serializer = context.RpcContextSerializer()
@@ -280,8 +419,7 @@ class DefaultScheduler(base.Scheduler):
         finally:
             # Always forget the in-memory job, even if it couldn't be
             # captured, so that the collection doesn't grow indefinitely.
-            with self._cond:
-                self.in_memory_jobs.pop(scheduled_job.id, None)
+            self._forget_in_memory_job(scheduled_job)
 
     @staticmethod
     def _capture_scheduled_job(scheduled_job):
@@ -319,6 +457,10 @@ class DefaultScheduler(base.Scheduler):
     def _delete_scheduled_job(self, scheduled_job):
         db_api.delete_scheduled_job(scheduled_job.id)
 
+    @db_utils.retry_on_db_error
+    def _delete_scheduled_jobs(self, job_ids):
+        db_api.delete_scheduled_jobs(id={'in': job_ids})
+
     @staticmethod
     def _prepare_job(scheduled_job):
         """Prepares a scheduled job for invocation.
@@ -0,0 +1,135 @@
+# Copyright 2026 - OVHcloud.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import abc
+import threading
+
+from oslo_config import cfg
+from oslo_log import log as logging
+from stevedore import driver
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+_JOB_NOTIFIER = None
+_JOB_NOTIFIER_LOCK = threading.Lock()
+
+
+class JobNotifier(object, metaclass=abc.ABCMeta):
+    """Scheduler job notifier interface.
+
+    Lets schedulers know that a persistent job will become eligible for
+    pickup from the Job Store so that they can check the Job Store right
+    when it happens instead of polling it at a fixed rate.
+    """
+
+    def __init__(self):
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback):
+        """Subscribes to job notifications.
+
+        :param callback: Function accepting one argument, the number of
+            seconds after which a job becomes eligible for pickup.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def dispatch(self, delay):
+        """Passes a received notification to all local subscribers.
+
+        :param delay: Number of seconds after which a job becomes
+            eligible for pickup.
+        """
+        with self._lock:
+            callbacks = list(self._callbacks)
+
+        for callback in callbacks:
+            try:
+                callback(delay)
+            except Exception:
+                LOG.exception(
+                    "Failed to process a scheduler job notification."
+                )
+
+    @abc.abstractmethod
+    def notify(self, delay):
+        """Sends a notification to all schedulers.
+
+        :param delay: Number of seconds after which a job becomes
+            eligible for pickup.
+        """
+        raise NotImplementedError
+
+
+class LocalJobNotifier(JobNotifier):
+    """Delivers notifications only to schedulers of the current process.
+
+    Mostly useful for testing and single process deployments.
+    """
+
+    def notify(self, delay):
+        self.dispatch(delay)
+
+
+class RPCJobNotifier(JobNotifier):
+    """Delivers notifications to all engines with an RPC fanout cast."""
+
+    def notify(self, delay):
+        # Import it here to avoid a circular import.
+        from mistral.rpc import clients as rpc_clients
+
+        try:
+            rpc_clients.get_engine_client().scheduler_job_available(delay)
+        except Exception as e:
+            # The notification is only an optimization, schedulers will
+            # still find the job by polling the Job Store.
+            LOG.warning(
+                "Failed to send a scheduler job notification: %s", e
+            )
+
+
+def get_job_notifier():
+    """Returns the configured job notifier or None if it's disabled."""
+    global _JOB_NOTIFIER
+
+    notifier_type = CONF.scheduler.job_notifier
+
+    if notifier_type == 'none':
+        return None
+
+    with _JOB_NOTIFIER_LOCK:
+        if not _JOB_NOTIFIER:
+            _JOB_NOTIFIER = driver.DriverManager(
+                'mistral.scheduler.job_notifiers',
+                notifier_type,
+                invoke_on_load=True
+            ).driver
+
+    return _JOB_NOTIFIER
+
+
+def cleanup():
+    global _JOB_NOTIFIER
+
+    with _JOB_NOTIFIER_LOCK:
+        _JOB_NOTIFIER = None
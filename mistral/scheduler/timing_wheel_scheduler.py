@@ -0,0 +1,290 @@
+# Copyright 2026 - OVHcloud.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import math
+import threading
+import time
+
+from mistral.scheduler import default_scheduler
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# Every wheel level has 64 slots, a slot of level N spans 64^N ticks.
+# With the default tick of 0.1 seconds four levels cover about 19 days,
+# jobs scheduled further than that are cascaded down when their slot of
+# the top level is visited.
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+
+
+class _WheelShard(object):
+    """A hierarchical timing wheel holding a subset of in-memory jobs.
+
+    All methods must be called with "lock" acquired.
+    """
+
+    def __init__(self, current_tick):
+        self.lock = threading.Lock()
+        self.current_tick = current_tick
+
+        self._levels = [
+            [{} for _ in range(_SLOTS)] for _ in range(_LEVELS)
+        ]
+
+        # Job id -> the slot (dict) the job is currently placed in. Lets
+        # the wheel remove a job in O(1).
+        self._slot_of = {}
+
+        # Job key -> {job id: job}. Contains all jobs known to the shard,
+        # including the ones that already fired and are being processed.
+        self.jobs_by_key = {}
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def add(self, job, expire_tick):
+        self._place(job, max(expire_tick, self.current_tick + 1))
+
+        self.jobs_by_key.setdefault(job.key, {})[job.id] = job
+
+    def remove(self, job):
+        slot = self._slot_of.pop(job.id, None)
+
+        if slot is not None:
+            del slot[job.id]
+
+        jobs = self.jobs_by_key.get(job.key)
+
+        if jobs is not None:
+            jobs.pop(job.id, None)
+
+            if not jobs:
+                del self.jobs_by_key[job.key]
+
+    def clear(self):
+        for level in self._levels:
+            for slot in level:
+                slot.clear()
+
+        self._slot_of.clear()
+        self.jobs_by_key.clear()
+
+    def advance(self, tick):
+        """Moves the wheel forward up to the given tick.
+
+        :return: Jobs whose expiration tick has come.
+        """
+        due = []
+
+        while self.current_tick < tick:
+            if not self._slot_of:
+                # Nothing to fire, skip the idle ticks at once.
+                self.current_tick = tick
+
+                break
+
+            self.current_tick += 1
+
+            t = self.current_tick
+
+            # Cascade higher level slots whose span starts at this tick.
+            for level in range(1, _LEVELS):
+                if t & ((1 << (_SLOT_BITS * level)) - 1):
+                    break
+
+                slot = self._levels[level][(t >> (_SLOT_BITS * level)) &
+                                           _SLOT_MASK]
+
+                entries = list(slot.values())
+
+                slot.clear()
+
+                for expire_tick, job in entries:
+                    del self._slot_of[job.id]
+
+                    if expire_tick <= t:
+                        due.append(job)
+                    else:
+                        self._place(job, expire_tick)
+
+            slot = self._levels[0][t & _SLOT_MASK]
+
+            if slot:
+                for expire_tick, job in slot.values():
+                    del self._slot_of[job.id]
+
+                    due.append(job)
+
+                slot.clear()
+
+        return due
+
+    def _place(self, job, expire_tick):
+        level = _LEVELS - 1
+
+        # Use the lowest level whose current slot span also contains the
+        # expiration tick, this guarantees the job's slot is visited
+        # before the job expires.
+        for lvl in range(_LEVELS - 1):
+            shift = _SLOT_BITS * (lvl + 1)
+
+            if (expire_tick >> shift) == (self.current_tick >> shift):
+                level = lvl
+
+                break
+
+        slot = self._levels[level][
+            (expire_tick >> (_SLOT_BITS * level)) & _SLOT_MASK
+        ]
+
+        slot[job.id] = (expire_tick, job)
+
+        self._slot_of[job.id] = slot
+
+
+class TimingWheelScheduler(default_scheduler.DefaultScheduler):
+    """Scheduler keeping in-memory jobs in hierarchical timing wheels.
+
+    Works as the default scheduler but, instead of a single heap guarded
+    by one lock, pending in-memory jobs are spread across several timing
+    wheels (shards) by job key, each with its own lock. Adding and removing
+    a job is O(1) and looking up jobs by key only touches one shard, which
+    matters for frequent keyed jobs like refreshing task states.
+    """
+
+    def __init__(self, conf):
+        """Initializes a scheduler instance.
+
+        :param conf: The "scheduler" configuration group. In addition to
+            the options used by the default scheduler it provides
+            timing_wheel_tick (the resolution of the wheels, in seconds) and
+            timing_wheel_shards (the number of wheels).
+        """
+        super(TimingWheelScheduler, self).__init__(conf)
+
+        self._tick = conf.timing_wheel_tick
+
+        now_tick = self._get_current_tick()
+
+        self._shards = [
+            _WheelShard(now_tick) for _ in range(conf.timing_wheel_shards)
+        ]
+
+        # Set when a job is added or the scheduler is stopped so that the
+        # dispatcher doesn't tick while there's nothing to run.
+        self._dispatch_event = threading.Event()
+
+    def stop(self, graceful=False):
+        # Make sure the dispatcher doesn't pick up new jobs and wakes up.
+        with self._cond:
+            self._stopped = True
+
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+
+        self._dispatch_event.set()
+
+        super(TimingWheelScheduler, self).stop(graceful)
+
+    def _get_current_tick(self):
+        return int(math.floor(time.time() / self._tick))
+
+    def _get_expire_tick(self, timestamp):
+        return int(math.ceil(timestamp / self._tick))
+
+    def _get_shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def _get_job_shard(self, job):
+        # Keyed jobs are sharded by key so that looking them up by key
+        # needs only one shard. Jobs without a key are spread by id.
+        return self._get_shard(job.key if job.key is not None else job.id)
+
+    def _schedule_in_memory(self, scheduled_job):
+        execute_at = (scheduled_job.execute_at - _EPOCH).total_seconds()
+
+        shard = self._get_job_shard(scheduled_job)
+
+        with shard.lock:
+            shard.add(scheduled_job, self._get_expire_tick(execute_at))
+
+        self._dispatch_event.set()
+
+    def _get_in_memory_jobs(self, filters):
+        key = filters.get('key')
+
+        if key is not None:
+            shards = [self._get_shard(key)]
+        else:
+            shards = self._shards
+
+        jobs = []
+
+        for shard in shards:
+            with shard.lock:
+                if 'key' in filters:
+                    jobs.extend(shard.jobs_by_key.get(key, {}).values())
+                else:
+                    for key_jobs in shard.jobs_by_key.values():
+                        jobs.extend(key_jobs.values())
+
+        return jobs
+
+    def _forget_in_memory_job(self, scheduled_job):
+        shard = self._get_job_shard(scheduled_job)
+
+        with shard.lock:
+            shard.remove(scheduled_job)
+
+    def _dispatcher(self):
+        while not self._stopped:
+            # Clear the event before advancing the wheels so that a job
+            # added in between is not missed.
+            self._dispatch_event.clear()
+
+            now_tick = self._get_current_tick()
+
+            due = []
+            pending = 0
+
+            for shard in self._shards:
+                with shard.lock:
+                    due.extend(shard.advance(now_tick))
+
+                    pending += len(shard)
+
+            if due:
+                with self._cond:
+                    # Submitting under the lock guarantees we never submit
+                    # after stop() has shut the executor down.
+                    if self._stopped:
+                        return
+
+                    for scheduled_job in due:
+                        self._executor.submit(
+                            self._process_memory_job,
+                            scheduled_job
+                        )
+
+            if pending:
+                self._dispatch_event.wait(
+                    timeout=max(0, (now_tick + 1) * self._tick - time.time())
+                )
+            else:
+                self._dispatch_event.wait()
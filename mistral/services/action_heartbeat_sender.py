@@ -29,7 +29,15 @@ CONF = cfg.CONF
 _enabled = False
 _stopped = True
 
+# All running actions and the ones started since the last heartbeats were
+# sent. Both sets are guarded by "_lock".
 _running_actions = set()
+_new_actions = set()
+_lock = threading.Lock()
+
+# Set when there are enough new actions to send their heartbeats right
+# away or when the sender is stopped.
+_flush_event = threading.Event()
 
 
 def add_action(action_ex_id):
@@ -37,27 +45,49 @@ def add_action(action_ex_id):
 
     # With run-action there is no actions_ex_id assigned.
     if action_ex_id and _enabled:
-        rpc.get_engine_client().process_action_heartbeats([action_ex_id])
+        with _lock:
+            _running_actions.add(action_ex_id)
+            _new_actions.add(action_ex_id)
+
+            new_count = len(_new_actions)
 
-        _running_actions.add(action_ex_id)
+        if new_count >= CONF.action_heartbeat.flush_batch_size:
+            _flush_event.set()
 
 
 def remove_action(action_ex_id):
     global _enabled
 
     if action_ex_id and _enabled:
-        _running_actions.discard(action_ex_id)
+        with _lock:
+            _running_actions.discard(action_ex_id)
+            _new_actions.discard(action_ex_id)
+
+
+def send_new_action_heartbeats():
+    """Sends the first heartbeats of the recently started actions."""
+    with _lock:
+        action_ex_ids = list(_new_actions)
+
+        _new_actions.clear()
+
+    if action_ex_ids:
+        rpc.get_engine_client().process_action_heartbeats(action_ex_ids)
 
 
 def send_action_heartbeats():
     LOG.debug('Running heartbeat sender...')
 
-    global _running_actions
+    with _lock:
+        action_ex_ids = list(_running_actions)
 
-    if not _running_actions:
+        # New actions are covered too.
+        _new_actions.clear()
+
+    if not action_ex_ids:
         return
 
-    rpc.get_engine_client().process_action_heartbeats(_running_actions)
+    rpc.get_engine_client().process_action_heartbeats(action_ex_ids)
 
 
 def _loop():
@@ -74,16 +104,34 @@ def _loop():
         )
     )
 
+    next_heartbeats_at = time.monotonic()
+
     while not _stopped:
+        # Clear the event before sending so that a flush requested in
+        # between is not missed.
+        _flush_event.clear()
+
         try:
-            send_action_heartbeats()
+            if time.monotonic() >= next_heartbeats_at:
+                send_action_heartbeats()
+
+                next_heartbeats_at = (
+                    time.monotonic() + CONF.action_heartbeat.check_interval
+                )
+            else:
+                send_new_action_heartbeats()
         except Exception:
             LOG.exception(
                 'Action heartbeat sender iteration failed'
                 ' due to an unexpected exception.'
             )
 
-        time.sleep(CONF.action_heartbeat.check_interval)
+        _flush_event.wait(
+            min(
+                CONF.action_heartbeat.flush_interval,
+                max(0, next_heartbeats_at - time.monotonic())
+            )
+        )
 
 
 def start():
@@ -108,3 +156,5 @@ def stop(graceful=False):
     global _stopped
 
     _stopped = True
+
+    _flush_event.set()
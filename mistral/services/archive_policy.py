@@ -0,0 +1,127 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+
+from oslo_config import cfg
+from oslo_log import log as logging
+from oslo_service import periodic_task
+from oslo_service import threadgroup
+from oslo_utils import timeutils
+
+from mistral import context as auth_ctx
+from mistral.db.v2 import api as db_api
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+
+class ExecutionArchivePolicy(periodic_task.PeriodicTasks):
+    """Archive policy task.
+
+    This task runs every 'evaluation_interval' minutes and moves root
+    workflow executions finished more than 'older_than' minutes ago,
+    along with all their nested executions, to the archive table. By
+    default the interval is not set so this task is disabled.
+    """
+
+    def __init__(self, conf):
+        super(ExecutionArchivePolicy, self).__init__(conf)
+
+        interval = CONF.execution_archive_policy.evaluation_interval
+        older_than = CONF.execution_archive_policy.older_than
+
+        if interval and older_than:
+            _periodic_task = periodic_task.periodic_task(
+                spacing=interval * 60,
+                run_immediately=True
+            )
+
+            self.add_periodic_task(
+                _periodic_task(run_execution_archive_policy)
+            )
+        else:
+            LOG.debug(
+                "Archive policy disabled. Evaluation_interval or "
+                "older_than is not configured."
+            )
+
+
+def archive_executions(archive_time, batch_size):
+    """Moves root executions finished before the given time to the archive.
+
+    Every batch of root executions is archived by a separate transaction.
+
+    :return: The number of archived executions, nested ones included.
+    """
+    marker = None
+    count = 0
+
+    while True:
+        with db_api.transaction():
+            keys = db_api.get_completed_root_execution_keys(
+                updated_before=archive_time,
+                marker=marker,
+                limit=batch_size,
+                ignored_states=[]
+            )
+
+            if not keys:
+                break
+
+            count += db_api.archive_execution_trees([k.id for k in keys])
+
+        marker = (keys[-1].updated_at, keys[-1].id)
+
+        LOG.debug("Archived %s root executions", len(keys))
+
+    return count
+
+
+def run_execution_archive_policy(self, ctx):
+    LOG.debug("Starting archive policy.")
+
+    older_than = CONF.execution_archive_policy.older_than
+    archive_time = (
+        timeutils.utcnow() - datetime.timedelta(minutes=older_than)
+    )
+
+    count = archive_executions(
+        archive_time,
+        CONF.execution_archive_policy.batch_size
+    )
+
+    LOG.info("Archive policy moved %s executions to the archive", count)
+
+
+def setup():
+    tg = threadgroup.ThreadGroup()
+    pt = ExecutionArchivePolicy(CONF)
+
+    ctx = auth_ctx.MistralContext(
+        user_id=None,
+        project_id=None,
+        auth_token=None,
+        is_admin=True
+    )
+
+    tg.add_dynamic_timer(
+        pt.run_periodic_tasks,
+        initial_delay=None,
+        periodic_interval_max=1,
+        context=ctx
+    )
+
+    return tg
@@ -0,0 +1,318 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import abc
+import contextlib
+import threading
+
+from oslo_config import cfg
+from oslo_log import log as logging
+from stevedore import driver
+
+from mistral import context as auth_ctx
+from mistral.engine import post_tx_queue
+from mistral import exceptions as exc
+from mistral.rpc import base as rpc_base
+from mistral.workflow import states
+
+
+LOG = logging.getLogger(__name__)
+
+CONF = cfg.CONF
+
+_EXECUTION_WATCHER = None
+_EXECUTION_WATCHER_LOCK = threading.Lock()
+
+_WATCHERS_COUNT = 0
+_WATCHERS_COUNT_LOCK = threading.Lock()
+
+
+class _Subscription(object):
+    def __init__(self):
+        self._states = []
+        self._cond = threading.Condition()
+
+    def add_state(self, state):
+        with self._cond:
+            self._states.append(state)
+
+            self._cond.notify_all()
+
+    def wait(self, state, timeout):
+        """Waits until a state other than the given one is received.
+
+        :return: True if another state was received before the timeout.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: any(s != state for s in self._states),
+                timeout
+            )
+
+
+class ExecutionWatcher(object, metaclass=abc.ABCMeta):
+    """Execution watcher interface.
+
+    Lets API requests wait for the state changes of workflow and task
+    executions that engines report, without querying the database in
+    a loop. All waiting requests of a process share the subscriptions
+    of one watcher.
+    """
+
+    def __init__(self):
+        self._subscriptions = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def subscribe(self, ex_id):
+        """Subscribes to the state changes of an execution.
+
+        :param ex_id: Workflow or task execution id.
+        :return: Context manager returning the subscription.
+        """
+        sub = _Subscription()
+
+        with self._lock:
+            self._subscriptions.setdefault(ex_id, set()).add(sub)
+
+        try:
+            yield sub
+        finally:
+            with self._lock:
+                subs = self._subscriptions[ex_id]
+
+                subs.discard(sub)
+
+                if not subs:
+                    del self._subscriptions[ex_id]
+
+    def dispatch(self, ex_id, state):
+        """Passes a received state change to all local subscribers.
+
+        :param ex_id: Workflow or task execution id.
+        :param state: New state.
+        """
+        with self._lock:
+            subs = list(self._subscriptions.get(ex_id, ()))
+
+        for sub in subs:
+            sub.add_state(state)
+
+    @abc.abstractmethod
+    def notify(self, ex_id, state):
+        """Sends a state change to all API workers.
+
+        :param ex_id: Workflow or task execution id.
+        :param state: New state.
+        """
+        raise NotImplementedError
+
+    def stop(self):
+        pass
+
+
+class LocalExecutionWatcher(ExecutionWatcher):
+    """Delivers state changes only to requests of the current process.
+
+    Mostly useful for testing and single process deployments.
+    """
+
+    def notify(self, ex_id, state):
+        self.dispatch(ex_id, state)
+
+
+class _RPCEndpoint(object):
+    def __init__(self, watcher):
+        self._watcher = watcher
+
+    def execution_state_changed(self, rpc_ctx, ex_id, state):
+        LOG.debug(
+            "Received RPC request 'execution_state_changed'"
+            "[ex_id=%s, state=%s]",
+            ex_id,
+            state
+        )
+
+        self._watcher.dispatch(ex_id, state)
+
+
+class RPCExecutionWatcher(ExecutionWatcher):
+    """Delivers state changes to all API workers with RPC fanout casts.
+
+    An API worker starts listening to them when a request waits for
+    the first time.
+    """
+
+    def __init__(self):
+        super(RPCExecutionWatcher, self).__init__()
+
+        self._rpc_server = None
+        self._rpc_server_lock = threading.Lock()
+
+    def _start_rpc_server(self):
+        with self._rpc_server_lock:
+            if self._rpc_server:
+                return
+
+            # All API workers may have the same server name since only
+            # fanout casts are sent to them.
+            rpc_server = rpc_base.get_rpc_server_driver()(CONF.api)
+            rpc_server.register_endpoint(_RPCEndpoint(self))
+            rpc_server.run(executor='threading')
+
+            self._rpc_server = rpc_server
+
+    def subscribe(self, ex_id):
+        self._start_rpc_server()
+
+        return super(RPCExecutionWatcher, self).subscribe(ex_id)
+
+    def notify(self, ex_id, state):
+        # Import it here to avoid a circular import.
+        from mistral.rpc import clients as rpc_clients
+
+        try:
+            rpc_clients.get_execution_watcher_client().execution_state_changed(
+                ex_id,
+                state
+            )
+        except Exception as e:
+            # Waiting requests still get the execution after their timeout.
+            LOG.warning(
+                "Failed to send an execution state change notification: %s",
+                e
+            )
+
+    def stop(self):
+        with self._rpc_server_lock:
+            if self._rpc_server:
+                self._rpc_server.stop()
+
+                self._rpc_server = None
+
+
+def get_execution_watcher():
+    """Returns the configured execution watcher or None if it's disabled."""
+    global _EXECUTION_WATCHER
+
+    watcher_type = CONF.api.execution_watcher
+
+    if watcher_type == 'none':
+        return None
+
+    with _EXECUTION_WATCHER_LOCK:
+        if not _EXECUTION_WATCHER:
+            _EXECUTION_WATCHER = driver.DriverManager(
+                'mistral.execution_watchers',
+                watcher_type,
+                invoke_on_load=True
+            ).driver
+
+    return _EXECUTION_WATCHER
+
+
+def cleanup():
+    global _EXECUTION_WATCHER
+
+    with _EXECUTION_WATCHER_LOCK:
+        if _EXECUTION_WATCHER:
+            _EXECUTION_WATCHER.stop()
+
+        _EXECUTION_WATCHER = None
+
+
+def notify_state_change(ex_id, state):
+    """Notifies the API workers about a state change of an execution.
+
+    The notification is sent once the current transaction is committed
+    so that the waiting requests read the new state. Only the last state
+    set within the transaction is sent.
+
+    :param ex_id: Workflow or task execution id.
+    :param state: New state.
+    """
+    watcher = get_execution_watcher()
+
+    if not watcher:
+        return
+
+    post_tx_queue.register_operation(
+        watcher.notify,
+        args=[ex_id, state],
+        key=('execution_state_change', ex_id)
+    )
+
+
+@contextlib.contextmanager
+def _watcher_slot():
+    global _WATCHERS_COUNT
+
+    # Waiting requests hold a thread of the WSGI server, their number is
+    # capped so that the server still has threads for other requests.
+    with _WATCHERS_COUNT_LOCK:
+        if _WATCHERS_COUNT >= CONF.api.max_watchers:
+            raise exc.TooManyRequestsException(
+                "Too many requests are waiting for state changes, the "
+                "limit is %s." % CONF.api.max_watchers
+            )
+
+        _WATCHERS_COUNT += 1
+
+    try:
+        yield
+    finally:
+        with _WATCHERS_COUNT_LOCK:
+            _WATCHERS_COUNT -= 1
+
+
+def wait_for_state_change(ex_id, get_state, timeout=None):
+    """Waits until the state of an execution changes.
+
+    It returns at once if the execution is completed or doesn't exist.
+    The database sessions of the request use the primary database from
+    then on since a replica may not have the new state yet.
+
+    :param ex_id: Workflow or task execution id.
+    :param get_state: Function returning the current state of the
+        execution or None if it doesn't exist. It's called once the
+        subscription is made so that no change is missed.
+    :param timeout: Max number of seconds to wait, at most
+        [api] max_watch_timeout.
+    :return: True if the state changed.
+    :raises TooManyRequestsException: If [api] max_watchers requests
+        are already waiting.
+    """
+    watcher = get_execution_watcher()
+
+    if not watcher:
+        raise exc.NotAllowedException(
+            "Waiting for state changes is not enabled."
+        )
+
+    max_timeout = CONF.api.max_watch_timeout
+
+    timeout = max_timeout if timeout is None else min(timeout, max_timeout)
+
+    if auth_ctx.has_ctx():
+        auth_ctx.ctx().use_db_reader = False
+
+    with watcher.subscribe(ex_id) as sub:
+        state = get_state()
+
+        if state is None or states.is_completed(state):
+            return False
+
+        # Only requests which really wait hold a slot.
+        with _watcher_slot():
+            return sub.wait(state, max(timeout, 0))
@@ -12,7 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import copy
 import datetime
+import time
 import traceback
 
 from oslo_config import cfg
@@ -29,6 +31,8 @@ LOG = logging.getLogger(__name__)
 
 CONF = cfg.CONF
 
+_PURGE_STATS = None
+
 
 class ExecutionExpirationPolicy(periodic_task.PeriodicTasks):
     """Expiration Policy task.
@@ -115,6 +119,146 @@ def _delete(executions):
             auth_ctx.set_ctx(None)
 
 
+def _get_empty_purge_stats():
+    return {
+        'runs': 0,
+        'purged_root_executions': 0,
+        'deleted_workflow_executions': 0,
+        'deleted_task_executions': 0,
+        'deleted_action_executions': 0,
+        'last_run': None
+    }
+
+
+def get_purge_stats():
+    """Returns progress metrics of the bulk purge.
+
+    Totals are updated after every transaction so they also show the
+    progress of a run in flight. "last_run" describes the last finished
+    run, its "completed" field is False if the run was stopped by the time
+    budget.
+    """
+    return copy.deepcopy(_PURGE_STATS)
+
+
+def reset_purge_stats():
+    global _PURGE_STATS
+
+    _PURGE_STATS = _get_empty_purge_stats()
+
+
+reset_purge_stats()
+
+
+def _update_purge_stats(deleted, run_stats):
+    for ex_type, count in deleted.items():
+        _PURGE_STATS['deleted_%s_executions' % ex_type] += count
+
+    run_stats['deleted_rows'] += sum(deleted.values())
+
+
+def _purge_roots(fetch_keys, deadline, run_stats):
+    """Deletes root executions returned by fetch_keys with their children.
+
+    :return: False if the time budget is exhausted, True otherwise.
+    """
+    policy_conf = CONF.execution_expiration_policy
+
+    rows_per_tx = policy_conf.bulk_purge_rows_per_transaction
+    batch_size = policy_conf.batch_size or rows_per_tx
+
+    marker = None
+
+    while True:
+        with db_api.transaction():
+            keys = fetch_keys(marker, batch_size)
+
+        if not keys:
+            return True
+
+        root_ids = [k.id for k in keys]
+
+        # The trees of completed executions don't grow anymore so they
+        # are resolved once and then deleted in chunks, leaves first.
+        with db_api.transaction():
+            nodes = db_api.get_execution_trees_nodes(root_ids)
+
+        for i in range(0, len(nodes), rows_per_tx):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+            with db_api.transaction():
+                deleted = db_api.delete_execution_nodes(
+                    nodes[i:i + rows_per_tx]
+                )
+
+            _update_purge_stats(deleted, run_stats)
+
+            LOG.debug("Bulk purge deleted executions: %s", deleted)
+
+        _PURGE_STATS['purged_root_executions'] += len(root_ids)
+        run_stats['purged_root_executions'] += len(root_ids)
+
+        LOG.info(
+            "Bulk purge progress [purged_root_executions=%s, "
+            "deleted_rows=%s]",
+            run_stats['purged_root_executions'],
+            run_stats['deleted_rows']
+        )
+
+        marker = (keys[-1].updated_at, keys[-1].id)
+
+
+def _bulk_purge(expiration_time, max_finished_executions):
+    budget = CONF.execution_expiration_policy.bulk_purge_time_budget
+
+    started = time.monotonic()
+    deadline = started + budget if budget else None
+
+    run_stats = {'purged_root_executions': 0, 'deleted_rows': 0}
+
+    completed = _purge_roots(
+        lambda marker, limit: db_api.get_completed_root_execution_keys(
+            updated_before=expiration_time,
+            marker=marker,
+            limit=limit
+        ),
+        deadline,
+        run_stats
+    )
+
+    if completed and max_finished_executions:
+        with db_api.transaction():
+            max_key = db_api.get_superfluous_executions_max_key(
+                max_finished_executions
+            )
+
+        if max_key:
+            completed = _purge_roots(
+                lambda marker, limit: db_api.get_completed_root_execution_keys(
+                    max_key=tuple(max_key),
+                    marker=marker,
+                    limit=limit
+                ),
+                deadline,
+                run_stats
+            )
+
+    run_stats['completed'] = completed
+    run_stats['duration'] = time.monotonic() - started
+
+    _PURGE_STATS['runs'] += 1
+    _PURGE_STATS['last_run'] = run_stats
+
+    if not completed:
+        LOG.info(
+            "Bulk purge stopped, the time budget is exhausted. The "
+            "remaining executions will be deleted by the next run."
+        )
+
+    LOG.info("Bulk purge finished: %s", run_stats)
+
+
 def run_execution_expiration_policy(self, ctx):
     LOG.debug("Starting expiration policy.")
 
@@ -124,6 +268,11 @@ def run_execution_expiration_policy(self, ctx):
     batch_size = CONF.execution_expiration_policy.batch_size
     max_executions = CONF.execution_expiration_policy.max_finished_executions
 
+    if CONF.execution_expiration_policy.bulk_purge:
+        _bulk_purge(exp_time, max_executions)
+
+        return
+
     # The default value of batch size is 0
     # If it is not set, size of batch will be the size
     # of total number of expired executions.
@@ -12,12 +12,15 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import asyncio
 import json
+import threading
 from unittest import mock
 
 import requests
 
 from mistral.actions import std_actions as std
+from mistral import exceptions as exc
 from mistral.tests.unit import base
 from mistral_lib import actions as mistral_lib_actions
 
@@ -272,3 +275,73 @@ class HTTPActionTest(base.BaseTest):
         msg = "Response body hidden due to action_logging configuration."
         self.assertNotIn(sensitive_data, log)
         self.assertIn(msg, log)
+
+    def test_http_action_supports_async_only_with_aiohttp(self):
+        action = std.HTTPAction(url=URL, method='GET')
+
+        with mock.patch.object(std, '_AIOHTTP', None):
+            self.assertFalse(action.supports_async())
+
+        with mock.patch.object(std, '_AIOHTTP', mock.Mock()):
+            self.assertTrue(action.supports_async())
+
+    @mock.patch.object(std, '_AIOHTTP', mock.Mock())
+    def test_http_action_subclass_supports_async(self):
+        class _SyncHTTPAction(std.HTTPAction):
+            def run(self, context):
+                return super(_SyncHTTPAction, self).run(context)
+
+        class _PlainHTTPAction(std.HTTPAction):
+            pass
+
+        # run() of subclasses must not be bypassed.
+        self.assertFalse(
+            _SyncHTTPAction(url=URL, method='GET').supports_async()
+        )
+        self.assertTrue(
+            _PlainHTTPAction(url=URL, method='GET').supports_async()
+        )
+        self.assertTrue(
+            std.MistralHTTPAction(url=URL, method='GET').supports_async()
+        )
+
+    @mock.patch.object(std, '_get_aiohttp_session')
+    @mock.patch.object(std, '_AIOHTTP', mock.Mock())
+    def test_http_action_async_validates_request_off_the_loop(self, session):
+        action = std.HTTPAction(url=URL, method='GET')
+
+        threads = []
+
+        def _validate():
+            threads.append(threading.current_thread())
+
+        session.return_value.request = mock.AsyncMock(
+            side_effect=ValueError('boom')
+        )
+
+        async def _run():
+            threads.append(threading.current_thread())
+
+            await action.run_async(mock.MagicMock())
+
+        with mock.patch.object(action, '_validate_and_log_request', _validate):
+            self.assertRaises(exc.ActionException, asyncio.run, _run())
+
+        # Host name resolution doesn't block the event loop thread.
+        self.assertEqual(2, len(threads))
+        self.assertIsNot(threads[0], threads[1])
+
+    def test_close_aiohttp_session(self):
+        session = mock.Mock(close=mock.AsyncMock())
+
+        async def _run():
+            loop = asyncio.get_running_loop()
+
+            with mock.patch.dict(std._AIOHTTP_SESSIONS, {loop: session}):
+                await std.close_aiohttp_session()
+
+                self.assertNotIn(loop, std._AIOHTTP_SESSIONS)
+
+        asyncio.run(_run())
+
+        session.close.assert_awaited_once_with()
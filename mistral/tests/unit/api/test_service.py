@@ -42,6 +42,7 @@ class TestWSGIService(base.BaseTest):
                 bind_addr=('0.0.0.0', 8989),
                 wsgi_app=test_service.app,
                 server_name=service_name,
+                numthreads=10
             )
 
     def test_workers_set_correct_setting(self):
@@ -88,7 +89,8 @@ class TestWSGIService(base.BaseTest):
             wsgi_server.assert_called_once_with(
                 server_name=service_name,
                 wsgi_app=test_service.app,
-                bind_addr=('0.0.0.0', 8989)
+                bind_addr=('0.0.0.0', 8989),
+                numthreads=10
             )
 
             mock_ssl_adapter.assert_called_once_with(
@@ -231,6 +231,34 @@ class TestActionExecutionsController(base.APITest):
         self.assertEqual(200, resp.status_int)
         self.assertDictEqual(action_exec, resp.json)
 
+    def test_get_archived(self):
+        wf_ex = db_api.create_workflow_execution(
+            {'name': 'flow', 'state': states.SUCCESS}
+        )
+
+        db_api.create_task_execution(
+            {'id': '333', 'name': 'task1', 'workflow_execution_id': wf_ex.id}
+        )
+
+        action_ex_values = dict(ACTION_EX_DB.iter_columns())
+
+        db_api.create_action_execution(action_ex_values)
+
+        db_api.archive_execution_trees([wf_ex.id])
+
+        resp = self.app.get('/v2/action_executions/123')
+
+        action_exec = copy.deepcopy(ACTION_EX)
+        del action_exec['task_name']
+
+        self.assertEqual(200, resp.status_int)
+        self.assertLessEqual(action_exec.items(), resp.json.items())
+
+        resp = self.app.get('/v2/action_executions/123?fields=name')
+
+        self.assertEqual(200, resp.status_int)
+        self.assertDictEqual({'id': '123', 'name': 'std.echo'}, resp.json)
+
     @mock.patch('mistral.db.v2.api.get_action_execution')
     def test_get_with_fields_filter(self, mocked_get):
         mocked_get.return_value = (ACTION_EX['id'], ACTION_EX['name'],)
@@ -571,6 +599,50 @@ class TestActionExecutionsController(base.APITest):
 
         self.assertEqual(200, resp.status_int)
 
+    def test_get_all_ndjson(self):
+        wf_ex = db_api.create_workflow_execution(
+            {'name': 'flow', 'state': states.RUNNING}
+        )
+
+        task_ex = db_api.create_task_execution(
+            {'name': 'task1', 'workflow_execution_id': wf_ex.id}
+        )
+
+        for i in range(3):
+            db_api.create_action_execution(
+                {
+                    'name': 'std.echo',
+                    'task_execution_id': task_ex.id,
+                    'state': states.SUCCESS,
+                    'output': {'result': i}
+                }
+            )
+
+        self.override_config('stream_page_size', 2, group='api')
+
+        headers = {'Accept': 'application/x-ndjson'}
+
+        for url in (
+                '/v2/action_executions',
+                '/v2/tasks/%s/action_executions' % task_ex.id):
+            resp = self.app.get(url, headers=headers)
+
+            self.assertEqual(200, resp.status_int)
+            self.assertEqual('application/x-ndjson', resp.content_type)
+
+            lines = [json.loads(line) for line in resp.text.splitlines()]
+
+            self.assertEqual(3, len(lines))
+            # Lines are sorted by ID when they were created at the
+            # same time.
+            self.assertEqual(
+                sorted(
+                    self.app.get(url).json['action_executions'],
+                    key=lambda a: (a['created_at'], a['id'])
+                ),
+                lines
+            )
+
     @mock.patch.object(db_api, 'get_action_executions', MOCK_ACTIONS)
     def test_get_all(self):
         resp = self.app.get('/v2/action_executions')
@@ -12,6 +12,9 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+from unittest import mock
+
+from mistral.api.controllers.v2 import execution_report
 from mistral.services import workbooks as wb_service
 from mistral.services import workflows as wf_service
 from mistral.tests.unit.api import base
@@ -216,6 +219,55 @@ class TestExecutionReportController(base.APITest, engine_base.EngineTestCase):
         self.assertEqual(2, stat['success_tasks_count'])
         self.assertEqual(4, stat['total_tasks_count'])
 
+    def test_nested_wf_loaded_in_batches(self):
+        wb_text = """---
+        version: '2.0'
+
+        name: wb
+
+        workflows:
+          parent_wf:
+            tasks:
+              task1:
+                with-items: i in [1, 2, 3]
+                workflow: sub_wf
+
+          sub_wf:
+            tasks:
+              task1:
+                action: std.noop
+                on-success: task2
+
+              task2:
+                action: std.noop
+        """
+
+        wb_service.create_workbook_v2(wb_text)
+
+        wf_ex = self.engine.start_workflow('wb.parent_wf')
+
+        self.await_workflow_success(wf_ex.id)
+
+        resp = self.app.get('/v2/executions/%s/report' % wf_ex.id)
+
+        self.assertEqual(200, resp.status_int)
+
+        task1 = resp.json['root_workflow_execution']['task_executions'][0]
+
+        self.assertEqual(3, len(task1['workflow_executions']))
+
+        for sub_wf_ex in task1['workflow_executions']:
+            self.assertEqual(2, len(sub_wf_ex['task_executions']))
+
+        self.assertEqual(7, resp.json['statistics']['success_tasks_count'])
+
+        with mock.patch.object(execution_report, 'ENTRY_QUERY_BATCH_SIZE', 2):
+            batched_resp = self.app.get(
+                '/v2/executions/%s/report' % wf_ex.id
+            )
+
+        self.assertEqual(resp.json, batched_resp.json)
+
     def test_statistics_only(self):
         wb_text = """---
         version: '2.0'
@@ -269,6 +321,30 @@ class TestExecutionReportController(base.APITest, engine_base.EngineTestCase):
 
         self.assertNotIn('root_workflow_execution', resp.json)
 
+        # Only the failed tasks and the tasks of failed subworkflows.
+        resp = self.app.get(
+            '/v2/executions/%s/report?statistics_only=True&errors_only=True'
+            % wf_ex.id
+        )
+
+        stat = resp.json['statistics']
+
+        self.assertEqual(2, stat['error_tasks_count'])
+        self.assertEqual(0, stat['success_tasks_count'])
+        self.assertEqual(2, stat['total_tasks_count'])
+
+        # Only the tasks of the root execution.
+        resp = self.app.get(
+            '/v2/executions/%s/report?statistics_only=True&max_depth=0'
+            % wf_ex.id
+        )
+
+        stat = resp.json['statistics']
+
+        self.assertEqual(1, stat['error_tasks_count'])
+        self.assertEqual(1, stat['success_tasks_count'])
+        self.assertEqual(2, stat['total_tasks_count'])
+
     def test_estimated_time(self):
         wf_text = """---
         version: '2.0'
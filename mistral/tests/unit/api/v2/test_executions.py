@@ -19,6 +19,7 @@
 import copy
 import datetime
 import json
+import threading
 from unittest import mock
 
 from oslo_config import cfg
@@ -30,14 +31,17 @@ from webtest import app as webtest_app
 from mistral.api.controllers.v2 import execution
 from mistral.api.controllers.v2 import resources
 from mistral import context
+from mistral.db.sqlalchemy import base as db_base
 from mistral.db.v2 import api as db_api
 from mistral.db.v2.sqlalchemy import api as sql_db_api
 from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral.rpc import base as rpc_base
 from mistral.rpc import clients as rpc_clients
+from mistral.services import execution_watcher
 from mistral.tests.unit.api import base
 from mistral.tests.unit import base as unit_base
+from mistral.utils import cursor_utils
 from mistral.utils import rest_utils
 from mistral.workflow import states
 from mistral_lib import utils
@@ -218,6 +222,46 @@ class TestExecutionsController(base.APITest):
 
         self.assertEqual(404, resp.status_int)
 
+    def test_get_archived(self):
+        values = dict(WF_EX.iter_columns())
+        values['state'] = states.SUCCESS
+
+        db_api.create_workflow_execution(values)
+        db_api.archive_execution_trees([WF_EX.id])
+
+        self.assertRaises(
+            exc.DBEntityNotFoundError,
+            db_api.get_workflow_execution,
+            WF_EX.id
+        )
+
+        resp = self.app.get('/v2/executions/%s' % WF_EX.id)
+
+        self.assertEqual(200, resp.status_int)
+
+        expected = WF_EX_JSON_WITH_DESC.copy()
+        expected['state'] = states.SUCCESS
+        expected['published_global'] = '{}'
+        expected['project_id'] = unit_base.get_context().project_id
+        expected.update(
+            root_execution_id=None,
+            tags=None,
+            task_execution_id=None,
+            workflow_namespace=None
+        )
+
+        self.assertDictEqual(expected, resp.json)
+
+        resp = self.app.get(
+            '/v2/executions/%s?fields=description' % WF_EX.id
+        )
+
+        self.assertEqual(200, resp.status_int)
+        self.assertDictEqual(
+            {'id': WF_EX.id, 'description': WF_EX.description},
+            resp.json
+        )
+
     @mock.patch.object(db_api, 'get_workflow_execution',
                        return_value=WF_EX_WITH_PROJECT_ID)
     def test_get_within_project_id(self, mock_get):
@@ -803,6 +847,337 @@ class TestExecutionsController(base.APITest):
 
         self.assertEqual(404, resp.status_int)
 
+    @mock.patch.object(rest_utils, '_RESPONSE_CACHE', None)
+    def test_get_cached(self):
+        self.override_config('response_cache_size', 10, group='api')
+
+        wf_ex = db_api.create_workflow_execution(
+            {
+                'name': 'flow',
+                'state': states.SUCCESS,
+                'output': {'result': 'value'},
+                'spec': {},
+                'context': {},
+                'created_at': (
+                    utils.utc_now_sec() - datetime.timedelta(minutes=1)
+                )
+            }
+        )
+
+        url = '/v2/executions/%s' % wf_ex.id
+
+        resp = self.app.get(url)
+
+        self.assertEqual(200, resp.status_int)
+        self.assertEqual('application/json', resp.content_type)
+        self.assertEqual({'result': 'value'}, json.loads(resp.json['output']))
+
+        etag = resp.headers['ETag']
+
+        with mock.patch.object(
+            db_api,
+            'get_workflow_execution',
+            wraps=db_api.get_workflow_execution
+        ) as get_mock:
+            resp = self.app.get(url, headers={'If-None-Match': etag})
+
+            self.assertEqual(304, resp.status_int)
+            self.assertEqual(etag, resp.headers['ETag'])
+
+            resp = self.app.get(url)
+
+            self.assertEqual(200, resp.status_int)
+            self.assertEqual(
+                {'result': 'value'},
+                json.loads(resp.json['output'])
+            )
+
+            get_mock.assert_not_called()
+
+        # The API request cleared the context.
+        context.set_ctx(self.ctx)
+
+        db_api.update_workflow_execution(wf_ex.id, {'output': {'a': 1}})
+
+        # The execution has just changed so a new update may happen within
+        # the same second without changing its update time.
+        resp = self.app.get(url, headers={'If-None-Match': etag})
+
+        self.assertEqual(200, resp.status_int)
+        self.assertNotIn('ETag', resp.headers)
+        self.assertEqual({'a': 1}, json.loads(resp.json['output']))
+
+    def test_get_wait_for_state_change(self):
+        self.override_config('execution_watcher', 'local', group='api')
+
+        self.addCleanup(execution_watcher.cleanup)
+
+        wf_ex = db_api.create_workflow_execution(
+            {
+                'name': 'flow',
+                'state': states.RUNNING,
+                'spec': {},
+                'context': {}
+            }
+        )
+
+        def _complete():
+            context.set_ctx(self.ctx)
+
+            db_api.update_workflow_execution(
+                wf_ex.id,
+                {'state': states.SUCCESS}
+            )
+
+            execution_watcher.get_execution_watcher().dispatch(
+                wf_ex.id,
+                states.SUCCESS
+            )
+
+        t = threading.Timer(0.1, _complete)
+        t.start()
+
+        self.addCleanup(t.join)
+
+        resp = self.app.get(
+            '/v2/executions/%s?wait_for_state_change=true&timeout=10' %
+            wf_ex.id
+        )
+
+        self.assertEqual(200, resp.status_int)
+        self.assertEqual(states.SUCCESS, resp.json['state'])
+
+    def test_get_wait_for_state_change_not_enabled(self):
+        resp = self.app.get(
+            '/v2/executions/123?wait_for_state_change=true',
+            expect_errors=True
+        )
+
+        self.assertEqual(403, resp.status_int)
+
+    def test_get_wait_for_state_change_too_many_watchers(self):
+        self.override_config('execution_watcher', 'local', group='api')
+        self.override_config('max_watchers', 0, group='api')
+
+        self.addCleanup(execution_watcher.cleanup)
+
+        wf_ex = db_api.create_workflow_execution(
+            {
+                'name': 'flow',
+                'state': states.RUNNING,
+                'spec': {},
+                'context': {}
+            }
+        )
+
+        resp = self.app.get(
+            '/v2/executions/%s?wait_for_state_change=true' % wf_ex.id,
+            expect_errors=True
+        )
+
+        self.assertEqual(429, resp.status_int)
+
+        # Requests which wouldn't wait are served as usual.
+        resp = self.app.get(
+            '/v2/executions/123?wait_for_state_change=true',
+            expect_errors=True
+        )
+
+        self.assertEqual(404, resp.status_int)
+
+    def test_get_all_ndjson(self):
+        ids = ['00000000-0000-0000-0000-00000000000%s' % i for i in range(5)]
+
+        # Executions are created at the same time so that they are sorted
+        # by ID.
+        for i, wf_ex_id in enumerate(ids):
+            db_api.create_workflow_execution(
+                {
+                    'id': wf_ex_id,
+                    'name': 'ex%s' % i,
+                    'workflow_name': 'some',
+                    'state': states.SUCCESS,
+                    'input': {'i': i},
+                    'created_at': datetime.datetime(1970, 1, 1)
+                }
+            )
+
+        self.override_config('stream_page_size', 2, group='api')
+        self.override_config('max_limit', 2, group='api')
+
+        headers = {'Accept': 'application/x-ndjson'}
+
+        def get_lines(url):
+            resp = self.app.get(url, headers=headers)
+
+            self.assertEqual(200, resp.status_int)
+            self.assertEqual('application/x-ndjson', resp.content_type)
+
+            return [json.loads(line) for line in resp.text.splitlines()]
+
+        with mock.patch.object(
+                db_api,
+                'get_workflow_executions',
+                wraps=db_api.get_workflow_executions) as get_all:
+            lines = get_lines('/v2/executions')
+
+        # The whole list is streamed, two executions per page.
+        self.assertEqual(3, get_all.call_count)
+        self.assertEqual(ids, [line['id'] for line in lines])
+
+        # Lines are the same as the items of a regular list.
+        resp = self.app.get('/v2/executions?limit=1')
+
+        self.assertEqual(resp.json['executions'][0], lines[0])
+
+        lines = get_lines('/v2/executions?limit=3&marker=%s' % ids[0])
+
+        self.assertEqual(ids[1:4], [line['id'] for line in lines])
+
+        lines = get_lines(
+            '/v2/executions?fields=state&sort_keys=name&sort_dirs=desc'
+        )
+
+        self.assertEqual(
+            [
+                {'id': wf_ex_id, 'state': states.SUCCESS}
+                for wf_ex_id in reversed(ids)
+            ],
+            lines
+        )
+
+        self.assertEqual([], get_lines('/v2/executions?workflow_name=none'))
+
+        # Errors of the first query are reported as for a regular list.
+        url = '/v2/executions?sort_keys=unknown'
+
+        resp = self.app.get(url, headers=headers, expect_errors=True)
+
+        self.assertEqual(
+            self.app.get(url, expect_errors=True).status_int,
+            resp.status_int
+        )
+        self.assertIn('faultstring', json.loads(resp.text))
+
+    def test_stream_all_releases_transactions(self):
+        for i in range(3):
+            db_api.create_workflow_execution(
+                {
+                    'name': 'ex%s' % i,
+                    'workflow_name': 'some',
+                    'state': states.SUCCESS
+                }
+            )
+
+        self.override_config('stream_page_size', 2, group='api')
+
+        def _tx_lock_free():
+            # The lock is reentrant so it's acquired from another thread.
+            acquired = []
+
+            def _acquire():
+                if db_base.tx_lock.acquire(timeout=5):
+                    acquired.append(True)
+
+                    db_base.tx_lock.release()
+
+            t = threading.Thread(target=_acquire)
+            t.start()
+            t.join()
+
+            return bool(acquired)
+
+        chunks = rest_utils.stream_all(
+            resources.Execution,
+            db_api.get_workflow_executions,
+            sort_keys=['created_at', 'id'],
+            sort_dirs=['asc', 'asc']
+        )
+
+        # No transaction is open while the response is sent, not even
+        # between the chunks of a page.
+        self.assertTrue(_tx_lock_free())
+
+        lines = []
+
+        for chunk in chunks:
+            self.assertTrue(_tx_lock_free())
+
+            if chunk:
+                lines.append(json.loads(chunk))
+
+        self.assertEqual(3, len(lines))
+
+    def test_get_all_pagination_cursor(self):
+        created_at = datetime.datetime(1970, 1, 1)
+
+        # Some executions are created at the same time so that they are
+        # sorted by ID as well.
+        for i in range(5):
+            db_api.create_workflow_execution(
+                {
+                    'id': '00000000-0000-0000-0000-00000000000%s' % i,
+                    'name': 'ex%s' % (i % 2),
+                    'workflow_name': 'some',
+                    'state': states.SUCCESS,
+                    'created_at': created_at + datetime.timedelta(
+                        seconds=i // 2
+                    )
+                }
+            )
+
+        for query in ('', '&sort_keys=name,created_at&sort_dirs=desc,asc',
+                      '&fields=state'):
+            expected = [
+                ex['id'] for ex in
+                self.app.get('/v2/executions?limit=5' + query).json[
+                    'executions'
+                ]
+            ]
+
+            ids = []
+            url = '/v2/executions?limit=2' + query
+
+            with mock.patch.object(
+                    db_api,
+                    'get_workflow_execution') as get_marker:
+                while url:
+                    resp = self.app.get(url)
+
+                    self.assertEqual(200, resp.status_int)
+
+                    ids.extend(ex['id'] for ex in resp.json['executions'])
+
+                    url = resp.json.get('next')
+
+            # Markers don't need to be loaded.
+            get_marker.assert_not_called()
+
+            self.assertEqual(5, len(expected))
+            self.assertEqual(expected, ids)
+
+        marker = cursor_utils.encode_cursor(
+            ['created_at', 'id'],
+            ['asc', 'asc'],
+            {'created_at': created_at, 'id': ''}
+        )
+
+        resp = self.app.get(
+            '/v2/executions?sort_keys=name&marker=%s' % marker,
+            expect_errors=True
+        )
+
+        self.assertEqual(400, resp.status_int)
+        self.assertIn("doesn't match the sort keys", resp.json['faultstring'])
+
+        resp = self.app.get(
+            '/v2/executions?marker=invalid',
+            expect_errors=True
+        )
+
+        self.assertEqual(400, resp.status_int)
+        self.assertIn('Invalid marker', resp.json['faultstring'])
+
     @mock.patch.object(db_api, 'get_workflow_executions', MOCK_WF_EXECUTIONS)
     def test_get_all(self):
         resp = self.app.get('/v2/executions')
@@ -852,14 +1227,25 @@ class TestExecutionsController(base.APITest):
         )
 
         expected_dict = {
-            'marker': '123e4567-e89b-12d3-a456-426655440000',
             'limit': 1,
             'sort_keys': 'id,workflow_name',
             'sort_dirs': 'asc,desc'
         }
 
+        marker = param_dict.pop('marker')
+
         self.assertDictEqual(expected_dict, param_dict)
 
+        # The marker carries the sort key values of the last execution.
+        self.assertEqual(
+            (
+                ['id', 'workflow_name'],
+                ['asc', 'desc'],
+                {'id': WF_EX.id, 'workflow_name': WF_EX.workflow_name}
+            ),
+            cursor_utils.decode_cursor(marker)
+        )
+
     def test_get_all_pagination_limit_negative(self):
         resp = self.app.get(
             '/v2/executions?limit=-1&sort_keys=id&sort_dirs=asc',
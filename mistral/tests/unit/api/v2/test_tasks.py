@@ -26,8 +26,10 @@ from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral.rpc import clients as rpc
 from mistral.tests.unit.api import base
+from mistral.utils import rest_utils
 from mistral.workflow import data_flow
 from mistral.workflow import states
+from mistral_lib import utils
 
 # TODO(everyone): later we need additional tests verifying all the errors etc.
 
@@ -181,6 +183,41 @@ class TestTasksController(base.APITest):
         self.assertEqual(200, resp.status_int)
         self.assertDictEqual(TASK, resp.json)
 
+    def test_get_archived(self):
+        wf_ex_values = dict(WF_EX.iter_columns())
+        wf_ex_values['state'] = states.SUCCESS
+
+        task_ex_values = dict(TASK_EX.iter_columns())
+        task_ex_values['state'] = states.SUCCESS
+
+        db_api.create_workflow_execution(wf_ex_values)
+        db_api.create_task_execution(task_ex_values)
+        db_api.create_action_execution(
+            {
+                'id': 'action',
+                'name': 'std.noop',
+                'task_execution_id': TASK_EX.id,
+                'accepted': True,
+                'output': {'result': RESULT}
+            }
+        )
+
+        db_api.archive_execution_trees([WF_EX.id])
+
+        resp = self.app.get('/v2/tasks/123')
+
+        self.assertEqual(200, resp.status_int)
+
+        expected = dict(TASK, state=states.SUCCESS)
+
+        self.assertLessEqual(expected.items(), resp.json.items())
+
+        task_ex = data_flow.get_task_execution_result.call_args[0][0]
+
+        self.assertEqual(WF_EX.id, task_ex.workflow_execution.id)
+        self.assertEqual(['action'], [ex.id for ex in task_ex.executions])
+        self.assertEqual({'result': RESULT}, task_ex.executions[0].output)
+
     @mock.patch('mistral.db.v2.api.get_task_execution')
     def test_get_with_fields_filter(self, mocked_get):
         mocked_get.return_value = TASK_EX
@@ -212,6 +249,105 @@ class TestTasksController(base.APITest):
 
         self.assertEqual(404, resp.status_int)
 
+    def test_get_all_ndjson(self):
+        wf_ex = db_api.create_workflow_execution(
+            {'name': 'flow', 'state': states.RUNNING}
+        )
+
+        for i in range(3):
+            db_api.create_task_execution(
+                {
+                    'name': 'task%s' % i,
+                    'workflow_execution_id': wf_ex.id,
+                    'state': states.SUCCESS
+                }
+            )
+
+        self.override_config('stream_page_size', 2, group='api')
+
+        headers = {'Accept': 'application/x-ndjson'}
+
+        for url in ('/v2/tasks', '/v2/executions/%s/tasks' % wf_ex.id):
+            resp = self.app.get(url, headers=headers)
+
+            self.assertEqual(200, resp.status_int)
+            self.assertEqual('application/x-ndjson', resp.content_type)
+
+            lines = [json.loads(line) for line in resp.text.splitlines()]
+
+            self.assertEqual(
+                ['task0', 'task1', 'task2'],
+                sorted(line['name'] for line in lines)
+            )
+            # Lines are sorted by ID when they were created at the
+            # same time.
+            self.assertEqual(
+                sorted(
+                    self.app.get(url).json['tasks'],
+                    key=lambda t: (t['created_at'], t['id'])
+                ),
+                lines
+            )
+
+    @mock.patch.object(rest_utils, '_RESPONSE_CACHE', None)
+    def test_get_all_cached(self):
+        self.override_config('response_cache_size', 10, group='api')
+
+        created_at = utils.utc_now_sec() - datetime.timedelta(minutes=1)
+
+        wf_ex = db_api.create_workflow_execution(
+            {'name': 'flow', 'state': states.RUNNING}
+        )
+
+        db_api.create_task_execution(
+            {
+                'name': 'task1',
+                'workflow_execution_id': wf_ex.id,
+                'state': states.SUCCESS,
+                'created_at': created_at
+            }
+        )
+
+        url = '/v2/executions/%s/tasks' % wf_ex.id
+
+        resp = self.app.get(url)
+
+        self.assertEqual(200, resp.status_int)
+        self.assertEqual(['task1'], [t['name'] for t in resp.json['tasks']])
+
+        etag = resp.headers['ETag']
+
+        resp = self.app.get(url, headers={'If-None-Match': etag})
+
+        self.assertEqual(304, resp.status_int)
+
+        # Query parameters are part of the ETag.
+        resp = self.app.get(
+            url + '?fields=name',
+            headers={'If-None-Match': etag}
+        )
+
+        self.assertEqual(200, resp.status_int)
+        self.assertNotEqual(etag, resp.headers['ETag'])
+
+        db_api.create_task_execution(
+            {
+                'name': 'task2',
+                'workflow_execution_id': wf_ex.id,
+                'state': states.RUNNING,
+                'created_at': created_at
+            }
+        )
+
+        resp = self.app.get(url, headers={'If-None-Match': etag})
+
+        self.assertEqual(200, resp.status_int)
+        self.assertNotEqual(etag, resp.headers['ETag'])
+        self.assertEqual(
+            ['task1', 'task2'],
+            sorted(t['name'] for t in resp.json['tasks'])
+        )
+
     @mock.patch.object(db_api, 'get_task_executions', MOCK_TASKS)
     def test_get_all(self):
         resp = self.app.get('/v2/tasks')
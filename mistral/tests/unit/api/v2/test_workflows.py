@@ -27,6 +27,7 @@ from mistral.db.v2.sqlalchemy import models
 from mistral import exceptions as exc
 from mistral.tests.unit.api import base
 from mistral.tests.unit import base as unit_base
+from mistral.utils import cursor_utils
 from mistral.utils import safe_yaml
 from mistral_lib import utils
 
@@ -699,14 +700,25 @@ class TestWorkflowsController(base.APITest):
         )
 
         expected_dict = {
-            'marker': '123e4567-e89b-12d3-a456-426655440000',
             'limit': 1,
             'sort_keys': 'id,name',
             'sort_dirs': 'asc,asc',
         }
 
+        marker = param_dict.pop('marker')
+
         self.assertDictEqual(expected_dict, param_dict)
 
+        # The marker carries the sort key values of the last workflow.
+        self.assertEqual(
+            (
+                ['id', 'name'],
+                ['asc', 'asc'],
+                {'id': WF_DB.id, 'name': WF_DB.name}
+            ),
+            cursor_utils.decode_cursor(marker)
+        )
+
     def test_get_all_pagination_limit_negative(self):
         resp = self.app.get(
             '/v2/workflows?limit=-1&sort_keys=id,name&sort_dirs=asc,asc',
@@ -786,10 +798,13 @@ class TestWorkflowsController(base.APITest):
                 fields.remove('input')
                 fields.append('spec')
 
-            return [
-                ('65df1f59-938f-4c17-bc2a-562524ef5e40',
-                 {'input': ['param1', {'param2': 2}]})
-            ]
+            values = {
+                'id': '65df1f59-938f-4c17-bc2a-562524ef5e40',
+                'created_at': datetime.datetime(1970, 1, 1),
+                'spec': {'input': ['param1', {'param2': 2}]}
+            }
+
+            return [tuple(values[f] for f in fields)]
 
         mock_get_db_wfs.side_effect = mock_get_defintions
 
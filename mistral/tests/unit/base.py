@@ -283,6 +283,7 @@ class DbTestCase(BaseTest):
                     db_api.delete_workflow_executions()
                     db_api.delete_task_executions()
                     db_api.delete_action_executions()
+                    db_api.delete_archived_executions()
                     db_api.delete_workbooks()
                     db_api.delete_workflow_definitions()
                     db_api.delete_action_definitions()
@@ -27,20 +27,22 @@ class IsolationLevelTest(base.BaseTest):
     the engine no matter which code path triggers its creation.
     """
 
-    def _create_facade(self, backend_name):
+    def _create_facade(self, backend_name, reader_engine=None):
         engine = mock.MagicMock()
         engine.url.get_backend_name.return_value = backend_name
 
         ctx = mock.MagicMock()
         ctx.writer.get_engine.return_value = engine
+        ctx.reader.get_engine.return_value = reader_engine or engine
 
         with mock.patch.object(db_base, '_facade', None):
-            with mock.patch.object(
-                db_base.enginefacade,
-                'transaction_context',
-                return_value=ctx
-            ):
-                db_base._get_facade()
+            with mock.patch.object(db_base, '_reader_facade', None):
+                with mock.patch.object(
+                    db_base.enginefacade,
+                    'transaction_context',
+                    return_value=ctx
+                ):
+                    db_base._get_facade()
 
         return engine
 
@@ -55,3 +57,16 @@ class IsolationLevelTest(base.BaseTest):
         engine = self._create_facade('sqlite')
 
         engine.update_execution_options.assert_not_called()
+
+    def test_reader_gets_read_committed(self):
+        reader_engine = mock.MagicMock()
+        reader_engine.url.get_backend_name.return_value = 'mysql'
+
+        engine = self._create_facade('mysql', reader_engine=reader_engine)
+
+        engine.update_execution_options.assert_called_once_with(
+            isolation_level='READ COMMITTED'
+        )
+        reader_engine.update_execution_options.assert_called_once_with(
+            isolation_level='READ COMMITTED'
+        )
@@ -0,0 +1,72 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral import context as auth_context
+from mistral.db.sqlalchemy import base as db_base
+from mistral.db.v2 import api as db_api
+from mistral.tests.unit import base
+
+
+class ReaderRoutingTest(base.BaseTest):
+    def setUp(self):
+        super(ReaderRoutingTest, self).setUp()
+
+        self.addCleanup(auth_context.set_ctx, None)
+
+    def _set_ctx(self, use_db_reader):
+        auth_context.set_ctx(
+            auth_context.MistralContext(use_db_reader=use_db_reader)
+        )
+
+    def test_use_reader_without_ctx(self):
+        auth_context.set_ctx(None)
+
+        self.assertFalse(db_base.use_reader())
+        self.assertTrue(db_base.use_reader(read_only=True))
+
+    def test_use_reader_default(self):
+        self._set_ctx(None)
+
+        self.assertFalse(db_base.use_reader())
+        self.assertTrue(db_base.use_reader(read_only=True))
+
+    def test_use_reader_forced(self):
+        self._set_ctx(True)
+
+        self.assertTrue(db_base.use_reader())
+        self.assertTrue(db_base.use_reader(read_only=True))
+
+    def test_use_reader_disabled(self):
+        self._set_ctx(False)
+
+        self.assertFalse(db_base.use_reader())
+        self.assertFalse(db_base.use_reader(read_only=True))
+
+    @mock.patch.object(db_base, '_get_reader_facade')
+    @mock.patch.object(db_base, '_get_facade')
+    def test_read_only_transaction(self, get_facade, get_reader_facade):
+        auth_context.set_ctx(None)
+
+        with db_api.transaction(read_only=True):
+            pass
+
+        get_reader_facade.return_value.get_sessionmaker.assert_called_once()
+        get_facade.return_value.get_sessionmaker.assert_not_called()
+
+        with db_api.transaction():
+            pass
+
+        get_facade.return_value.get_sessionmaker.assert_called_once()
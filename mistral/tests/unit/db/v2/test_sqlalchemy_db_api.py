@@ -18,10 +18,15 @@
 
 import copy
 import datetime
+import tempfile
 import time
+from unittest import mock
 
 from oslo_config import cfg
+from oslo_db import exception as db_exc
+import sqlalchemy as sa
 
+from mistral.blob_stores import base as blob_stores
 from mistral import context as auth_context
 from mistral.db.v2.sqlalchemy import api as db_api
 from mistral.db.v2.sqlalchemy import models as db_models
@@ -29,6 +34,8 @@ from mistral import exceptions as exc
 from mistral.services import security
 from mistral.tests.unit import base as test_base
 from mistral.utils import filter_utils
+from mistral.utils import json_codec
+from mistral.workflow import states
 from mistral_lib import utils
 
 
@@ -1562,6 +1569,78 @@ class ActionExecutionTest(SQLAlchemyTest):
 
             self.assertIsNot(created_last_heartbeat, fetched_last_heartbeat)
 
+    def test_create_action_executions(self):
+        values_list = [
+            {
+                'id': 'action-ex-%s' % i,
+                'name': 'std.echo',
+                'state': 'RUNNING',
+                'input': {'output': i},
+                'runtime_context': {'index': i}
+            }
+            for i in range(3)
+        ]
+
+        with db_api.transaction():
+            db_api.create_action_executions(values_list)
+
+        with db_api.transaction():
+            fetched = db_api.get_action_executions(name='std.echo')
+
+            self.assertEqual(3, len(fetched))
+
+            for a_ex in fetched:
+                index = a_ex.runtime_context['index']
+
+                self.assertEqual('action-ex-%s' % index, a_ex.id)
+                self.assertEqual({'output': index}, a_ex.input)
+                self.assertEqual('<default-project>', a_ex.project_id)
+                self.assertIsNotNone(a_ex.created_at)
+                self.assertIsNotNone(a_ex.last_heartbeat)
+                self.assertFalse(a_ex.accepted)
+
+    def test_create_action_executions_duplicate(self):
+        values = {'id': 'action-ex', 'name': 'std.echo'}
+
+        with db_api.transaction():
+            db_api.create_action_executions([values])
+
+        self.assertRaises(
+            exc.DBDuplicateEntryError,
+            db_api.create_action_executions,
+            [values]
+        )
+
+    def test_update_action_executions_heartbeat(self):
+        old_heartbeat = datetime.datetime(2000, 1, 1)
+
+        with db_api.transaction():
+            created0 = db_api.create_action_execution(
+                dict(ACTION_EXECS[0], last_heartbeat=old_heartbeat)
+            )
+            created1 = db_api.create_action_execution(
+                dict(ACTION_EXECS[1], last_heartbeat=old_heartbeat)
+            )
+
+        with db_api.transaction():
+            # Empty and unknown ids are ignored.
+            updated = db_api.update_action_executions_heartbeat(
+                [created0.id, None, 'not-existing-id', created1.id],
+                chunk_size=1
+            )
+
+            self.assertEqual(2, updated)
+
+        with db_api.transaction():
+            self.assertLess(
+                old_heartbeat,
+                db_api.get_action_execution(created0.id).last_heartbeat
+            )
+            self.assertLess(
+                old_heartbeat,
+                db_api.get_action_execution(created1.id).last_heartbeat
+            )
+
     def test_get_action_executions(self):
         with db_api.transaction():
             created0 = db_api.create_action_execution(WF_EXECS[0])
@@ -1788,6 +1867,60 @@ class WorkflowExecutionTest(SQLAlchemyTest):
             self.assertEqual(1, len(fetched))
             self.assertEqual(created0, fetched[0])
 
+    def test_get_workflow_executions_with_marker_values(self):
+        created_at = datetime.datetime(2016, 12, 1, 15, 0, 0)
+
+        for i in range(6):
+            db_api.create_workflow_execution(
+                {
+                    'id': str(i),
+                    'name': 'ex%s' % (i % 3),
+                    'state': states.SUCCESS,
+                    'created_at': created_at + datetime.timedelta(
+                        seconds=i // 2
+                    ),
+                    'task_execution_id': None
+                }
+            )
+
+        def get_ids(sort_keys, sort_dirs, marker=None):
+            return [
+                ex.id for ex in db_api.get_workflow_executions(
+                    marker=marker,
+                    limit=10,
+                    sort_keys=list(sort_keys),
+                    sort_dirs=list(sort_dirs)
+                )
+            ]
+
+        for sort_keys, sort_dirs in (
+                (['created_at', 'id'], ['asc', 'asc']),
+                (['created_at', 'id'], ['desc', 'desc']),
+                (['name', 'created_at', 'id'], ['desc', 'asc', 'asc']),
+                # NULL values are compared by oslo.db.
+                (['task_execution_id', 'id'], ['asc', 'asc'])):
+            ids = get_ids(sort_keys, sort_dirs)
+
+            self.assertEqual(6, len(ids))
+
+            for i, wf_ex_id in enumerate(ids):
+                wf_ex = db_api.get_workflow_execution(wf_ex_id)
+
+                marker = {k: getattr(wf_ex, k) for k in sort_keys}
+
+                self.assertEqual(
+                    ids[i + 1:],
+                    get_ids(sort_keys, sort_dirs, marker=marker)
+                )
+
+        self.assertRaises(
+            db_exc.InvalidSortKey,
+            get_ids,
+            ['unknown', 'id'],
+            ['asc', 'asc'],
+            marker={'unknown': 1, 'id': '0'}
+        )
+
     def test_filter_workflow_execution_by_equal_value(self):
         with db_api.transaction():
             db_api.create_workflow_execution(WF_EXECS[0])
@@ -2796,6 +2929,62 @@ class ScheduledJobTest(SQLAlchemyTest):
             created.id
         )
 
+    def test_capture_scheduled_jobs(self):
+        created0 = db_api.create_scheduled_job(SCHEDULED_JOBS[0])
+        created1 = db_api.create_scheduled_job(SCHEDULED_JOBS[1])
+
+        # This job is captured by someone else and not expired yet.
+        db_api.create_scheduled_job(
+            dict(SCHEDULED_JOBS[0], captured_at=utils.utc_now_sec())
+        )
+
+        with db_api.transaction():
+            captured = db_api.capture_scheduled_jobs(
+                utils.utc_now_sec(),
+                batch_size=10
+            )
+
+        self.assertEqual(
+            [created0.id, created1.id],
+            [j.id for j in captured]
+        )
+
+        for job in captured:
+            self.assertIsNotNone(job.captured_at)
+            self.assertIsNotNone(
+                db_api.get_scheduled_job(job.id).captured_at
+            )
+
+        # The jobs can't be captured again until the capture expires.
+        with db_api.transaction():
+            self.assertEqual(
+                [],
+                db_api.capture_scheduled_jobs(utils.utc_now_sec())
+            )
+
+    def test_capture_scheduled_jobs_batch_size(self):
+        created0 = db_api.create_scheduled_job(SCHEDULED_JOBS[0])
+        db_api.create_scheduled_job(SCHEDULED_JOBS[1])
+
+        with db_api.transaction():
+            captured = db_api.capture_scheduled_jobs(
+                utils.utc_now_sec(),
+                batch_size=1
+            )
+
+        # The job with the earliest execution time goes first.
+        self.assertEqual([created0.id], [j.id for j in captured])
+
+    def test_delete_scheduled_jobs_by_ids(self):
+        created0 = db_api.create_scheduled_job(SCHEDULED_JOBS[0])
+        created1 = db_api.create_scheduled_job(SCHEDULED_JOBS[1])
+
+        db_api.delete_scheduled_jobs(id={'in': [created0.id]})
+
+        fetched = db_api.get_scheduled_jobs()
+
+        self.assertEqual([created1.id], [j.id for j in fetched])
+
     def test_get_scheduled_jobs_count(self):
         res = db_api.get_scheduled_jobs_count()
         self.assertEqual(0, res)
@@ -3524,6 +3713,317 @@ class EventTriggerTest(SQLAlchemyTest):
         )
 
 
+class JsonCompressionTest(SQLAlchemyTest):
+    def setUp(self):
+        super(JsonCompressionTest, self).setUp()
+
+        self.override_config('json_compression', True)
+        self.override_config('json_compression_threshold', 100)
+
+        self.big_input = {'items': ['item-%s' % i for i in range(100)]}
+
+    @staticmethod
+    def _get_raw_input(a_ex_id):
+        table = db_models.ActionExecution.__table__
+
+        with db_api.transaction():
+            session = db_api.b._get_thread_local_session()
+
+            return session.execute(
+                sa.select(sa.type_coerce(table.c.input, sa.Text)).where(
+                    table.c.id == a_ex_id
+                )
+            ).scalar()
+
+    def test_compression(self):
+        with db_api.transaction():
+            big = db_api.create_action_execution(
+                {'name': 'big', 'input': self.big_input}
+            )
+            small = db_api.create_action_execution(
+                {'name': 'small', 'input': {'items': []}}
+            )
+
+        self.assertTrue(json_codec.is_compressed(self._get_raw_input(big.id)))
+        self.assertEqual(
+            '{"items": []}',
+            self._get_raw_input(small.id)
+        )
+
+        with db_api.transaction():
+            self.assertEqual(
+                self.big_input,
+                db_api.get_action_execution(big.id).input
+            )
+
+        # Compressed values are read whatever the configuration.
+        self.override_config('json_compression', False)
+
+        with db_api.transaction():
+            self.assertEqual(
+                self.big_input,
+                db_api.get_action_execution(big.id).input
+            )
+
+    def test_recompress_json_columns(self):
+        self.override_config('json_compression', False)
+
+        with db_api.transaction():
+            ids = [
+                db_api.create_action_execution(
+                    {'name': 'a%s' % i, 'input': self.big_input}
+                ).id
+                for i in range(3)
+            ]
+
+            updated_at = db_api.get_action_execution(ids[0]).updated_at
+
+        self.override_config('json_compression', True)
+
+        self.assertEqual(3, db_api.recompress_json_columns(batch_size=2))
+
+        for a_ex_id in ids:
+            self.assertTrue(
+                json_codec.is_compressed(self._get_raw_input(a_ex_id))
+            )
+
+        with db_api.transaction():
+            a_ex = db_api.get_action_execution(ids[0])
+
+            self.assertEqual(self.big_input, a_ex.input)
+            self.assertEqual(updated_at, a_ex.updated_at)
+
+        # Nothing left to do.
+        self.assertEqual(0, db_api.recompress_json_columns(batch_size=2))
+
+        # Decompress the values back.
+        self.override_config('json_compression', False)
+
+        self.assertEqual(3, db_api.recompress_json_columns())
+
+        self.assertEqual(
+            utils.to_json_str(self.big_input),
+            self._get_raw_input(ids[0])
+        )
+
+    def test_recompress_environments(self):
+        self.override_config('json_compression', False)
+
+        with db_api.transaction():
+            db_api.create_environment(
+                {
+                    'name': 'env',
+                    'scope': 'private',
+                    'variables': self.big_input
+                }
+            )
+
+        self.override_config('json_compression', True)
+
+        # Environments have long JSON columns too.
+        self.assertEqual(1, db_api.recompress_json_columns())
+
+        table = db_models.Environment.__table__
+
+        with db_api.transaction():
+            session = db_api.b._get_thread_local_session()
+
+            raw = session.execute(
+                sa.select(sa.type_coerce(table.c.variables, sa.Text))
+            ).scalar()
+
+            self.assertTrue(json_codec.is_compressed(raw))
+            self.assertEqual(
+                self.big_input,
+                db_api.get_environment('env').variables
+            )
+
+
+class BlobStoreTest(SQLAlchemyTest):
+    def setUp(self):
+        super(BlobStoreTest, self).setUp()
+
+        tmp_dir = tempfile.TemporaryDirectory()
+
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(blob_stores.cleanup)
+
+        self.override_config('enabled', True, 'blob_store')
+        self.override_config('filesystem_path', tmp_dir.name, 'blob_store')
+        self.override_config('offload_threshold_kb', 1, 'blob_store')
+
+        self.big_output = {'items': ['item-%s' % i for i in range(200)]}
+
+    @staticmethod
+    def _get_raw_output(a_ex_id):
+        table = db_models.ActionExecution.__table__
+
+        with db_api.transaction():
+            session = db_api.b._get_thread_local_session()
+
+            return session.execute(
+                sa.select(sa.type_coerce(table.c.output, sa.Text)).where(
+                    table.c.id == a_ex_id
+                )
+            ).scalar()
+
+    def test_offload(self):
+        with db_api.transaction():
+            big = db_api.create_action_execution(
+                {'name': 'big', 'output': self.big_output}
+            )
+            small = db_api.create_action_execution(
+                {'name': 'small', 'output': {'items': []}}
+            )
+
+        raw = self._get_raw_output(big.id)
+
+        self.assertTrue(blob_stores.is_reference(raw))
+        self.assertEqual('{"items": []}', self._get_raw_output(small.id))
+
+        store = blob_stores.get_blob_store()
+
+        self.assertEqual(
+            utils.to_json_str(self.big_output),
+            store.get(blob_stores.get_key(raw)).decode('utf-8')
+        )
+
+        # Blobs are read whatever the configuration, bypass the cache to
+        # make sure they are read from the store.
+        self.override_config('enabled', False, 'blob_store')
+        self.override_config('cache_size_mb', 0, 'blob_store')
+
+        with mock.patch.object(store, 'get', wraps=store.get) as get_mock:
+            with db_api.transaction():
+                self.assertEqual(
+                    self.big_output,
+                    db_api.get_action_execution(big.id).output
+                )
+
+        get_mock.assert_called_once_with(blob_stores.get_key(raw))
+
+    def test_load_cached(self):
+        with db_api.transaction():
+            a_ex = db_api.create_action_execution(
+                {'name': 'big', 'output': self.big_output}
+            )
+
+        store = blob_stores.get_blob_store()
+
+        with mock.patch.object(store, 'get') as get_mock:
+            for _ in range(2):
+                with db_api.transaction():
+                    self.assertEqual(
+                        self.big_output,
+                        db_api.get_action_execution(a_ex.id).output
+                    )
+
+        get_mock.assert_not_called()
+
+    def test_offloaded_value_size_limit(self):
+        self.override_config(
+            'execution_field_size_limit_kb',
+            1,
+            group='engine'
+        )
+
+        with db_api.transaction():
+            a_ex = db_api.create_action_execution(
+                {'name': 'big', 'output': self.big_output}
+            )
+
+        with db_api.transaction():
+            self.assertEqual(
+                self.big_output,
+                db_api.get_action_execution(a_ex.id).output
+            )
+
+        # The limit applies when values stay in the database.
+        self.override_config('enabled', False, 'blob_store')
+
+        self.assertRaises(
+            exc.SizeLimitExceededException,
+            db_api.create_action_execution,
+            {'name': 'big', 'output': self.big_output}
+        )
+
+    def test_recompress_json_columns(self):
+        self.override_config('enabled', False, 'blob_store')
+
+        with db_api.transaction():
+            a_ex = db_api.create_action_execution(
+                {'name': 'big', 'output': self.big_output}
+            )
+
+        self.override_config('enabled', True, 'blob_store')
+
+        self.assertEqual(1, db_api.recompress_json_columns())
+        self.assertTrue(
+            blob_stores.is_reference(self._get_raw_output(a_ex.id))
+        )
+
+        self.override_config('enabled', False, 'blob_store')
+
+        self.assertEqual(1, db_api.recompress_json_columns())
+        self.assertEqual(
+            utils.to_json_str(self.big_output),
+            self._get_raw_output(a_ex.id)
+        )
+
+    def test_purge(self):
+        with db_api.transaction():
+            a_ex = db_api.create_action_execution(
+                {'name': 'big', 'output': self.big_output}
+            )
+            deleted = db_api.create_action_execution(
+                {'name': 'deleted', 'output': {'items': list(range(500))}}
+            )
+
+        key = blob_stores.get_key(self._get_raw_output(a_ex.id))
+        deleted_key = blob_stores.get_key(self._get_raw_output(deleted.id))
+
+        db_api.delete_action_execution(deleted.id)
+
+        keys = db_api.get_json_blob_keys()
+
+        self.assertEqual({key}, keys)
+
+        # Recent blobs are kept.
+        self.assertEqual(0, blob_stores.purge(keys, 3600))
+
+        self.assertEqual(1, blob_stores.purge(keys, 0))
+
+        store = blob_stores.get_blob_store()
+
+        self.assertIsNotNone(store.get(key))
+        self.assertRaises(exc.BlobStoreException, store.get, deleted_key)
+
+    def test_purge_with_offloaded_environment(self):
+        with db_api.transaction():
+            db_api.create_environment(
+                {
+                    'name': 'env',
+                    'scope': 'private',
+                    'variables': self.big_output
+                }
+            )
+
+        # Blobs referenced by other tables than the execution ones are
+        # kept as well.
+        self.assertEqual(1, len(db_api.get_json_blob_keys()))
+        self.assertEqual(0, blob_stores.purge(db_api.get_json_blob_keys(), 0))
+
+        self.override_config('cache_size_mb', 0, 'blob_store')
+
+        blob_stores.cleanup()
+
+        with db_api.transaction():
+            self.assertEqual(
+                self.big_output,
+                db_api.get_environment('env').variables
+            )
+
+
 class LockTest(SQLAlchemyTest):
     def test_create_lock(self):
         # This test just ensures that DB model is OK.
@@ -3558,7 +4058,96 @@ class LockTest(SQLAlchemyTest):
         # Make sure that outside 'with' section the lock record does not exist.
         self.assertEqual(0, len(db_api.get_named_locks()))
 
-    def test_internal_get_direct_subworkflows(self):
+    def test_named_lock_stats(self):
+        db_api.reset_named_lock_stats()
+
+        self.addCleanup(db_api.reset_named_lock_stats)
+
+        for _ in range(2):
+            name = 'with-items-%s' % utils.generate_unicode_uuid()
+
+            with db_api.named_lock(name):
+                pass
+
+        with db_api.named_lock('lock42'):
+            pass
+
+        stats = db_api.get_named_lock_stats()
+
+        self.assertEqual({'with-items-<id>', 'lock42'}, set(stats))
+        self.assertEqual(2, stats['with-items-<id>']['acquired'])
+        self.assertEqual(1, stats['lock42']['acquired'])
+        self.assertLessEqual(
+            stats['lock42']['avg_wait'],
+            stats['lock42']['max_wait']
+        )
+
+    def test_advisory_named_lock_fallback(self):
+        self.override_config('named_lock_backend', 'advisory', 'engine')
+
+        # sqlite doesn't support advisory locks.
+        with db_api.named_lock('lock42'):
+            self.assertEqual(1, len(db_api.get_named_locks()))
+
+        self.assertEqual(0, len(db_api.get_named_locks()))
+
+    @mock.patch.object(db_api, '_acquire_advisory_lock')
+    @mock.patch.object(db_api.b, 'get_dialect_name')
+    def test_advisory_named_lock(self, get_dialect_name, acquire_lock):
+        self.override_config('named_lock_backend', 'advisory', 'engine')
+
+        for dialect, expected in (('postgresql', 'postgresql'),
+                                  ('mariadb', 'mysql')):
+            get_dialect_name.return_value = dialect
+
+            with db_api.named_lock('lock42'):
+                self.assertEqual(0, len(db_api.get_named_locks()))
+
+            acquire_lock.assert_called_with('lock42', expected)
+
+    def test_advisory_lock_ids(self):
+        name = 'join-task-%s-task1' % utils.generate_unicode_uuid()
+
+        key = db_api._get_pg_advisory_lock_key(name)
+
+        self.assertEqual(key, db_api._get_pg_advisory_lock_key(name))
+        self.assertTrue(-2 ** 63 <= key < 2 ** 63)
+
+        lock_name = db_api._get_mysql_advisory_lock_name(name)
+
+        self.assertLessEqual(len(lock_name), 64)
+        self.assertNotEqual(
+            lock_name,
+            db_api._get_mysql_advisory_lock_name(name + '0')
+        )
+
+    def test_release_mysql_advisory_locks(self):
+        dbapi_conn = mock.Mock()
+        conn_record = mock.Mock(
+            info={db_api._MYSQL_ADVISORY_LOCKS_KEY: ['lock1', 'lock2']}
+        )
+
+        db_api._release_mysql_advisory_locks(dbapi_conn, conn_record)
+
+        cursor = dbapi_conn.cursor.return_value
+
+        self.assertEqual(
+            [
+                mock.call('SELECT RELEASE_LOCK(%s)', ('lock1',)),
+                mock.call('SELECT RELEASE_LOCK(%s)', ('lock2',))
+            ],
+            cursor.execute.call_args_list
+        )
+        self.assertEqual({}, conn_record.info)
+
+        # Nothing to release for a connection returned the next time.
+        dbapi_conn.reset_mock()
+
+        db_api._release_mysql_advisory_locks(dbapi_conn, conn_record)
+
+        self.assertFalse(dbapi_conn.cursor.called)
+
+    def test_get_execution_tree(self):
         def wex(wex_id, tex_id=None):
             db_api.create_workflow_execution(
                 {'id': wex_id, 'name': wex_id, 'task_execution_id': tex_id}
@@ -3569,23 +4158,318 @@ class LockTest(SQLAlchemyTest):
                 {'id': tex_id, 'name': tex_id, 'workflow_execution_id': wex_id}
             )
 
-        def assert_subworkflows(expected):
+        def aex(aex_id, tex_id):
+            db_api.create_action_execution(
+                {'id': aex_id, 'name': aex_id, 'task_execution_id': tex_id}
+            )
+
+        def assert_tree(expected, max_depth=-1):
             self.assertEqual(
-                set(expected), set(db_api._get_all_direct_subworkflows('root'))
+                sorted(expected),
+                sorted(
+                    (n.id, n.type, n.parent_id, n.depth)
+                    for n in db_api.get_execution_tree('root', max_depth)
+                )
             )
 
         wex('root')
         tex('t1', 'root')
         wex('sub1', 't1')
 
-        assert_subworkflows(['sub1'])
+        assert_tree(
+            [
+                ('root', 'workflow', None, 0),
+                ('t1', 'task', 'root', 0),
+                ('sub1', 'workflow', 't1', 1)
+            ]
+        )
 
         tex('t2', 'root')
+        aex('a1', 't2')
         wex('sub2', 't1')
-
-        assert_subworkflows(['sub1', 'sub2'])
-
         tex('sub1t1', 'sub1')
         wex('sub1sub1', 'sub1t1')
+        tex('sub1sub1t1', 'sub1sub1')
+        aex('sub1sub1a1', 'sub1sub1t1')
+
+        # Executions of other workflows are not included.
+        wex('other')
+        tex('other_t1', 'other')
+
+        level_0 = [
+            ('root', 'workflow', None, 0),
+            ('t1', 'task', 'root', 0),
+            ('t2', 'task', 'root', 0),
+            ('a1', 'action', 't2', 0)
+        ]
+        level_1 = [
+            ('sub1', 'workflow', 't1', 1),
+            ('sub2', 'workflow', 't1', 1),
+            ('sub1t1', 'task', 'sub1', 1)
+        ]
+        level_2 = [
+            ('sub1sub1', 'workflow', 'sub1t1', 2),
+            ('sub1sub1t1', 'task', 'sub1sub1', 2),
+            ('sub1sub1a1', 'action', 'sub1sub1t1', 2)
+        ]
+
+        assert_tree(level_0 + level_1 + level_2)
+        assert_tree(level_0 + level_1, max_depth=1)
+        assert_tree(level_0, max_depth=0)
+
+        self.assertEqual([], db_api.get_execution_tree('invalid'))
+
+    def test_get_execution_tree_errors_only(self):
+        db_api.create_workflow_execution({'id': 'root', 'name': 'root'})
+
+        for tex_id, state in (('t1', states.ERROR), ('t2', states.SUCCESS)):
+            db_api.create_task_execution(
+                {
+                    'id': tex_id,
+                    'name': tex_id,
+                    'state': state,
+                    'workflow_execution_id': 'root'
+                }
+            )
+            db_api.create_action_execution(
+                {
+                    'id': 'a_%s' % tex_id,
+                    'name': 'a',
+                    'task_execution_id': tex_id
+                }
+            )
+            db_api.create_workflow_execution(
+                {
+                    'id': 'sub_%s' % tex_id,
+                    'name': 'sub',
+                    'task_execution_id': tex_id
+                }
+            )
+
+        tree = db_api.get_execution_tree('root', errors_only=True)
+
+        self.assertEqual(
+            ['a_t1', 'root', 'sub_t1', 't1'],
+            sorted(n.id for n in tree)
+        )
+
+    def test_delete_workflow_execution_recurse(self):
+        wf_ex = db_api.create_workflow_execution({'name': 'root'})
+
+        parent_ex = wf_ex
+
+        for i in range(5):
+            task_ex = db_api.create_task_execution(
+                {'name': 't%s' % i, 'workflow_execution_id': parent_ex.id}
+            )
+
+            db_api.create_action_execution(
+                {'name': 'a%s' % i, 'task_execution_id': task_ex.id}
+            )
+
+            parent_ex = db_api.create_workflow_execution(
+                {'name': 'sub%s' % i, 'task_execution_id': task_ex.id}
+            )
+
+        other_wf_ex = db_api.create_workflow_execution({'name': 'other'})
+
+        db_api.delete_workflow_execution_recurse(wf_ex.id)
+
+        self.assertEqual(
+            [other_wf_ex.id],
+            [ex.id for ex in db_api.get_workflow_executions()]
+        )
+        self.assertEqual([], db_api.get_task_executions())
+        self.assertEqual([], db_api.get_action_executions())
+
+        self.assertRaises(
+            exc.DBEntityNotFoundError,
+            db_api.delete_workflow_execution_recurse,
+            wf_ex.id
+        )
+
+    def test_delete_execution_trees(self):
+        root_ids = []
+
+        for i in range(2):
+            wf_ex = db_api.create_workflow_execution({'name': 'root%s' % i})
+
+            task_ex = db_api.create_task_execution(
+                {'name': 't%s' % i, 'workflow_execution_id': wf_ex.id}
+            )
+
+            db_api.create_action_execution(
+                {'name': 'a%s' % i, 'task_execution_id': task_ex.id}
+            )
+
+            db_api.create_workflow_execution(
+                {'name': 'sub%s' % i, 'task_execution_id': task_ex.id}
+            )
+
+            root_ids.append(wf_ex.id)
+
+        other_wf_ex = db_api.create_workflow_execution({'name': 'other'})
+
+        nodes = db_api.get_execution_trees_nodes(root_ids)
+
+        self.assertEqual(8, len(nodes))
+
+        # Leaves are deleted first so that every transaction leaves
+        # consistent trees behind.
+        self.assertEqual(
+            {'workflow': 0, 'task': 0, 'action': 2},
+            db_api.delete_execution_nodes(nodes[:2])
+        )
+        self.assertEqual(
+            {'workflow': 2, 'task': 1, 'action': 0},
+            db_api.delete_execution_nodes(nodes[2:5])
+        )
+        self.assertEqual(
+            {'workflow': 2, 'task': 1, 'action': 0},
+            db_api.delete_execution_trees(root_ids)
+        )
+        self.assertEqual(
+            {'workflow': 0, 'task': 0, 'action': 0},
+            db_api.delete_execution_trees(root_ids)
+        )
+
+        self.assertEqual(
+            [other_wf_ex.id],
+            [ex.id for ex in db_api.get_workflow_executions()]
+        )
+        self.assertEqual([], db_api.get_task_executions())
+        self.assertEqual([], db_api.get_action_executions())
+
+    def test_get_completed_root_execution_keys(self):
+        now = utils.utc_now_sec()
+
+        for i in range(5):
+            db_api.create_workflow_execution(
+                {
+                    'id': 'ex%s' % i,
+                    'name': 'ex%s' % i,
+                    'state': states.SUCCESS,
+                    'updated_at': now - datetime.timedelta(minutes=i)
+                }
+            )
+
+        db_api.create_workflow_execution(
+            {'id': 'running', 'name': 'running', 'state': states.RUNNING}
+        )
+
+        def get_ids(**kwargs):
+            keys = db_api.get_completed_root_execution_keys(**kwargs)
+
+            return [k.id for k in keys]
+
+        self.assertEqual(['ex4', 'ex3', 'ex2', 'ex1', 'ex0'], get_ids())
+        self.assertEqual(['ex4', 'ex3'], get_ids(limit=2))
+        self.assertEqual(
+            ['ex4', 'ex3'],
+            get_ids(updated_before=now - datetime.timedelta(minutes=2))
+        )
+
+        max_key = db_api.get_superfluous_executions_max_key(3)
+
+        self.assertEqual('ex3', max_key.id)
+        self.assertEqual(['ex4', 'ex3'], get_ids(max_key=tuple(max_key)))
+        self.assertIsNone(db_api.get_superfluous_executions_max_key(5))
+        self.assertIsNone(db_api.get_superfluous_executions_max_key(0))
+
+        keys = db_api.get_completed_root_execution_keys(limit=2)
+
+        self.assertEqual(
+            ['ex2', 'ex1'],
+            get_ids(marker=tuple(keys[-1]), limit=2)
+        )
+
+
+class ArchivedExecutionTest(SQLAlchemyTest):
+    def test_archive_execution_trees(self):
+        wf_ex = db_api.create_workflow_execution(
+            {
+                'name': 'root',
+                'state': states.SUCCESS,
+                'params': {'env': {'key': 'value'}},
+                'context': {'var': 1}
+            }
+        )
+        task_ex = db_api.create_task_execution(
+            {
+                'name': 'task',
+                'workflow_execution_id': wf_ex.id,
+                'started_at': utils.utc_now_sec(),
+                'published': {'result': [1, 2]}
+            }
+        )
+        action_ex = db_api.create_action_execution(
+            {
+                'name': 'action',
+                'task_execution_id': task_ex.id,
+                'output': {'result': 'ok'}
+            }
+        )
+        sub_wf_ex = db_api.create_workflow_execution(
+            {
+                'name': 'sub',
+                'task_execution_id': task_ex.id,
+                'root_execution_id': wf_ex.id
+            }
+        )
+
+        other_wf_ex = db_api.create_workflow_execution({'name': 'other'})
+
+        self.assertEqual(4, db_api.archive_execution_trees([wf_ex.id]))
+
+        self.assertEqual(
+            [other_wf_ex.id],
+            [ex.id for ex in db_api.get_workflow_executions()]
+        )
+        self.assertEqual([], db_api.get_task_executions())
+        self.assertEqual([], db_api.get_action_executions())
+
+        archived = {
+            a.id: a for a in db_api.get_archived_executions()
+        }
+
+        self.assertEqual(4, len(archived))
+
+        for ex, ex_type, parent_id in ((wf_ex, 'workflow', None),
+                                       (task_ex, 'task', wf_ex.id),
+                                       (action_ex, 'action', task_ex.id),
+                                       (sub_wf_ex, 'workflow', task_ex.id)):
+            arch_ex = archived[ex.id]
+
+            self.assertEqual(ex_type, arch_ex.type)
+            self.assertEqual(ex.name, arch_ex.name)
+            self.assertEqual(wf_ex.id, arch_ex.root_execution_id)
+            self.assertEqual(parent_id, arch_ex.parent_id)
+            self.assertEqual(ex.project_id, arch_ex.project_id)
+            self.assertEqual(ex.created_at, arch_ex.created_at)
+            self.assertIsNotNone(arch_ex.archived_at)
+
+            restored = arch_ex.to_execution()
+
+            self.assertIsInstance(restored, type(ex))
+            self.assertLessEqual(
+                ex.to_dict().items(),
+                restored.to_dict().items()
+            )
+
+        restored = archived[action_ex.id].to_execution()
+
+        self.assertEqual({'result': 'ok'}, restored.output)
+
+        self.assertIsNotNone(db_api.load_archived_execution(task_ex.id))
+        self.assertIsNotNone(
+            db_api.load_archived_execution(task_ex.id, ex_type='task')
+        )
+        self.assertIsNone(
+            db_api.load_archived_execution(task_ex.id, ex_type='workflow')
+        )
+        self.assertIsNone(db_api.load_archived_execution('invalid'))
+
+        # Archived executions of other projects are not visible.
+        auth_context.set_ctx(test_base.get_context(default=False))
 
-        assert_subworkflows(['sub1', 'sub2'])
+        self.assertIsNone(db_api.load_archived_execution(wf_ex.id))
@@ -0,0 +1,232 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import threading
+from unittest import mock
+
+from mistral.engine import post_tx_queue
+from mistral.tests.unit import base
+
+
+class PostTxQueueWorkersTest(base.BaseTest):
+    def setUp(self):
+        super(PostTxQueueWorkersTest, self).setUp()
+
+        self.addCleanup(post_tx_queue.stop_workers, True)
+
+    def test_operations_run_in_order_on_workers(self):
+        post_tx_queue.start_workers(4, 10)
+
+        calls = []
+        threads = set()
+        done = threading.Event()
+
+        def _op(i):
+            calls.append(i)
+            threads.add(threading.current_thread().name)
+
+            if i == 9:
+                done.set()
+
+        @post_tx_queue.run
+        def _engine_call():
+            for i in range(10):
+                post_tx_queue.register_operation(_op, args=[i])
+
+        _engine_call()
+
+        self.assertTrue(done.wait(10))
+
+        # Operations of one call run sequentially and in order.
+        self.assertEqual(list(range(10)), calls)
+        self.assertEqual(1, len(threads))
+        self.assertTrue(threads.pop().startswith('post-tx-worker-'))
+
+        stats = post_tx_queue.get_worker_stats()
+
+        self.assertEqual(4, stats['workers'])
+        self.assertEqual(1, stats['processed'])
+
+    def test_backpressure(self):
+        post_tx_queue.start_workers(1, 1)
+
+        release = threading.Event()
+        processed = []
+
+        def _op(i):
+            release.wait(10)
+
+            processed.append(i)
+
+        @post_tx_queue.run
+        def _engine_call(i):
+            post_tx_queue.register_operation(_op, args=[i])
+
+        # The first call occupies the only worker, the second one fills
+        # the queue so the third one has to wait for a free slot.
+        _engine_call(0)
+
+        self._await(
+            lambda: post_tx_queue.get_worker_stats()['processed'] == 1,
+            delay=0.1
+        )
+
+        _engine_call(1)
+
+        blocked = threading.Thread(target=_engine_call, args=[2])
+        blocked.start()
+
+        self._await(
+            lambda: post_tx_queue.get_worker_stats()['blocked'] == 1,
+            delay=0.1
+        )
+
+        self.assertTrue(blocked.is_alive())
+
+        release.set()
+
+        blocked.join(10)
+
+        self._await(lambda: len(processed) == 3, delay=0.1)
+
+        self.assertEqual([0, 1, 2], processed)
+
+    def test_nested_operations_run_inline_when_queue_is_full(self):
+        post_tx_queue.start_workers(1, 1)
+
+        done = threading.Event()
+        threads = []
+
+        def _nested_op():
+            threads.append(threading.current_thread())
+
+            done.set()
+
+        def _op():
+            threads.append(threading.current_thread())
+
+            # Fill the queue so that the nested operations can't be queued.
+            post_tx_queue._WORKER_POOL._queue.put_nowait(
+                (0, None, [])
+            )
+
+            post_tx_queue.register_operation(_nested_op)
+
+        @post_tx_queue.run
+        def _engine_call():
+            post_tx_queue.register_operation(_op)
+
+        _engine_call()
+
+        self.assertTrue(done.wait(10))
+
+        self.assertEqual(threads[0], threads[1])
+        self.assertEqual(1, post_tx_queue.get_worker_stats()['inline'])
+
+    def test_stop_does_not_block_on_full_queue(self):
+        post_tx_queue.start_workers(2, 1)
+
+        pool = post_tx_queue._WORKER_POOL
+        release = threading.Event()
+
+        @post_tx_queue.run
+        def _engine_call():
+            post_tx_queue.register_operation(release.wait, args=[10])
+
+        # Both workers are busy and the queue is full.
+        _engine_call()
+        _engine_call()
+        _engine_call()
+
+        post_tx_queue.stop_workers()
+
+        release.set()
+
+        for t in pool._threads:
+            t.join(10)
+
+            self.assertFalse(t.is_alive())
+
+    def test_start_workers_stops_previous_pool(self):
+        post_tx_queue.start_workers(2, 10)
+
+        pool = post_tx_queue._WORKER_POOL
+
+        post_tx_queue.start_workers(2, 10)
+
+        self.assertIsNot(pool, post_tx_queue._WORKER_POOL)
+
+        for t in pool._threads:
+            t.join(10)
+
+            self.assertFalse(t.is_alive())
+
+    @mock.patch.object(post_tx_queue.profiler, 'clean')
+    @mock.patch.object(post_tx_queue.profiler, 'init')
+    def test_profiler_initialized_per_call(self, init, clean):
+        self.override_config('enabled', True, 'profiler')
+
+        post_tx_queue.start_workers(1, 10)
+
+        done = threading.Event()
+
+        @post_tx_queue.run
+        def _engine_call():
+            post_tx_queue.register_operation(done.set)
+
+        _engine_call()
+
+        self.assertTrue(done.wait(10))
+
+        self._await(lambda: clean.call_count == 1, delay=0.1)
+
+        self.assertEqual(1, init.call_count)
+
+        done.clear()
+
+        _engine_call()
+
+        self.assertTrue(done.wait(10))
+
+        self._await(lambda: clean.call_count == 2, delay=0.1)
+
+        self.assertEqual(2, init.call_count)
+
+
+class PostTxQueueDedupTest(base.BaseTest):
+    @mock.patch.object(post_tx_queue, '_run_operations')
+    def test_operations_with_same_key_run_once(self, run_ops):
+        def _op(name, value):
+            pass
+
+        @post_tx_queue.run
+        def _engine_call():
+            post_tx_queue.register_operation(_op, args=['a', 1], key='a')
+            post_tx_queue.register_operation(_op, args=['b', 1])
+            post_tx_queue.register_operation(_op, args=['a', 2], key='a')
+            post_tx_queue.register_operation(_op, args=['b', 2])
+            post_tx_queue.register_operation(_op, args=['c', 1], key='c')
+            post_tx_queue.register_operation(_op, args=['a', 3], key='a')
+
+        _engine_call()
+
+        self._await(lambda: run_ops.called, delay=0.1)
+
+        queue = run_ops.call_args[0][1]
+
+        # The first position and the last arguments win.
+        self.assertEqual(
+            [['a', 3], ['b', 1], ['b', 2], ['c', 1]],
+            [args for _, args, _ in queue]
+        )
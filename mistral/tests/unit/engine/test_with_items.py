@@ -213,6 +213,57 @@ class WithItemsEngineTest(base.EngineTestCase):
         self.assertEqual(1, len(task_execs))
         self.assertEqual(states.SUCCESS, task1_ex.state)
 
+    def test_with_items_batches(self):
+        self.override_config('with_items_batch_size', 2, 'engine')
+
+        wf_text = """---
+        version: "2.0"
+
+        wf:
+          tasks:
+            task1:
+              with-items: i in <% range(0, 5) %>
+              action: std.echo output=<% $.i %>
+              publish:
+                result: <% task(task1).result %>
+        """
+
+        wf_service.create_workflows(wf_text)
+
+        with mock.patch.object(
+                db_api,
+                'create_action_executions',
+                wraps=db_api.create_action_executions) as mocked:
+            wf_ex = self.engine.start_workflow('wf')
+
+            self.await_workflow_success(wf_ex.id)
+
+        # 5 actions are inserted in 3 batches.
+        self.assertEqual(
+            [2, 2, 1],
+            [len(c[0][0]) for c in mocked.call_args_list]
+        )
+
+        with db_api.transaction():
+            wf_ex = db_api.get_workflow_execution(wf_ex.id)
+
+            task1_ex = self._assert_single_item(
+                wf_ex.task_executions,
+                name='task1'
+            )
+
+            a_exs = task1_ex.action_executions
+
+            self.assertEqual(5, len(a_exs))
+            self.assertEqual(
+                list(range(5)),
+                sorted(a_ex.runtime_context['index'] for a_ex in a_exs)
+            )
+            self.assertListEqual(
+                list(range(5)),
+                task1_ex.published['result']
+            )
+
     def test_with_items_fail(self):
         wf_text = """---
         version: "2.0"
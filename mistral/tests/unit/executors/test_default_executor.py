@@ -0,0 +1,335 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import asyncio
+import threading
+from unittest import mock
+
+from mistral_lib import actions as ml_actions
+
+from mistral.actions import std_actions
+from mistral import context as auth_context
+from mistral.executors import base as exe_base
+from mistral.executors import default_executor as d_exe
+from mistral.tests.unit import base
+
+
+class _CallbackAction(ml_actions.Action):
+    def __init__(self, callback):
+        super(_CallbackAction, self).__init__()
+
+        self._callback = callback
+
+    def run(self, context):
+        return self._callback()
+
+
+class _AsyncAction(ml_actions.Action):
+    def __init__(self, delay, cancelled=None):
+        super(_AsyncAction, self).__init__()
+
+        self._delay = delay
+        self._cancelled = cancelled
+
+    def run(self, context):
+        raise AssertionError('Must run as a coroutine.')
+
+    def supports_async(self):
+        return True
+
+    async def run_async(self, context):
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self._cancelled.set()
+
+            raise
+
+        return threading.current_thread().name
+
+
+class DefaultExecutorTest(base.BaseTest):
+    def setUp(self):
+        super(DefaultExecutorTest, self).setUp()
+
+        auth_context.set_ctx(base.get_context())
+
+        self.addCleanup(auth_context.set_ctx, None)
+
+        self.executor = d_exe.DefaultExecutor()
+
+    def _run_action(self, callback, timeout=None):
+        return self.executor.run_action(
+            _CallbackAction(callback),
+            None,
+            False,
+            {},
+            timeout=timeout
+        )
+
+    def test_run_action(self):
+        threads = []
+
+        def _callback():
+            threads.append(threading.current_thread())
+
+            return 'result'
+
+        result = self._run_action(_callback)
+
+        self.assertEqual('result', result.data)
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+        # Workers are reused.
+        self._run_action(_callback)
+
+        self.assertIs(threads[0], threads[1])
+
+    def test_run_action_error(self):
+        def _callback():
+            raise ValueError('boom')
+
+        result = self._run_action(_callback)
+
+        self.assertTrue(result.is_error())
+        self.assertIn('boom', result.error)
+
+    def test_timeout_cancels_action(self):
+        cancelled = threading.Event()
+
+        def _callback():
+            # A cooperative action checking the cancel flag.
+            while not exe_base.is_action_cancelled():
+                cancelled.wait(0.01)
+
+            cancelled.set()
+
+            return 'cancelled'
+
+        result = self._run_action(_callback, timeout=0.1)
+
+        self.assertTrue(result.is_error())
+        self.assertIn('Timeout after 0.1 seconds', result.error)
+
+        self.assertTrue(cancelled.wait(10))
+
+        self._await(
+            lambda: self.executor.get_stats()['running'] == 0,
+            delay=0.1
+        )
+
+        self.assertEqual(1, self.executor.get_stats()['timed_out'])
+
+        # The flag is reset for the next action run by the worker.
+        self.assertFalse(self._run_action(exe_base.is_action_cancelled).data)
+
+    def test_concurrency_limit(self):
+        self.override_config('action_workers', 1, 'executor')
+
+        release = threading.Event()
+        results = []
+
+        def _callback():
+            release.wait(10)
+
+            return 'done'
+
+        ctx = auth_context.ctx()
+
+        def _run():
+            auth_context.set_ctx(ctx)
+
+            results.append(self._run_action(_callback))
+
+        threads = [threading.Thread(target=_run) for _ in range(3)]
+
+        for t in threads:
+            t.start()
+
+        self._await(
+            lambda: self.executor.get_stats()['queued'] == 2,
+            delay=0.1
+        )
+
+        self.assertEqual(1, self.executor.get_stats()['running'])
+
+        release.set()
+
+        for t in threads:
+            t.join(10)
+
+        self.assertEqual(['done'] * 3, [r.data for r in results])
+        self.assertEqual(0, self.executor.get_stats()['queued'])
+
+    def test_run_actions(self):
+        release = threading.Event()
+        completed = []
+
+        engine_client = mock.Mock()
+        engine_client.on_action_complete.side_effect = (
+            lambda ex_id, result, **kwargs: completed.append(
+                (ex_id, result.data)
+            )
+        )
+
+        self.executor._engine_client = engine_client
+
+        def _callback():
+            release.wait(10)
+
+            return auth_context.ctx().project_id
+
+        self.executor.run_actions([
+            {
+                'action': _CallbackAction(_callback),
+                'action_ex_id': 'ex-%s' % i,
+                'safe_rerun': False,
+                'exec_ctx': {}
+            }
+            for i in range(3)
+        ])
+
+        # The actions run concurrently and the caller doesn't wait.
+        self._await(
+            lambda: self.executor.get_stats()['running'] == 3,
+            delay=0.1
+        )
+
+        release.set()
+
+        self._await(lambda: len(completed) == 3, delay=0.1)
+
+        project_id = auth_context.ctx().project_id
+
+        self.assertEqual(
+            [('ex-0', project_id), ('ex-1', project_id), ('ex-2', project_id)],
+            sorted(completed)
+        )
+
+    def test_run_actions_redelivered(self):
+        engine_client = mock.Mock()
+
+        self.executor._engine_client = engine_client
+
+        self.executor.run_actions(
+            [
+                {
+                    'action': _CallbackAction(lambda: 'result'),
+                    'action_ex_id': 'ex-id',
+                    'safe_rerun': False,
+                    'exec_ctx': {}
+                }
+            ],
+            redelivered=True
+        )
+
+        self._await(lambda: engine_client.on_action_complete.called)
+
+        ex_id, result = engine_client.on_action_complete.call_args[0]
+
+        self.assertEqual('ex-id', ex_id)
+        self.assertTrue(result.is_error())
+        self.assertIn('redelivered', result.error)
+
+
+class AsyncioDefaultExecutorTest(DefaultExecutorTest):
+    def setUp(self):
+        super(AsyncioDefaultExecutorTest, self).setUp()
+
+        self.override_config('execution_mode', 'asyncio', 'executor')
+
+    def test_run_coroutine_action(self):
+        result = self.executor.run_action(_AsyncAction(0), None, False, {})
+
+        self.assertEqual('action-event-loop', result.data)
+
+    @mock.patch.object(std_actions.EchoAction, 'run')
+    def test_run_echo_action(self, run):
+        result = self.executor.run_action(
+            std_actions.EchoAction('output'),
+            None,
+            False,
+            {}
+        )
+
+        self.assertEqual('output', result.data)
+
+        run.assert_not_called()
+
+    def test_coroutine_timeout(self):
+        cancelled = threading.Event()
+
+        result = self.executor.run_action(
+            _AsyncAction(100, cancelled),
+            None,
+            False,
+            {},
+            timeout=0.1
+        )
+
+        self.assertTrue(result.is_error())
+        self.assertIn('Timeout after 0.1 seconds', result.error)
+
+        # The coroutine has really been cancelled.
+        self.assertTrue(cancelled.wait(10))
+        self.assertEqual(1, self.executor.get_stats()['timed_out'])
+
+    @mock.patch('mistral.services.action_heartbeat_sender.remove_action')
+    @mock.patch('mistral.services.action_heartbeat_sender.add_action')
+    def test_run_coroutine_action_detached(self, add_hb, remove_hb):
+        completed = threading.Event()
+
+        engine_client = mock.Mock()
+        engine_client.on_action_complete.side_effect = (
+            lambda *args, **kwargs: completed.set()
+        )
+
+        self.executor._engine_client = engine_client
+
+        # The calling thread doesn't wait for the action.
+        self.assertIsNone(
+            self.executor.run_action(_AsyncAction(0.1), 'ex-id', False, {})
+        )
+
+        self.assertTrue(completed.wait(10))
+
+        ex_id, result = engine_client.on_action_complete.call_args[0]
+
+        self.assertEqual('ex-id', ex_id)
+        self.assertEqual('action-event-loop', result.data)
+
+        add_hb.assert_called_once_with('ex-id')
+
+        self._await(lambda: remove_hb.called, delay=0.1)
+
+        remove_hb.assert_called_once_with('ex-id')
+
+    def test_stop_closes_event_loop_resources(self):
+        self.executor.run_action(_AsyncAction(0), None, False, {})
+
+        loop = self.executor._loop
+
+        with mock.patch.object(
+                std_actions,
+                'close_aiohttp_session',
+                mock.AsyncMock()) as close_session:
+            self.executor.stop()
+
+        close_session.assert_awaited_once_with()
+
+        self.assertIsNone(self.executor._loop)
+
+        self._await(lambda: not loop.is_running(), delay=0.1)
+
+        loop.close()
@@ -0,0 +1,117 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral.actions import std_actions
+from mistral import context as auth_context
+from mistral.executors import executor_server
+from mistral.executors import remote_executor as r_exe
+from mistral.tests.unit import base
+
+
+class RemoteExecutorTest(base.BaseTest):
+    def setUp(self):
+        super(RemoteExecutorTest, self).setUp()
+
+        auth_context.set_ctx(base.get_context())
+
+        self.addCleanup(auth_context.set_ctx, None)
+
+        with mock.patch('mistral.rpc.base.get_rpc_client_driver'):
+            self.executor = r_exe.RemoteExecutor()
+
+        self.action_requests = [
+            {
+                'action': std_actions.EchoAction(output=i),
+                'action_ex_id': 'ex-%s' % i,
+                'safe_rerun': False,
+                'exec_ctx': {'action_execution_id': 'ex-%s' % i},
+                'target': None,
+                'timeout': 10
+            }
+            for i in range(2)
+        ]
+
+    def test_run_actions(self):
+        self.executor.run_actions(self.action_requests)
+
+        rpc_client = self.executor._client
+
+        # Every action is sent with a separate call.
+        self.assertEqual(2, rpc_client.async_call.call_count)
+
+        for i, call in enumerate(rpc_client.async_call.call_args_list):
+            self.assertEqual('run_action', call[0][1])
+            self.assertEqual(
+                std_actions.EchoAction(output=i),
+                call[1]['action']
+            )
+
+    def test_run_actions_redelivered(self):
+        with mock.patch.object(self.executor, 'run_action') as run_action:
+            self.executor.run_actions(self.action_requests)
+
+        # The call shape is unchanged unless actions are redelivered.
+        for call in run_action.call_args_list:
+            self.assertNotIn('redelivered', call[1])
+
+        with mock.patch.object(self.executor, 'run_action') as run_action:
+            self.executor.run_actions(self.action_requests, redelivered=True)
+
+        self.assertEqual(2, run_action.call_count)
+
+        for call in run_action.call_args_list:
+            self.assertTrue(call[1]['redelivered'])
+
+    def test_run_actions_batched_rpc(self):
+        self.override_config('batched_rpc', True, 'executor')
+
+        self.executor.run_actions(self.action_requests)
+
+        rpc_client = self.executor._client
+
+        rpc_client.async_call.assert_called_once_with(
+            mock.ANY,
+            'run_actions',
+            action_requests=mock.ANY
+        )
+
+        rpc_kwargs = rpc_client.async_call.call_args[1]
+
+        # Pass the request to the executor server as the RPC server would.
+        server = executor_server.ExecutorServer(
+            mock.Mock(),
+            setup_profiler=False
+        )
+
+        server.run_actions(
+            mock.Mock(redelivered=None),
+            **rpc_kwargs
+        )
+
+        requests = server.executor.run_actions.call_args[0][0]
+
+        self.assertEqual(
+            [std_actions.EchoAction(output=i) for i in range(2)],
+            [req['action'] for req in requests]
+        )
+        self.assertEqual(
+            ['ex-0', 'ex-1'],
+            [req['action_ex_id'] for req in requests]
+        )
+        self.assertEqual(10, requests[0]['timeout'])
+        self.assertFalse(
+            server.executor.run_actions.call_args[1]['redelivered']
+        )
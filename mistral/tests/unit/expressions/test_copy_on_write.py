@@ -0,0 +1,88 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from mistral import expressions as expr
+from mistral.tests.unit import base
+
+
+def _build_data(size):
+    # A large, mostly constant structure with a couple of expressions
+    # similar to a big action input or workflow environment.
+    return {
+        'items': [
+            {
+                'id': i,
+                'name': 'item-%s' % i,
+                'tags': ['a', 'b', 'c'],
+                'attrs': {'size': i * 10, 'enabled': True}
+            }
+            for i in range(size)
+        ],
+        'token': '<% $.token %>',
+        'nested': {
+            'url': 'http://<% $.host %>/api',
+            'params': {'limit': 100}
+        }
+    }
+
+
+class CopyOnWriteTest(base.BaseTest):
+    def test_copy_on_write_vs_deepcopy(self):
+        data = _build_data(100)
+        ctx = {'token': '123', 'host': 'localhost'}
+
+        deep_res = expr.evaluate_recursively(data, ctx)
+        cow_res = expr.evaluate_recursively(data, ctx, copy_on_write=True)
+
+        self.assertEqual(deep_res, cow_res)
+        self.assertEqual('123', cow_res['token'])
+        self.assertEqual('http://localhost/api', cow_res['nested']['url'])
+
+        # Only the containers on the paths to the evaluated expressions
+        # are rebuilt, everything else is shared with the initial data.
+        self.assertIsNot(data, cow_res)
+        self.assertIsNot(data['nested'], cow_res['nested'])
+        self.assertIs(data['items'], cow_res['items'])
+        self.assertIs(data['nested']['params'], cow_res['nested']['params'])
+
+        # The initial data is not modified.
+        self.assertEqual('<% $.token %>', data['token'])
+
+    def test_copy_on_write_with_plan(self):
+        data = _build_data(100)
+        ctx = {'token': '123', 'host': 'localhost'}
+
+        plan = expr.build_plan(data)
+
+        res = expr.evaluate_recursively(
+            data,
+            ctx,
+            plan=plan,
+            copy_on_write=True
+        )
+
+        self.assertEqual(expr.evaluate_recursively(data, ctx), res)
+        self.assertIs(data['items'], res['items'])
+
+    def test_copy_on_write_nothing_evaluated(self):
+        data = {'a': [1, 2, {'b': 'c'}]}
+
+        self.assertIs(
+            data,
+            expr.evaluate_recursively(data, {'x': 1}, copy_on_write=True)
+        )
+        self.assertIs(
+            data,
+            expr.evaluate_recursively(data, {}, copy_on_write=True)
+        )
@@ -0,0 +1,136 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral import exceptions as exc
+from mistral import expressions
+from mistral.expressions import base as expr_base
+from mistral.expressions import jinja_expression
+from mistral.expressions import yaql_expression
+from mistral.tests.unit import base
+
+
+class ExpressionCacheTest(base.BaseTest):
+    def setUp(self):
+        super(ExpressionCacheTest, self).setUp()
+
+        expr_base.clear_expression_cache()
+
+        self.addCleanup(expr_base.clear_expression_cache)
+
+    def test_yaql_expression_compiled_once(self):
+        engine = yaql_expression.get_yaql_engine_class()
+
+        with mock.patch.object(
+                yaql_expression,
+                'get_yaql_engine_class',
+                return_value=mock.Mock(wraps=engine)) as get_engine:
+            for i in range(5):
+                self.assertEqual(
+                    i,
+                    expressions.evaluate('<% $.a %>', {'a': i})
+                )
+
+            self.assertEqual(1, get_engine.return_value.call_count)
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(4, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['size'])
+
+    def test_jinja_expression_compiled_once(self):
+        env = jinja_expression.JinjaEvaluator._env
+
+        with mock.patch.object(
+                env,
+                'compile_expression',
+                wraps=env.compile_expression) as compile_expr:
+            for i in range(5):
+                self.assertEqual(
+                    i,
+                    expressions.evaluate('{{ _.a }}', {'a': i})
+                )
+
+            self.assertEqual(1, compile_expr.call_count)
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(4, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+
+    def test_jinja_template_compiled_once(self):
+        for i in range(3):
+            self.assertEqual(
+                'a=%s' % i,
+                expressions.evaluate('a={{ _.a }}', {'a': i})
+            )
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(2, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+
+    def test_languages_do_not_share_entries(self):
+        expressions.evaluate('<% 1 + 2 %>', {})
+        expressions.evaluate('{{ 1 + 2 }}', {})
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(2, stats['size'])
+
+    def test_lru_eviction(self):
+        self.override_config('cache_size', 2, 'expressions')
+
+        for i in range(4):
+            expressions.evaluate('<% ' + str(i) + ' %>', {})
+
+        self.assertEqual(2, expr_base.get_expression_cache_stats()['size'])
+
+        # The oldest expression was evicted so it's compiled again.
+        expressions.evaluate('<% 0 %>', {})
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(5, stats['misses'])
+
+    def test_cache_disabled(self):
+        self.override_config('cache_size', 0, 'expressions')
+
+        for _ in range(3):
+            self.assertEqual(3, expressions.evaluate('<% 1 + 2 %>', {}))
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(0, stats['hits'])
+        self.assertEqual(3, stats['misses'])
+        self.assertEqual(0, stats['size'])
+
+    def test_invalid_expression_not_cached(self):
+        for _ in range(2):
+            self.assertRaises(
+                exc.YaqlEvaluationException,
+                expressions.evaluate,
+                '<% * %>',
+                {}
+            )
+
+        stats = expr_base.get_expression_cache_stats()
+
+        self.assertEqual(2, stats['misses'])
+        self.assertEqual(0, stats['size'])
@@ -586,6 +586,81 @@ class TaskSpecValidationOthers(v2_base.WorkflowSpecValidationTestCase):
                 expect_error=expect_error
             )
 
+    def test_input_and_publish_plans(self):
+        overlay = {
+            'test': {
+                'tasks': {
+                    'task1': {
+                        'action': 'test.mock',
+                        'input': {
+                            'k1': 'v1',
+                            'k2': {'k21': [1, 2, 3]},
+                            'k3': '<% $.v3 %>'
+                        },
+                        'publish': {
+                            'p1': 'constant',
+                            'p2': '{{ task().result }}'
+                        }
+                    }
+                }
+            }
+        }
+
+        wf_spec = self._parse_dsl_spec(add_tasks=False, changes=overlay)
+
+        task_spec = wf_spec.get_workflows()[0].get_tasks()['task1']
+
+        plan = task_spec.get_input_plan()
+
+        self.assertEqual(['k3'], list(plan.children))
+        self.assertEqual('yaql', plan.children['k3'].language)
+
+        # The plan is built once and then reused.
+        self.assertIs(plan, task_spec.get_input_plan())
+
+        publish_plan = task_spec.get_publish('SUCCESS').get_branch_plan()
+
+        self.assertEqual(['p2'], list(publish_plan.children))
+        self.assertEqual('jinja', publish_plan.children['p2'].language)
+
+        # Publish specs aren't rebuilt and merged again on every call.
+        self.assertIs(
+            publish_plan,
+            task_spec.get_publish('SUCCESS').get_branch_plan()
+        )
+
+    def test_merged_publish_plan(self):
+        overlay = {
+            'test': {
+                'tasks': {
+                    'task1': {
+                        'action': 'test.mock',
+                        'publish': {'p1': '<% $.v1 %>'},
+                        'on-complete': {
+                            'publish': {'branch': {'p2': '<% $.v2 %>'}}
+                        },
+                        'on-success': {
+                            'publish': {'branch': {'p3': 'constant'}}
+                        }
+                    }
+                }
+            }
+        }
+
+        wf_spec = self._parse_dsl_spec(add_tasks=False, changes=overlay)
+
+        task_spec = wf_spec.get_workflows()[0].get_tasks()['task1']
+
+        p1 = task_spec.get_publish('SUCCESS')
+        p2 = task_spec.get_publish('SUCCESS')
+
+        self.assertIs(p1, p2)
+        self.assertIs(p1.get_branch_plan(), p2.get_branch_plan())
+        self.assertEqual(
+            ['p1', 'p2'],
+            sorted(p1.get_branch_plan().children)
+        )
+
     def test_publish(self):
         tests = [
             ({'publish': ''}, True),
@@ -22,6 +22,7 @@ from oslo_utils import timeutils
 from mistral.db.v2 import api as db_api
 from mistral.scheduler import base as scheduler_base
 from mistral.scheduler import default_scheduler
+from mistral.scheduler import job_notifier
 from mistral.tests.unit import base
 from mistral.tests.unit.utils.test_utils import TimeoutThreadWithException
 
@@ -39,6 +40,8 @@ def target_method():
 
 
 class DefaultSchedulerTest(base.DbTestCase):
+    scheduler_cls = default_scheduler.DefaultScheduler
+
     def setUp(self):
         super(DefaultSchedulerTest, self).setUp()
 
@@ -58,7 +61,7 @@ class DefaultSchedulerTest(base.DbTestCase):
         self.override_config('random_delay', 1, 'scheduler')
         self.override_config('batch_size', 100, 'scheduler')
 
-        self.scheduler = default_scheduler.DefaultScheduler(CONF.scheduler)
+        self.scheduler = self.scheduler_cls(CONF.scheduler)
         self.scheduler.start()
 
         self.addCleanup(self.scheduler.stop, True)
@@ -79,6 +82,9 @@ class DefaultSchedulerTest(base.DbTestCase):
 
         self.target_mtd_finished.set()
 
+    def _get_in_memory_jobs(self, **filters):
+        return self.scheduler._get_in_memory_jobs(filters)
+
     def _wait_target_method_start(self):
         self.target_mtd_started.wait()
 
@@ -153,7 +159,7 @@ class DefaultSchedulerTest(base.DbTestCase):
 
             self.scheduler.schedule(job)
 
-            self._await(lambda: not self.scheduler.in_memory_jobs)
+            self._await(lambda: not self._get_in_memory_jobs())
 
         # The job wasn't captured, so it stays in the persistent store.
         self.assertEqual(1, len(db_api.get_scheduled_jobs()))
@@ -166,11 +172,11 @@ class DefaultSchedulerTest(base.DbTestCase):
 
         self.scheduler.schedule(job)
 
-        self.assertEqual(1, len(self.scheduler.in_memory_jobs))
+        self.assertEqual(1, len(self._get_in_memory_jobs()))
 
         self.scheduler.stop()
 
-        self.assertEqual(0, len(self.scheduler.in_memory_jobs))
+        self.assertEqual(0, len(self._get_in_memory_jobs()))
 
     @mock.patch(TARGET_METHOD_PATH)
     def test_jobs_run_in_execution_time_order(self, method):
@@ -222,6 +228,38 @@ class DefaultSchedulerTest(base.DbTestCase):
 
         method.assert_called_once_with(name='task', id='321')
 
+    @mock.patch(TARGET_METHOD_PATH)
+    def test_pickup_batch_from_job_store(self, method):
+        self.override_config('pickup_job_after', 1, 'scheduler')
+
+        calls = []
+
+        method.side_effect = lambda **kwargs: calls.append(kwargs['id'])
+
+        for i in range(5):
+            db_api.create_scheduled_job({
+                'run_after': 1,
+                'func_name': TARGET_METHOD_PATH,
+                'func_args': {'id': str(i)},
+                'execute_at': timeutils.utcnow(),
+                'captured_at': None,
+                'auth_ctx': {}
+            })
+
+        with mock.patch.object(
+                db_api,
+                'delete_scheduled_jobs',
+                wraps=db_api.delete_scheduled_jobs) as delete_jobs:
+            # All the jobs are captured, invoked and deleted at once.
+            self._await(lambda: not db_api.get_scheduled_jobs())
+
+            delete_jobs.assert_called_once()
+
+        self.assertEqual(
+            ['0', '1', '2', '3', '4'],
+            sorted(calls)
+        )
+
     @mock.patch(TARGET_METHOD_PATH)
     def test_recapture_job(self, method):
         # Delegate from the module function to the method of the test class.
@@ -261,3 +299,61 @@ class DefaultSchedulerTest(base.DbTestCase):
         # At least 3 seconds should have passed.
         self.assertTrue(
             timeutils.utcnow() - before_ts >= datetime.timedelta(seconds=3))
+
+
+class NotifiedDefaultSchedulerTest(base.DbTestCase):
+    def setUp(self):
+        super(NotifiedDefaultSchedulerTest, self).setUp()
+
+        self.override_config('job_notifier', 'local', 'scheduler')
+        self.override_config('notified_fixed_delay', 60, 'scheduler')
+        self.override_config('random_delay', 0, 'scheduler')
+        self.override_config('pickup_job_after', 1, 'scheduler')
+
+        job_notifier.cleanup()
+
+        self.addCleanup(job_notifier.cleanup)
+
+        self.notifier = job_notifier.get_job_notifier()
+
+        self.scheduler = default_scheduler.DefaultScheduler(CONF.scheduler)
+        self.scheduler.start()
+
+        self.addCleanup(self.scheduler.stop, True)
+
+    def test_local_notifier_loaded(self):
+        self.assertIsInstance(self.notifier, job_notifier.LocalJobNotifier)
+
+    @mock.patch(TARGET_METHOD_PATH)
+    def test_pickup_from_job_store_on_notification(self, method):
+        db_api.create_scheduled_job({
+            'run_after': 1,
+            'func_name': TARGET_METHOD_PATH,
+            'func_args': {'name': 'task', 'id': '321'},
+            'execute_at': timeutils.utcnow() - datetime.timedelta(seconds=5),
+            'captured_at': None,
+            'auth_ctx': {}
+        })
+
+        # Without a notification the job would only be picked up after
+        # "notified_fixed_delay" seconds.
+        self.notifier.notify(0)
+
+        self._await(lambda: not db_api.get_scheduled_jobs(), timeout=15)
+
+        method.assert_called_once_with(name='task', id='321')
+
+    def test_schedule_notifies_once_per_due_second(self):
+        job = scheduler_base.SchedulerJob(
+            run_after=100,
+            func_name=TARGET_METHOD_PATH,
+            func_args={'name': 'task', 'id': '321'}
+        )
+
+        # Pin the clock so that both jobs are due within the same second.
+        with mock.patch.object(self.notifier, 'notify') as notify, \
+                mock.patch('time.time', return_value=1000.5):
+            self.scheduler.schedule(job)
+            self.scheduler.schedule(job)
+
+        notify.assert_called_once_with(102)
@@ -0,0 +1,101 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from mistral.scheduler import base as scheduler_base
+from mistral.scheduler import timing_wheel_scheduler as tw_scheduler
+from mistral.tests.unit import base
+from mistral.tests.unit.scheduler import test_default_scheduler
+
+
+class _Job(object):
+    def __init__(self, id, key=None):
+        self.id = id
+        self.key = key
+
+
+class WheelShardTest(base.BaseTest):
+    def _advance(self, shard, tick):
+        return sorted(j.id for j in shard.advance(tick))
+
+    def test_fire_at_expiration_tick(self):
+        shard = tw_scheduler._WheelShard(0)
+
+        shard.add(_Job('1'), 5)
+        shard.add(_Job('2'), 5)
+        shard.add(_Job('3'), 7)
+
+        self.assertEqual([], self._advance(shard, 4))
+        self.assertEqual(['1', '2'], self._advance(shard, 5))
+        self.assertEqual(['3'], self._advance(shard, 10))
+        self.assertEqual(0, len(shard))
+
+    def test_cascade_from_higher_levels(self):
+        shard = tw_scheduler._WheelShard(10)
+
+        # One job per level and one beyond the range of all levels.
+        ticks = [10 + 30, 10 + 64 * 20, 10 + 64 ** 2 * 20, 64 ** 4 + 3]
+
+        for i, tick in enumerate(ticks):
+            shard.add(_Job(str(i)), tick)
+
+        for i, tick in enumerate(ticks):
+            self.assertEqual([], self._advance(shard, tick - 1))
+            self.assertEqual([str(i)], self._advance(shard, tick))
+
+    def test_overdue_job_fires_on_next_tick(self):
+        shard = tw_scheduler._WheelShard(100)
+
+        shard.add(_Job('1'), 50)
+
+        self.assertEqual(['1'], self._advance(shard, 101))
+
+    def test_remove(self):
+        shard = tw_scheduler._WheelShard(0)
+
+        job = _Job('1', key='k')
+
+        shard.add(job, 1000)
+
+        self.assertEqual({'k': {'1': job}}, shard.jobs_by_key)
+
+        shard.remove(job)
+
+        self.assertEqual({}, shard.jobs_by_key)
+        self.assertEqual(0, len(shard))
+        self.assertEqual([], self._advance(shard, 2000))
+
+
+class TimingWheelSchedulerTest(test_default_scheduler.DefaultSchedulerTest):
+    scheduler_cls = tw_scheduler.TimingWheelScheduler
+
+    def test_has_scheduled_jobs_by_key(self):
+        for i in range(3):
+            self.scheduler.schedule(scheduler_base.SchedulerJob(
+                run_after=10000,
+                func_name=test_default_scheduler.TARGET_METHOD_PATH,
+                key='key-%s' % i
+            ))
+
+        self.assertEqual(3, len(self._get_in_memory_jobs()))
+        self.assertEqual(1, len(self._get_in_memory_jobs(key='key-1')))
+        self.assertEqual(0, len(self._get_in_memory_jobs(key=None)))
+
+        self.assertTrue(self.scheduler.has_scheduled_jobs(key='key-1'))
+        self.assertTrue(
+            self.scheduler.has_scheduled_jobs(key='key-1', processing=False)
+        )
+        self.assertFalse(
+            self.scheduler.has_scheduled_jobs(key='key-1', processing=True)
+        )
+        self.assertFalse(self.scheduler.has_scheduled_jobs(key='key-3'))
@@ -0,0 +1,82 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+from unittest import mock
+
+from mistral.rpc import clients as rpc_clients
+from mistral.services import action_heartbeat_sender as sender
+from mistral.tests.unit import base
+
+
+class ActionHeartbeatSenderTest(base.BaseTest):
+    def setUp(self):
+        super(ActionHeartbeatSenderTest, self).setUp()
+
+        self.override_config('flush_batch_size', 3, 'action_heartbeat')
+
+        self.engine_client = mock.Mock()
+
+        self.patch(sender, '_enabled', True)
+        self.patch(sender, '_running_actions', set())
+        self.patch(sender, '_new_actions', set())
+        self.patch(sender, '_flush_event', mock.Mock())
+        self.patch(
+            rpc_clients,
+            'get_engine_client',
+            mock.Mock(return_value=self.engine_client)
+        )
+
+    def _sent_ids(self):
+        calls = self.engine_client.process_action_heartbeats.call_args_list
+
+        return [sorted(c[0][0]) for c in calls]
+
+    def test_new_actions_are_buffered(self):
+        sender.add_action('1')
+        sender.add_action('2')
+        sender.add_action(None)
+
+        # Nothing is sent when an action starts.
+        self.assertEqual([], self._sent_ids())
+        sender._flush_event.set.assert_not_called()
+
+        sender.send_new_action_heartbeats()
+        sender.send_new_action_heartbeats()
+
+        self.assertEqual([['1', '2']], self._sent_ids())
+
+    def test_flush_on_batch_size(self):
+        for i in range(3):
+            sender.add_action(str(i))
+
+        sender._flush_event.set.assert_called_once_with()
+
+    def test_removed_actions_are_not_sent(self):
+        sender.add_action('1')
+        sender.add_action('2')
+        sender.remove_action('1')
+
+        sender.send_new_action_heartbeats()
+        sender.send_action_heartbeats()
+
+        self.assertEqual([['2'], ['2']], self._sent_ids())
+
+    def test_heartbeats_cover_new_actions(self):
+        sender.add_action('1')
+        sender.add_action('2')
+
+        sender.send_action_heartbeats()
+        sender.send_new_action_heartbeats()
+
+        self.assertEqual([['1', '2']], self._sent_ids())
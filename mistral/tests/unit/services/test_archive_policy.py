@@ -0,0 +1,118 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+
+from mistral import context as ctx
+from mistral.db.v2 import api as db_api
+from mistral.services import archive_policy
+from mistral.tests.unit import base
+from mistral.workflow import states
+from mistral_lib import utils
+
+
+class ArchivePolicyTest(base.DbTestCase):
+    def setUp(self):
+        super(ArchivePolicyTest, self).setUp()
+
+        self.override_config(
+            'older_than',
+            30,
+            group='execution_archive_policy'
+        )
+        self.override_config(
+            'batch_size',
+            1,
+            group='execution_archive_policy'
+        )
+
+    def _create_root(self, wf_ex_id, state, minutes_ago):
+        db_api.create_workflow_execution(
+            {
+                'id': wf_ex_id,
+                'name': wf_ex_id,
+                'workflow_name': 'test_exec',
+                'state': state,
+                'updated_at': (
+                    utils.utc_now_sec() -
+                    datetime.timedelta(minutes=minutes_ago)
+                )
+            }
+        )
+
+    def test_run_execution_archive_policy(self):
+        for i in range(3):
+            self._create_root('old_%s' % i, states.SUCCESS, 60)
+
+        self._create_root('old_error', states.ERROR, 60)
+        self._create_root('old_running', states.RUNNING, 60)
+        self._create_root('recent', states.SUCCESS, 5)
+
+        task_ex = db_api.create_task_execution(
+            {'name': 'task', 'workflow_execution_id': 'old_0'}
+        )
+
+        db_api.create_action_execution(
+            {'name': 'action', 'task_execution_id': task_ex.id}
+        )
+
+        db_api.create_workflow_execution(
+            {
+                'id': 'sub',
+                'name': 'sub',
+                'state': states.SUCCESS,
+                'task_execution_id': task_ex.id
+            }
+        )
+
+        # Ignored states of the expiration policy don't apply.
+        self.override_config(
+            'ignored_states',
+            [states.ERROR],
+            group='execution_expiration_policy'
+        )
+
+        archive_policy.run_execution_archive_policy(self, ctx)
+
+        self.assertEqual(
+            ['old_running', 'recent'],
+            sorted(ex.id for ex in db_api.get_workflow_executions())
+        )
+        self.assertEqual([], db_api.get_task_executions())
+        self.assertEqual([], db_api.get_action_executions())
+
+        archived = db_api.get_archived_executions()
+
+        self.assertEqual(7, len(archived))
+        self.assertEqual(
+            ['old_0', 'old_1', 'old_2', 'old_error'],
+            sorted(a.id for a in archived if a.parent_id is None)
+        )
+        self.assertEqual(
+            {'old_0'},
+            {
+                a.root_execution_id for a in archived
+                if a.id in ('sub', task_ex.id)
+            }
+        )
+
+        # Only the recent execution is left to archive.
+        self.assertEqual(
+            1,
+            archive_policy.archive_executions(utils.utc_now_sec(), 10)
+        )
+        self.assertEqual(
+            ['old_running'],
+            [ex.id for ex in db_api.get_workflow_executions()]
+        )
@@ -0,0 +1,227 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import threading
+from unittest import mock
+
+from mistral.db.v2 import api as db_api
+from mistral import exceptions as exc
+from mistral.services import execution_watcher
+from mistral.services import workflows as wf_service
+from mistral.tests.unit import base
+from mistral.tests.unit.engine import base as engine_test_base
+from mistral.workflow import states
+from mistral_lib import actions as ml_actions
+
+
+class ExecutionWatcherTest(base.BaseTest):
+    def setUp(self):
+        super(ExecutionWatcherTest, self).setUp()
+
+        self.override_config('execution_watcher', 'local', 'api')
+
+        self.addCleanup(execution_watcher.cleanup)
+
+        self.watcher = execution_watcher.get_execution_watcher()
+
+    def _dispatch_later(self, ex_id, *states_to_dispatch):
+        def _dispatch():
+            for state in states_to_dispatch:
+                self.watcher.dispatch(ex_id, state)
+
+        t = threading.Timer(0.1, _dispatch)
+        t.start()
+
+        self.addCleanup(t.join)
+
+    def test_get_execution_watcher(self):
+        self.assertIsInstance(
+            self.watcher,
+            execution_watcher.LocalExecutionWatcher
+        )
+
+        self.override_config('execution_watcher', 'none', 'api')
+
+        self.assertIsNone(execution_watcher.get_execution_watcher())
+
+        self.assertRaises(
+            exc.NotAllowedException,
+            execution_watcher.wait_for_state_change,
+            'ex_id',
+            lambda: states.RUNNING
+        )
+
+    def test_wait_for_state_change(self):
+        # Changes of other executions and to the same state are ignored.
+        self._dispatch_later('ex_id', states.RUNNING)
+        self._dispatch_later('other_id', states.SUCCESS)
+        self._dispatch_later('ex_id', states.SUCCESS)
+
+        self.assertTrue(
+            execution_watcher.wait_for_state_change(
+                'ex_id',
+                lambda: states.RUNNING,
+                10
+            )
+        )
+
+        # Subscriptions are removed once requests stop waiting.
+        self.assertEqual({}, self.watcher._subscriptions)
+
+    def test_wait_for_state_change_timeout(self):
+        self._dispatch_later('ex_id', states.RUNNING)
+
+        self.assertFalse(
+            execution_watcher.wait_for_state_change(
+                'ex_id',
+                lambda: states.RUNNING,
+                1
+            )
+        )
+
+    def test_wait_for_state_change_max_timeout(self):
+        self.override_config('max_watch_timeout', 1, 'api')
+
+        self.assertFalse(
+            execution_watcher.wait_for_state_change(
+                'ex_id',
+                lambda: states.RUNNING,
+                3600
+            )
+        )
+
+    def test_max_watchers(self):
+        self.override_config('max_watchers', 1, 'api')
+
+        t = threading.Thread(
+            target=execution_watcher.wait_for_state_change,
+            args=('ex_id', lambda: states.RUNNING, 10)
+        )
+        t.start()
+
+        self._await(
+            lambda: execution_watcher._WATCHERS_COUNT == 1,
+            delay=0.1
+        )
+
+        self.assertRaises(
+            exc.TooManyRequestsException,
+            execution_watcher.wait_for_state_change,
+            'other_id',
+            lambda: states.RUNNING
+        )
+
+        # Requests which don't wait don't need a slot.
+        self.assertFalse(
+            execution_watcher.wait_for_state_change(
+                'other_id',
+                lambda: states.SUCCESS
+            )
+        )
+        self.assertFalse(
+            execution_watcher.wait_for_state_change('other_id', lambda: None)
+        )
+
+        self.watcher.dispatch('ex_id', states.SUCCESS)
+
+        t.join(10)
+
+        # The slot is released once the request stops waiting.
+        self.assertFalse(
+            execution_watcher.wait_for_state_change(
+                'other_id',
+                lambda: states.RUNNING,
+                0
+            )
+        )
+
+    def test_no_wait_for_completed_execution(self):
+        get_state = mock.MagicMock(return_value=states.SUCCESS)
+
+        with mock.patch.object(self.watcher, 'subscribe') as subscribe:
+            self.assertFalse(
+                execution_watcher.wait_for_state_change('ex_id', get_state)
+            )
+
+        subscribe.assert_called_once_with('ex_id')
+
+        self.assertFalse(
+            execution_watcher.wait_for_state_change('ex_id', lambda: None)
+        )
+
+
+WF = """---
+version: '2.0'
+
+wf:
+  tasks:
+    task1:
+      action: std.async_noop
+"""
+
+
+class ExecutionWatcherEngineTest(engine_test_base.EngineTestCase):
+    def setUp(self):
+        super(ExecutionWatcherEngineTest, self).setUp()
+
+        self.override_config('execution_watcher', 'local', 'api')
+
+        self.addCleanup(execution_watcher.cleanup)
+
+    def test_engine_notifies_state_changes(self):
+        wf_service.create_workflows(WF)
+
+        wf_ex = self.engine.start_workflow('wf')
+
+        with db_api.transaction():
+            wf_ex = db_api.get_workflow_execution(wf_ex.id)
+
+            task_ex = wf_ex.task_executions[0]
+
+        self.await_task_running(task_ex.id)
+
+        action_ex = db_api.get_action_executions(
+            task_execution_id=task_ex.id
+        )[0]
+
+        def _complete_action():
+            self.engine.on_action_complete(
+                action_ex.id,
+                ml_actions.Result(data='result')
+            )
+
+        def _get_state(ex_id):
+            state = db_api.load_workflow_execution(ex_id).state
+
+            # The action completes once the request is subscribed to
+            # the changes of the workflow execution.
+            t = threading.Thread(target=_complete_action)
+            t.start()
+
+            self.addCleanup(t.join)
+
+            return state
+
+        self.assertTrue(
+            execution_watcher.wait_for_state_change(
+                wf_ex.id,
+                lambda: _get_state(wf_ex.id),
+                10
+            )
+        )
+
+        self.assertEqual(
+            states.SUCCESS,
+            db_api.get_workflow_execution(wf_ex.id).state
+        )
@@ -15,6 +15,7 @@
 #    limitations under the License.
 
 import datetime
+from unittest import mock
 
 from oslo_config import cfg
 from oslo_utils import timeutils
@@ -368,6 +369,163 @@ class ExpirationPolicyTest(base.DbTestCase):
         _set_expiration_policy_config(None, None, None, None)
 
 
+class BulkPurgeExpirationPolicyTest(ExpirationPolicyTest):
+    """Runs the expiration policy tests with the bulk purge enabled."""
+
+    def setUp(self):
+        super(BulkPurgeExpirationPolicyTest, self).setUp()
+
+        self.override_config(
+            'bulk_purge',
+            True,
+            group='execution_expiration_policy'
+        )
+
+        expiration_policy.reset_purge_stats()
+
+    def _create_nested_executions(self):
+        time_now = utils.utc_now_sec()
+
+        for i in range(2):
+            wf_ex = db_api.create_workflow_execution(
+                {
+                    'id': 'root%s' % i,
+                    'name': 'root%s' % i,
+                    'updated_at': time_now - datetime.timedelta(days=1),
+                    'workflow_name': 'test_exec',
+                    'state': "SUCCESS"
+                }
+            )
+
+            for j in range(2):
+                task_ex = db_api.create_task_execution(
+                    {
+                        'name': 'task%s' % j,
+                        'workflow_execution_id': wf_ex.id
+                    }
+                )
+
+                db_api.create_action_execution(
+                    {'name': 'action', 'task_execution_id': task_ex.id}
+                )
+
+                sub_wf_ex = db_api.create_workflow_execution(
+                    {
+                        'name': 'sub',
+                        'workflow_name': 'test_exec',
+                        'state': "SUCCESS",
+                        'task_execution_id': task_ex.id
+                    }
+                )
+
+                db_api.create_task_execution(
+                    {
+                        'name': 'sub_task',
+                        'workflow_execution_id': sub_wf_ex.id
+                    }
+                )
+
+        db_api.create_workflow_execution(
+            {
+                'id': 'not_expired',
+                'name': 'not_expired',
+                'workflow_name': 'test_exec',
+                'state': "SUCCESS"
+            }
+        )
+
+    def test_bulk_purge_nested_executions(self):
+        self._create_nested_executions()
+
+        self.override_config(
+            'bulk_purge_rows_per_transaction',
+            3,
+            group='execution_expiration_policy'
+        )
+
+        _set_expiration_policy_config(evaluation_interval=1, older_than=60)
+
+        with mock.patch.object(
+                db_api,
+                'get_execution_trees_nodes',
+                wraps=db_api.get_execution_trees_nodes) as get_nodes:
+            with mock.patch.object(
+                    db_api,
+                    'delete_execution_nodes',
+                    wraps=db_api.delete_execution_nodes) as delete_nodes:
+                expiration_policy.run_execution_expiration_policy(self, ctx)
+
+        # The trees are resolved once and their 18 rows are deleted,
+        # 3 per transaction.
+        get_nodes.assert_called_once()
+
+        self.assertEqual(['root0', 'root1'], sorted(get_nodes.call_args[0][0]))
+        self.assertEqual(6, delete_nodes.call_count)
+
+        for call in delete_nodes.call_args_list:
+            self.assertEqual(3, len(call[0][0]))
+
+        self.assertEqual(
+            ['not_expired'],
+            [ex.id for ex in db_api.get_workflow_executions()]
+        )
+        self.assertEqual([], db_api.get_task_executions())
+        self.assertEqual([], db_api.get_action_executions())
+
+        stats = expiration_policy.get_purge_stats()
+
+        self.assertEqual(1, stats['runs'])
+        self.assertEqual(2, stats['purged_root_executions'])
+        self.assertEqual(6, stats['deleted_workflow_executions'])
+        self.assertEqual(8, stats['deleted_task_executions'])
+        self.assertEqual(4, stats['deleted_action_executions'])
+        self.assertTrue(stats['last_run']['completed'])
+        self.assertEqual(18, stats['last_run']['deleted_rows'])
+
+    def test_bulk_purge_time_budget(self):
+        self._create_nested_executions()
+
+        self.override_config(
+            'bulk_purge_time_budget',
+            10,
+            group='execution_expiration_policy'
+        )
+        self.override_config(
+            'bulk_purge_rows_per_transaction',
+            4,
+            group='execution_expiration_policy'
+        )
+
+        _set_expiration_policy_config(evaluation_interval=1, older_than=60)
+
+        # The budget runs out right after the first transaction.
+        with mock.patch.object(
+                expiration_policy.time,
+                'monotonic',
+                side_effect=[0, 1, 11, 12]):
+            expiration_policy.run_execution_expiration_policy(self, ctx)
+
+        stats = expiration_policy.get_purge_stats()
+
+        self.assertFalse(stats['last_run']['completed'])
+        self.assertEqual(0, stats['purged_root_executions'])
+        self.assertEqual(4, stats['last_run']['deleted_rows'])
+        self.assertEqual(4, stats['deleted_action_executions'])
+        self.assertEqual([], db_api.get_action_executions())
+        self.assertEqual(7, len(db_api.get_workflow_executions()))
+
+        # The next run deletes the rest.
+        expiration_policy.run_execution_expiration_policy(self, ctx)
+
+        stats = expiration_policy.get_purge_stats()
+
+        self.assertEqual(2, stats['runs'])
+        self.assertTrue(stats['last_run']['completed'])
+        self.assertEqual(2, stats['purged_root_executions'])
+        self.assertEqual(1, len(db_api.get_workflow_executions()))
+        self.assertEqual([], db_api.get_task_executions())
+
+
 def _set_expiration_policy_config(evaluation_interval, older_than, mfe=0,
                                   batch_size=0, ignored_states=[]):
     cfg.CONF.set_default(
@@ -44,3 +44,24 @@ class ContextTest(base.EngineTestCase):
         self.assertRaises(
             exceptions.MistralException,
             context._extract_mistral_auth_params, headers)
+
+    def test_use_db_reader(self):
+        get = context._get_use_db_reader
+
+        self.assertTrue(get({}, {'REQUEST_METHOD': 'GET'}))
+        self.assertTrue(get({}, {'REQUEST_METHOD': 'HEAD'}))
+        self.assertIsNone(get({}, {'REQUEST_METHOD': 'POST'}))
+        self.assertFalse(
+            get({'X-Read-From-Primary': 'True'}, {'REQUEST_METHOD': 'GET'})
+        )
+        self.assertTrue(
+            get({'X-Read-From-Primary': 'False'}, {'REQUEST_METHOD': 'GET'})
+        )
+
+    def test_use_db_reader_not_serialized(self):
+        ctx = context.MistralContext(use_db_reader=True)
+
+        self.assertNotIn('use_db_reader', ctx.to_dict())
+        self.assertIsNone(
+            context.MistralContext.from_dict(ctx.to_dict()).use_db_reader
+        )
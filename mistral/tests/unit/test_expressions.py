@@ -167,6 +167,94 @@ class ExpressionsTest(base.BaseTest):
 
         self.assertEqual(expected, applied['conn'])
 
+    def test_build_plan_string(self):
+        plan = expr.build_plan('Hello, <% $.j %> and <% $.k %>!')
+
+        self.assertFalse(plan.is_literal)
+        self.assertEqual('yaql', plan.language)
+        self.assertEqual(['Hello, ', ' and ', '!'], plan.literal_parts)
+        self.assertEqual(
+            ['<% $.j %>', '<% $.k %>'],
+            plan.expression_parts
+        )
+
+        plan = expr.build_plan('{% if _.a %}{{ _.a }}{% endif %}')
+
+        self.assertEqual('jinja', plan.language)
+        self.assertEqual(
+            ['{% if _.a %}', '{{ _.a }}', '{% endif %}'],
+            plan.expression_parts
+        )
+
+        self.assertTrue(expr.build_plan('No expressions').is_literal)
+        self.assertTrue(expr.build_plan(42).is_literal)
+
+    def test_build_plan_skips_literal_subtrees(self):
+        data = {
+            'constants': {'a': [1, 2, {'b': 'c'}], 'd': 'e'},
+            'values': ['x', '<% $.y %>'],
+            'token': '<% $.auth_token %>'
+        }
+
+        plan = expr.build_plan(data)
+
+        self.assertFalse(plan.is_literal)
+        self.assertEqual({'values', 'token'}, set(plan.children))
+        self.assertEqual({1}, set(plan.children['values'].children))
+
+        self.assertTrue(expr.build_plan({'a': {'b': [1, 'c']}}).is_literal)
+
+    def test_evaluate_recursively_with_plan(self):
+        context = {
+            "auth_token": "123",
+            "project_id": "mistral"
+        }
+
+        data = {
+            "parameters": {
+                "parameter1": {
+                    "name1": "<% $.auth_token %>",
+                    "name2": "val_name2"
+                },
+                "param2": [
+                    "var1",
+                    {"var2": ["a", "b"]},
+                    "/servers/{{ _.project_id }}/bla"
+                ]
+            },
+            "token": "<% $.auth_token %>"
+        }
+
+        plan = expr.build_plan(data)
+
+        applied = expr.evaluate_recursively(data, context, plan=plan)
+
+        self.assertDictEqual(
+            expr.evaluate_recursively(data, context),
+            applied
+        )
+        self.assertEqual('123', applied['token'])
+
+        # The data itself must not be modified or shared with the result.
+        self.assertEqual('<% $.auth_token %>', data['token'])
+        self.assertIsNot(
+            data['parameters']['param2'][1],
+            applied['parameters']['param2'][1]
+        )
+
+        # The same plan can be reused with a different context.
+        applied = expr.evaluate_recursively(
+            data,
+            {"auth_token": "456", "project_id": "p"},
+            plan=plan
+        )
+
+        self.assertEqual('456', applied['token'])
+        self.assertEqual(
+            '/servers/p/bla',
+            applied['parameters']['param2'][2]
+        )
+
     def test_validate_jinja_with_yaql_context(self):
         self.assertRaises(exc.JinjaGrammarException,
                           expr.validate,
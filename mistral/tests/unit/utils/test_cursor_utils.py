@@ -0,0 +1,57 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+
+from mistral import exceptions as exc
+from mistral.tests.unit import base
+from mistral.utils import cursor_utils
+
+
+class CursorUtilsTest(base.BaseTest):
+    def test_encode_decode(self):
+        values = {
+            'created_at': datetime.datetime(2026, 1, 2, 3, 4, 5, 6),
+            'name': 'wf "with" ünicode',
+            'priority': 3,
+            'id': '123e4567-e89b-12d3-a456-426655440000'
+        }
+
+        cursor = cursor_utils.encode_cursor(
+            ['created_at', 'name', 'priority', 'id'],
+            ['asc', 'desc', 'asc', 'asc'],
+            values
+        )
+
+        # Markers are passed in URLs as is.
+        self.assertRegex(cursor, r'^[A-Za-z0-9_-]+$')
+
+        self.assertEqual(
+            (
+                ['created_at', 'name', 'priority', 'id'],
+                ['asc', 'desc', 'asc', 'asc'],
+                values
+            ),
+            cursor_utils.decode_cursor(cursor)
+        )
+
+    def test_decode_invalid(self):
+        for cursor in ('', 'not a cursor', 'W1tdXQ', 'e30',
+                       cursor_utils.encode_cursor(['id'], ['asc'],
+                                                  {'id': 1})[:-2]):
+            self.assertRaises(
+                exc.InputException,
+                cursor_utils.decode_cursor,
+                cursor
+            )
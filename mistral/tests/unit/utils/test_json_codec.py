@@ -0,0 +1,162 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import datetime
+import math
+import unittest
+from unittest import mock
+
+from mistral.tests.unit import base
+from mistral import utils
+from mistral.utils import json_codec
+from mistral.workflow import data_flow
+
+
+class _Item(object):
+    def __init__(self, name):
+        self.name = name
+
+
+def _get_values():
+    return [
+        {},
+        [],
+        {'str': 'value', 'int': 1, 'float': 0.1, 'bool': True, 'none': None},
+        {'unicode': 'héllo ☃', 'escaped': 'a "quoted"\n\tstring'},
+        {'nested': {'list': [1, [2, (3, 4)], {'a': {'b': {'c': 'd'}}}]}},
+        {1: 'int key', 2.5: 'float key', None: 'none key'},
+        {'big_int': 2 ** 70, 'nan': float('nan'), 'inf': float('inf')},
+        {'datetime': datetime.datetime(2026, 1, 2, 3, 4, 5)},
+        {'set': {1}, 'generator': (i for i in range(3))},
+        {'object': _Item('item')},
+        {
+            '__execution': {'id': '123', 'params': {'namespace': ''}},
+            'vm_ids': ['vm-%s' % i for i in range(10)],
+            'result': {'status': 200, 'content': {'servers': []}}
+        }
+    ]
+
+
+class JsonCodecTest(base.BaseTest):
+    def setUp(self):
+        super(JsonCodecTest, self).setUp()
+
+        self.addCleanup(json_codec.cleanup)
+
+    def _get_codec(self, codec_name):
+        json_codec.cleanup()
+
+        self.override_config('json_codec', codec_name)
+
+        return json_codec.get_json_codec()
+
+    def test_none(self):
+        for codec in (json_codec.StdlibJsonCodec, json_codec.OrjsonCodec):
+            self.assertIsNone(codec.encode(None))
+            self.assertIsNone(codec.decode(None))
+
+    def test_encode_compatible(self):
+        for codec in (json_codec.StdlibJsonCodec, json_codec.OrjsonCodec):
+            # Values are built twice because generators can be consumed
+            # only once.
+            for expected, value in zip(_get_values(), _get_values()):
+                self.assertEqual(
+                    utils.to_json_str(expected),
+                    codec.encode(value)
+                )
+
+    def test_encode_dict_subclass(self):
+        # ContextView keeps its data outside of the dict storage.
+        value = {
+            'output': data_flow.ContextView({'a': 1}, {'param': 'value'})
+        }
+
+        for codec in (json_codec.StdlibJsonCodec, json_codec.OrjsonCodec):
+            self.assertEqual(
+                {'output': {'a': 1, 'param': 'value'}},
+                utils.from_json_str(codec.encode(value))
+            )
+
+    def test_decode(self):
+        for codec in (json_codec.StdlibJsonCodec, json_codec.OrjsonCodec):
+            for value in _get_values():
+                json_str = utils.to_json_str(value)
+
+                expected = utils.from_json_str(json_str)
+                actual = codec.decode(json_str)
+
+                if 'nan' in expected:
+                    self.assertTrue(math.isnan(actual.pop('nan')))
+
+                    expected.pop('nan')
+
+                self.assertEqual(expected, actual)
+
+    @unittest.skipIf(not json_codec._ORJSON, 'orjson is not installed')
+    def test_decode_with_orjson(self):
+        json_str = utils.to_json_str(_get_values()[-1])
+
+        with mock.patch.object(
+                json_codec._ORJSON,
+                'loads',
+                wraps=json_codec._ORJSON.loads) as loads:
+            self.assertEqual(
+                utils.from_json_str(json_str),
+                json_codec.OrjsonCodec.decode(json_str)
+            )
+
+        loads.assert_called_once_with(json_str)
+
+    def test_get_json_codec(self):
+        self.assertIs(
+            json_codec.StdlibJsonCodec,
+            self._get_codec('stdlib')
+        )
+        self.assertIs(json_codec.OrjsonCodec, self._get_codec('orjson'))
+
+        with mock.patch.object(json_codec, '_ORJSON', None):
+            self.assertIs(
+                json_codec.StdlibJsonCodec,
+                self._get_codec('auto')
+            )
+
+        with mock.patch.object(json_codec, '_ORJSON', mock.Mock()):
+            self.assertIs(json_codec.OrjsonCodec, self._get_codec('auto'))
+
+    def test_compress(self):
+        json_str = utils.to_json_str(
+            {'items': ['item-%s' % i for i in range(100)]}
+        )
+
+        # Disabled by default.
+        self.assertIs(json_str, json_codec.compress(json_str))
+
+        self.override_config('json_compression', True)
+        self.override_config('json_compression_threshold', 100)
+
+        compressed = json_codec.compress(json_str)
+
+        self.assertTrue(json_codec.is_compressed(compressed))
+        self.assertLess(len(compressed), len(json_str))
+        self.assertEqual(json_str, json_codec.decompress(compressed))
+
+        # Plain values are returned as is.
+        self.assertIs(json_str, json_codec.decompress(json_str))
+        self.assertIsNone(json_codec.compress(None))
+        self.assertIsNone(json_codec.decompress(None))
+
+        # Short values are not compressed.
+        self.override_config('json_compression_threshold', len(json_str) + 1)
+
+        self.assertIs(json_str, json_codec.compress(json_str))
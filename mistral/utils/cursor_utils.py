@@ -0,0 +1,78 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import base64
+import binascii
+import datetime
+import json
+
+from mistral import exceptions as exc
+
+
+def _encode_cursor_value(value):
+    if isinstance(value, datetime.datetime):
+        return {'datetime': value.isoformat()}
+
+    return value
+
+
+def _decode_cursor_value(value):
+    if isinstance(value, dict):
+        return datetime.datetime.fromisoformat(value['datetime'])
+
+    return value
+
+
+def encode_cursor(sort_keys, sort_dirs, values):
+    """Builds a marker carrying the sort key values of a resource.
+
+    Unlike a resource ID, such a marker lets the next page be read without
+    loading the resource first.
+
+    :param sort_keys: Sort keys of the list.
+    :param sort_dirs: Sort directions of the list.
+    :param values: Dict of the sort key values of the last resource of
+        the page.
+    :return: An opaque URL safe string.
+    """
+    data = json.dumps(
+        [sort_keys, sort_dirs, [_encode_cursor_value(values[k])
+                                for k in sort_keys]],
+        separators=(',', ':')
+    )
+
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Parses a marker built by encode_cursor().
+
+    :return: Tuple (sort_keys, sort_dirs, values).
+    :raises InputException: If the marker is not valid.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+
+        sort_keys, sort_dirs, values = json.loads(data)
+
+        if not len(sort_keys) == len(sort_dirs) == len(values):
+            raise ValueError('Unexpected number of values')
+
+        values = {
+            k: _decode_cursor_value(v) for k, v in zip(sort_keys, values)
+        }
+    except (binascii.Error, KeyError, TypeError, ValueError) as e:
+        raise exc.InputException('Invalid marker: %s [error=%s]' % (cursor, e))
+
+    return sort_keys, sort_dirs, values
@@ -0,0 +1,197 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import abc
+import base64
+import json
+import zlib
+
+from oslo_utils import importutils
+from stevedore import driver
+
+from mistral import config as cfg
+from mistral import utils
+
+_ORJSON = importutils.try_import('orjson')
+_CODEC = None
+
+# A JSON text can't start with "~" so this prefix tells compressed values
+# from plain ones.
+_COMPRESSED_PREFIX = '~zlib:'
+
+
+_PRIMITIVE_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_plain(obj):
+    """Tells whether an object consists of exact dicts, lists and primitives.
+
+    Subclasses of dict may keep their data outside of the dict storage,
+    e.g. data_flow.ContextView, and the C encoder of the "json" module
+    would then write them as empty dicts.
+    """
+    stack = [obj]
+
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+
+        if value_type is dict:
+            if not all(type(k) is str for k in value):
+                return False
+
+            stack.extend(value.values())
+        elif value_type is list:
+            stack.extend(value)
+        elif value_type not in _PRIMITIVE_TYPES:
+            return False
+
+    return True
+
+
+class JsonCodec(object, metaclass=abc.ABCMeta):
+    """Converts values of JSON columns to strings and back."""
+
+    @classmethod
+    @abc.abstractmethod
+    def encode(cls, obj):
+        """Serializes an object into a JSON string.
+
+        :param obj: Object to serialize.
+        :return: JSON string or None if the object is None.
+        """
+        pass
+
+    @classmethod
+    @abc.abstractmethod
+    def decode(cls, json_str):
+        """Reconstructs an object from a JSON string.
+
+        :param json_str: JSON string.
+        :return: Deserialized object or None if the string is None.
+        """
+        pass
+
+
+class StdlibJsonCodec(JsonCodec):
+    """Codec based on the "json" module of the standard library."""
+
+    @classmethod
+    def encode(cls, obj):
+        if obj is None:
+            return None
+
+        # Most values consist of primitives only, the C encoder of the
+        # "json" module serializes them as utils.to_json_str() does but
+        # without converting the whole object graph into primitives first.
+        if _is_plain(obj):
+            try:
+                return json.dumps(obj)
+            except ValueError:
+                pass
+
+        return utils.to_json_str(obj)
+
+    @classmethod
+    def decode(cls, json_str):
+        return utils.from_json_str(json_str)
+
+
+class OrjsonCodec(StdlibJsonCodec):
+    """Codec decoding JSON strings with the "orjson" library.
+
+    Strings are still encoded with the standard library because "orjson"
+    formats them differently and values already stored in the database
+    must not change when they are written again.
+    """
+
+    @classmethod
+    def decode(cls, json_str):
+        if json_str is None or not _ORJSON:
+            return super(OrjsonCodec, cls).decode(json_str)
+
+        try:
+            return _ORJSON.loads(json_str)
+        except ValueError:
+            # "orjson" is stricter than the standard library, e.g. it
+            # doesn't accept NaN or integers not fitting into 64 bits.
+            return super(OrjsonCodec, cls).decode(json_str)
+
+
+def get_json_codec():
+    global _CODEC
+
+    if not _CODEC:
+        codec_name = cfg.CONF.json_codec
+
+        if codec_name == 'auto':
+            codec_name = 'orjson' if _ORJSON else 'stdlib'
+
+        mgr = driver.DriverManager(
+            'mistral.json.codecs',
+            codec_name,
+            invoke_on_load=False
+        )
+
+        _CODEC = mgr.driver
+
+    return _CODEC
+
+
+def cleanup():
+    global _CODEC
+
+    _CODEC = None
+
+
+def encode(obj):
+    return get_json_codec().encode(obj)
+
+
+def decode(json_str):
+    return get_json_codec().decode(json_str)
+
+
+def is_compressed(value):
+    return value is not None and value.startswith(_COMPRESSED_PREFIX)
+
+
+def compress(json_str):
+    """Compresses a JSON string if compression is enabled.
+
+    :param json_str: JSON string.
+    :return: The compressed string if compression is enabled, the string
+        is long enough and compressing it pays off, the given string
+        otherwise.
+    """
+    if (json_str is None or
+            not cfg.CONF.json_compression or
+            len(json_str) < cfg.CONF.json_compression_threshold):
+        return json_str
+
+    data = zlib.compress(json_str.encode('utf-8'))
+
+    res = _COMPRESSED_PREFIX + base64.b64encode(data).decode('ascii')
+
+    return res if len(res) < len(json_str) else json_str
+
+
+def decompress(value):
+    """Returns the JSON string of a value built by compress()."""
+    if not is_compressed(value):
+        return value
+
+    data = base64.b64decode(value[len(_COMPRESSED_PREFIX):])
+
+    return zlib.decompress(data).decode('utf-8')
@@ -15,28 +15,49 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import datetime
 import functools
+import hashlib
 import json
+import threading
 
+import cachetools
 from oslo_config import cfg
 from oslo_db import exception as db_exc
 from oslo_log import log as logging
+from oslo_utils import uuidutils
 import pecan
 import sqlalchemy as sa
+from sqlalchemy.orm import attributes as orm_attrs
 from sqlalchemy.orm import exc as sa_exc
 import tenacity
 import webob
+import wsme.api
 from wsme import exc as wsme_exc
+from wsme.rest import json as wsme_json
 
 
 from mistral import context as auth_ctx
 from mistral.db import utils as db_utils
 from mistral.db.v2.sqlalchemy import api as db_api
 from mistral import exceptions as exc
+from mistral.utils import cursor_utils
+from mistral_lib import utils
 
 
 LOG = logging.getLogger(__name__)
 
+NDJSON_CONTENT_TYPE = 'application/x-ndjson'
+
+# The number of rows fetched from a database cursor at once when
+# resources are streamed.
+STREAM_FETCH_SIZE = 100
+
+JSON_CONTENT_TYPE = 'application/json'
+
+_RESPONSE_CACHE = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
 
 def wrap_wsme_controller_exception(func):
     """Decorator for controllers method.
@@ -172,6 +193,167 @@ def filters_to_dict(**kwargs):
     return {k: v for k, v in kwargs.items() if v is not None}
 
 
+def ndjson_streamable(func):
+    """Decorator for controller methods returning lists.
+
+    Makes Pecan accept requests preferring newline delimited JSON so that
+    get_all() streams the resources instead of returning one page. It must
+    be applied on top of wsexpose().
+    """
+    # Errors are still rendered as JSON documents.
+    pecan.util._cfg(func).setdefault('content_types', {})[
+        NDJSON_CONTENT_TYPE
+    ] = 'wsmejson:'
+
+    return func
+
+
+def is_ndjson_requested():
+    """Returns True if newline delimited JSON was negotiated by Pecan."""
+    return pecan.request.pecan.get('content_type') == NDJSON_CONTENT_TYPE
+
+
+def _get_sort_key_values(row, sort_keys, fields):
+    if fields:
+        values = dict(zip(fields, row))
+
+        return {k: values[k] for k in sort_keys}
+
+    return {k: getattr(row, k) for k in sort_keys}
+
+
+def _get_query_fields(fields, sort_keys):
+    # Values of the sort keys are needed to build the marker of
+    # the next page.
+    return fields + [k for k in sort_keys if k not in fields]
+
+
+def _get_resource_from_row(cls, row, query_fields, fields, sort_keys):
+    # NOTE: "query_fields" must be the list given to the DB API since
+    # some functions replace fields in place, e.g. 'input' with 'spec'.
+    # Sort keys which were not requested are left out.
+    extra_fields = set(sort_keys) - set(fields)
+
+    return cls.from_tuples(
+        (f, v) for f, v in zip(query_fields, row) if f not in extra_fields
+    )
+
+
+def stream_all(cls, get_all_function, resource_function=None, marker=None,
+               limit=None, sort_keys=None, sort_dirs=None, fields=None,
+               insecure=False, **filters):
+    """Returns a generator of resources serialized as JSON lines.
+
+    Resources are read with keyset pagination, [api] stream_page_size
+    resources per transaction, and every page is read from a server side
+    cursor so that the memory used doesn't depend on the number of
+    resources. Pages are serialized within their transaction and sent
+    once it is closed. Each line is the JSON document the resource would
+    have in a regular list response.
+
+    See get_all() for the parameters.
+    """
+    page_size = cfg.CONF.api.stream_page_size
+
+    query_fields = _get_query_fields(fields, sort_keys) if fields else None
+
+    ctx = auth_ctx.ctx()
+
+    def _get_page_limit(remaining):
+        if remaining is None:
+            return page_size
+
+        return min(page_size, remaining)
+
+    def _load_page(page_marker, page_limit):
+        # NOTE: Transactions hold a process-wide lock so a slow client
+        # must not keep one open while it reads the page.
+        lines = []
+
+        old_ctx = auth_ctx.ctx() if auth_ctx.has_ctx() else None
+
+        # The request context is already cleared when the response
+        # body is sent.
+        auth_ctx.set_ctx(ctx)
+
+        try:
+            with db_api.transaction(read_only=True):
+                rows = get_all_function(
+                    limit=page_limit,
+                    marker=page_marker,
+                    sort_keys=list(sort_keys),
+                    sort_dirs=list(sort_dirs),
+                    fields=query_fields,
+                    insecure=insecure,
+                    yield_per=STREAM_FETCH_SIZE,
+                    **filters
+                )
+
+                for row in rows:
+                    if fields:
+                        resource = _get_resource_from_row(
+                            cls,
+                            row,
+                            query_fields,
+                            fields,
+                            sort_keys
+                        )
+                    elif resource_function:
+                        resource = resource_function(row)
+                    else:
+                        resource = cls.from_db_model(row)
+
+                    page_marker = _get_sort_key_values(
+                        row,
+                        sort_keys,
+                        query_fields
+                    )
+
+                    line = json.dumps(wsme_json.tojson(cls, resource))
+
+                    lines.append((line + '\n').encode('utf-8'))
+        finally:
+            auth_ctx.set_ctx(old_ctx)
+
+        return lines, page_marker
+
+    # The first page is read right away so that invalid parameters are
+    # still reported with an error status.
+    first_page = (
+        _load_page(marker, _get_page_limit(limit))
+        if limit is None or limit > 0 else ([], marker)
+    )
+
+    def _chunks():
+        # An empty chunk keeps Pecan from replacing an empty list with
+        # a 204 status.
+        yield b''
+
+        lines, page_marker = first_page
+        remaining = limit
+
+        while True:
+            page_limit = _get_page_limit(remaining)
+
+            yield from lines
+
+            if len(lines) < page_limit:
+                break
+
+            if remaining is not None:
+                remaining -= len(lines)
+
+                if remaining <= 0:
+                    break
+
+            lines, page_marker = _load_page(
+                page_marker,
+                _get_page_limit(remaining)
+            )
+
+    return _chunks()
+
+
 def get_all(list_cls, cls, get_all_function, get_function,
             resource_function=None, marker=None, limit=None,
             sort_keys=None, sort_dirs=None, fields=None,
@@ -186,7 +368,9 @@ def get_all(list_cls, cls, get_all_function, get_function,
                              fields)
     :param get_function: Function used to fetch the marker
     :param resource_function: Optional, function used to fetch additional data
-    :param marker: Optional. Pagination marker for large data sets.
+    :param marker: Optional. Pagination marker for large data sets, either
+                   the ID of the last resource of the previous page or
+                   a marker built by cursor_utils.encode_cursor().
     :param limit: Optional. Maximum number of resources to return in a
                   single result. Default value is None for backward
                   compatibility.
@@ -201,6 +385,11 @@ def get_all(list_cls, cls, get_all_function, get_function,
                    constructing 'next' link.
     :param filters: Optional. A specified dictionary of filters to match.
     :param all_projects: Optional. Get resources of all projects.
+
+    If the controller method is decorated with ndjson_streamable() and the
+    client prefers newline delimited JSON, all the resources are streamed
+    as JSON lines instead, see stream_all(). "get_all_function" must then
+    support the "yield_per" parameter.
     """
     sort_keys = ['created_at'] if sort_keys is None else sort_keys
     sort_dirs = ['asc'] if sort_dirs is None else sort_dirs
@@ -209,10 +398,14 @@ def get_all(list_cls, cls, get_all_function, get_function,
     if fields and 'id' not in fields:
         fields.insert(0, 'id')
 
+    stream = is_ndjson_requested()
+
     # Cap the page size to avoid unbounded result sets exhausting memory.
     # A request without a limit (or with a larger one) is clamped to the
     # configured maximum; the 'next' marker lets callers page further.
-    limit = clamp_limit(limit)
+    # Streamed lists are read page by page so they don't need it.
+    if not stream:
+        limit = clamp_limit(limit)
 
     validate_query_params(limit, sort_keys, sort_dirs)
     validate_fields(fields, cls.get_fields())
@@ -225,22 +418,66 @@ def get_all(list_cls, cls, get_all_function, get_function,
             (auth_ctx.ctx().is_admin)):
         insecure = True
 
+    # Resources with the same sort key values are sorted by ID so that
+    # the last resource of a page always tells where the next one starts.
+    query_sort_keys = list(sort_keys)
+    query_sort_dirs = list(sort_dirs)
+
+    if 'id' not in query_sort_keys:
+        query_sort_keys.append('id')
+        query_sort_dirs.append('asc')
+
     marker_obj = None
 
-    if marker:
+    if marker and uuidutils.is_uuid_like(marker):
         marker_obj = get_function(marker)
+    elif marker:
+        cursor_keys, cursor_dirs, marker_obj = (
+            cursor_utils.decode_cursor(marker)
+        )
+
+        if (cursor_keys != query_sort_keys or
+                cursor_dirs != query_sort_dirs):
+            raise exc.InputException(
+                "The marker doesn't match the sort keys and directions."
+            )
+
+    if stream:
+        pecan.response.app_iter = stream_all(
+            cls,
+            get_all_function,
+            resource_function=resource_function,
+            marker=marker_obj,
+            limit=limit,
+            sort_keys=query_sort_keys,
+            sort_dirs=query_sort_dirs,
+            fields=fields,
+            insecure=insecure,
+            **filters
+        )
+
+        pecan.override_template(None, NDJSON_CONTENT_TYPE)
+
+        # The body is already set, there's nothing for WSME to render.
+        return wsme.api.Response(None, status_code=200, return_type=None)
 
     def _get_all_function():
-        with db_api.transaction():
+        with db_api.transaction(read_only=True):
             db_models = get_all_function(
                 limit=limit,
                 marker=marker_obj,
-                sort_keys=sort_keys,
-                sort_dirs=sort_dirs,
+                sort_keys=list(query_sort_keys),
+                sort_dirs=list(query_sort_dirs),
                 insecure=insecure,
                 **filters
             )
 
+            # Only a full page has a link to the next one.
+            if db_models and len(db_models) == limit:
+                last_values.update(
+                    _get_sort_key_values(db_models[-1], query_sort_keys, None)
+                )
+
             for db_model in db_models:
                 try:
                     if resource_function:
@@ -262,29 +499,47 @@ def get_all(list_cls, cls, get_all_function, get_function,
                     )
 
     rest_resources = []
+    last_values = {}
 
     r = create_db_retry_object()
 
     # If only certain fields are requested then we ignore "resource_function"
     # parameter because it doesn't make sense anymore.
     if fields:
+        query_fields = _get_query_fields(fields, query_sort_keys)
+
         # Use retries to prevent possible failures.
         db_list = r.call(
             get_all_function,
             limit=limit,
             marker=marker_obj,
-            sort_keys=sort_keys,
-            sort_dirs=sort_dirs,
-            fields=fields,
+            sort_keys=list(query_sort_keys),
+            sort_dirs=list(query_sort_dirs),
+            fields=query_fields,
             insecure=insecure,
             **filters
         )
 
+        if db_list and len(db_list) == limit:
+            last_values.update(
+                _get_sort_key_values(
+                    db_list[-1],
+                    query_sort_keys,
+                    query_fields
+                )
+            )
+
         for obj_values in db_list:
             # Note: in case if only certain fields have been requested
             # "db_list" contains tuples with values of db objects.
             rest_resources.append(
-                cls.from_tuples(zip(fields, obj_values))
+                _get_resource_from_row(
+                    cls,
+                    obj_values,
+                    query_fields,
+                    fields,
+                    query_sort_keys
+                )
             )
     else:
         r.call(_get_all_function)
@@ -293,6 +548,13 @@ def get_all(list_cls, cls, get_all_function, get_function,
         rest_resources,
         limit,
         pecan.request.application_url,
+        marker=(
+            cursor_utils.encode_cursor(
+                query_sort_keys,
+                query_sort_dirs,
+                last_values
+            ) if last_values else None
+        ),
         sort_keys=','.join(sort_keys),
         sort_dirs=','.join(sort_dirs),
         fields=','.join(fields) if fields else '',
@@ -300,6 +562,92 @@ def get_all(list_cls, cls, get_all_function, get_function,
     )
 
 
+def _get_response_cache():
+    global _RESPONSE_CACHE
+
+    size = cfg.CONF.api.response_cache_size
+
+    if _RESPONSE_CACHE is None or _RESPONSE_CACHE.maxsize != size:
+        _RESPONSE_CACHE = cachetools.LRUCache(maxsize=size) if size else None
+
+    return _RESPONSE_CACHE
+
+
+def _is_cacheable(versions):
+    min_age = datetime.timedelta(
+        seconds=cfg.CONF.api.response_cache_min_age
+    )
+
+    # Changes made within the same second as the last update of a resource
+    # don't change its update time.
+    last_change = max(
+        (updated_at or created_at for _, created_at, updated_at in versions),
+        default=None
+    )
+
+    return last_change is None or last_change <= utils.utc_now_sec() - min_age
+
+
+def _get_etag(path, versions):
+    data = json.dumps([path, [list(v) for v in versions]], default=str)
+
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def get_cached(cls, get_versions, get_resource):
+    """Returns a resource, from the response cache if it's possible.
+
+    The cache is used if [api] response_cache_size is set and the client
+    accepts JSON. Cached responses get an ETag built from the request path
+    and the versions of the database objects they are made of so that
+    requests with a matching "If-None-Match" header get a 304 response.
+    Either way, only the versions are read from the database.
+
+    :param cls: Resource class.
+    :param get_versions: Function returning the (id, created_at,
+        updated_at) tuples of all database objects the resource is built
+        from or None if the resource can't be cached. It must only read
+        these columns.
+    :param get_resource: Function returning the resource.
+    """
+    cache = _get_response_cache()
+
+    if (cache is None or
+            pecan.request.pecan.get('content_type') != JSON_CONTENT_TYPE):
+        return get_resource()
+
+    versions = get_versions()
+
+    if versions is None or not _is_cacheable(versions):
+        return get_resource()
+
+    path = pecan.request.path_qs
+    etag = _get_etag(path, versions)
+
+    pecan.response.etag = etag
+
+    if etag in pecan.request.if_none_match:
+        return wsme.api.Response(None, status_code=304, return_type=None)
+
+    key = (auth_ctx.ctx().project_id, path)
+
+    with _RESPONSE_CACHE_LOCK:
+        cached_etag, body = cache.get(key, (None, None))
+
+    if cached_etag != etag:
+        body = wsme_json.encode_result(get_resource(), cls)
+
+        with _RESPONSE_CACHE_LOCK:
+            cache[key] = (etag, body)
+
+    pecan.response.body = body.encode('utf-8')
+
+    pecan.override_template(None, JSON_CONTENT_TYPE)
+
+    # The body is already set, there's nothing for WSME to render.
+    return wsme.api.Response(None, status_code=200, return_type=None)
+
+
 class MistralRetrying(tenacity.Retrying):
     def __call__(self, fn, *args, **kwargs):
         try:
@@ -341,6 +689,54 @@ def load_deferred_fields(ex, fields):
     return ex
 
 
+def _load_archived_execution(id, ex_type):
+    arch_ex = db_api.load_archived_execution(id, ex_type=ex_type)
+
+    return arch_ex.to_execution() if arch_ex else None
+
+
+@rest_retry_on_db_error
+def load_archived_execution(id, ex_type):
+    """Returns an execution moved to the archive or None if there's none.
+
+    The execution is detached from any session. For a task execution, its
+    workflow execution and the executions of its actions or sub-workflows
+    are loaded from the archive as well since they are needed to build
+    its REST resource.
+
+    :param id: Execution id.
+    :param ex_type: Execution type ("workflow", "task" or "action").
+    """
+    with db_api.transaction():
+        ex = _load_archived_execution(id, ex_type)
+
+        if ex is None or ex_type != 'task':
+            return ex
+
+        wf_ex = _load_archived_execution(ex.workflow_execution_id, 'workflow')
+
+        if wf_ex and wf_ex.root_execution_id:
+            orm_attrs.set_committed_value(
+                wf_ex,
+                'root_execution',
+                _load_archived_execution(wf_ex.root_execution_id, 'workflow')
+            )
+
+        orm_attrs.set_committed_value(ex, 'workflow_execution', wf_ex)
+
+        children = db_api.get_archived_executions(parent_id=id)
+
+        for attr_name, child_type in (('action_executions', 'action'),
+                                      ('workflow_executions', 'workflow')):
+            orm_attrs.set_committed_value(
+                ex,
+                attr_name,
+                [c.to_execution() for c in children if c.type == child_type]
+            )
+
+        return ex
+
+
 def clear_sensitive_headers(dirty_data):
     if not dirty_data:
         return dirty_data
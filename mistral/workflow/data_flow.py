@@ -216,14 +216,22 @@ def publish_variables(task_ex, task_spec):
     # Publish branch variables.
     branch_vars = publish_spec.get_branch()
 
-    task_ex.published = expr.evaluate_recursively(branch_vars, expr_ctx)
+    task_ex.published = expr.evaluate_recursively(
+        branch_vars,
+        expr_ctx,
+        plan=publish_spec.get_branch_plan()
+    )
 
     # Publish global variables.
     global_vars = publish_spec.get_global()
 
     utils.merge_dicts(
         task_ex.workflow_execution.context,
-        expr.evaluate_recursively(global_vars, expr_ctx)
+        expr.evaluate_recursively(
+            global_vars,
+            expr_ctx,
+            plan=publish_spec.get_global_plan()
+        )
     )
 
     # TODO(rakhmerov):
@@ -262,12 +270,13 @@ def evaluate_task_outbound_context(task_ex):
         return utils.update_dict(in_context, getattr(task_ex, 'published', {}))
 
 
-def evaluate_workflow_output(wf_ex, wf_output, ctx):
+def evaluate_workflow_output(wf_ex, wf_output, ctx, plan=None):
     """Evaluates workflow output.
 
     :param wf_ex: Workflow execution.
     :param wf_output: Workflow output.
     :param ctx: Final Data Flow context (cause task's outbound context).
+    :param plan: Optional expression plan of the workflow output.
     """
 
     # Evaluate workflow 'output' clause using the final workflow context.
@@ -278,7 +287,7 @@ def evaluate_workflow_output(wf_ex, wf_output, ctx):
         wf_ex.input
     )
 
-    output = expr.evaluate_recursively(wf_output, ctx_view)
+    output = expr.evaluate_recursively(wf_output, ctx_view, plan=plan)
 
     # TODO(rakhmerov): Many don't like that we return the whole context
     # if 'output' is not explicitly defined.
@@ -328,7 +337,11 @@ def add_workflow_variables_to_context(wf_ex, wf_spec):
         wf_ex.input
     )
 
-    wf_vars = expr.evaluate_recursively(wf_spec.get_vars(), ctx_view)
+    wf_vars = expr.evaluate_recursively(
+        wf_spec.get_vars(),
+        ctx_view,
+        plan=wf_spec.get_vars_plan()
+    )
 
     utils.merge_dicts(wf_ex.context, wf_vars)
 
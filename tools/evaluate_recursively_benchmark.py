@@ -0,0 +1,130 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Compares the evaluation modes of expressions.evaluate_recursively().
+
+Every mode evaluates large, mostly constant structures with a couple of
+expressions, similar to big action inputs or workflow environments, and
+the time and peak memory it takes are reported.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from mistral import expressions as expr
+
+
+def _make_data(item_count):
+    return {
+        'items': [
+            {
+                'id': i,
+                'name': 'item-%s' % i,
+                'tags': ['a', 'b', 'c'],
+                'attrs': {'size': i * 10, 'enabled': True}
+            }
+            for i in range(item_count)
+        ],
+        'token': '<% $.token %>',
+        'nested': {
+            'url': 'http://<% $.host %>/api',
+            'params': {'limit': 100}
+        }
+    }
+
+
+def _run(name, func):
+    tracemalloc.start()
+
+    try:
+        started = time.perf_counter()
+
+        result = func()
+
+        elapsed = time.perf_counter() - started
+
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    print('%-24s %10.3f %12d' % (name, elapsed * 1000, peak // 1024))
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[100, 1000, 10000, 20000],
+        help='Numbers of items in the evaluated structures.'
+    )
+
+    args = parser.parse_args()
+
+    ctx = {'token': '123', 'host': 'localhost'}
+
+    # Expression engines are initialized on first use, it mustn't be
+    # accounted to the first mode.
+    expr.evaluate_recursively(_make_data(1), ctx)
+
+    for size in args.sizes:
+        data = _make_data(size)
+        plan = expr.build_plan(data)
+
+        modes = [
+            (
+                'deepcopy',
+                lambda: expr.evaluate_recursively(data, ctx)
+            ),
+            (
+                'copy-on-write',
+                lambda: expr.evaluate_recursively(
+                    data,
+                    ctx,
+                    copy_on_write=True
+                )
+            ),
+            (
+                'copy-on-write with plan',
+                lambda: expr.evaluate_recursively(
+                    data,
+                    ctx,
+                    plan=plan,
+                    copy_on_write=True
+                )
+            )
+        ]
+
+        print('\nStructure with %s items' % size)
+        print('%-24s %10s %12s' % ('Mode', 'Time ms', 'Peak KB'))
+
+        reference = None
+
+        for name, func in modes:
+            result = _run(name, func)
+
+            if reference is None:
+                reference = result
+
+            assert result == reference, (
+                'Mode %s produced a different result.' % name
+            )
+
+
+if __name__ == '__main__':
+    main()
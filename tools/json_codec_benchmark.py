@@ -0,0 +1,129 @@
+# Copyright 2026 - OVHcloud.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License");
+#    you may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""Compares the JSON codecs used for the JSON columns of the database.
+
+Every codec encodes and decodes task contexts of different sizes, similar
+to the ones built by workflows publishing results of "with-items" tasks.
+"""
+
+import argparse
+import timeit
+
+from mistral import utils
+from mistral.utils import json_codec
+
+
+def _make_context(item_count):
+    return {
+        '__execution': {
+            'id': '6a1f4f6c-7a3e-4e8e-8b8a-5c2d3f1e9a07',
+            'spec': {'name': 'wf', 'version': '2.0'},
+            'params': {'namespace': '', 'env': {}}
+        },
+        'openstack': {
+            'project_id': 'c3e4c0a1d2b34d6f9b2f0e7a8d9c1b2a',
+            'auth_uri': 'https://keystone.example.com/v3',
+            'region_name': 'RegionOne'
+        },
+        'servers': [
+            {
+                'id': 'server-%s' % i,
+                'name': 'vm-%s' % i,
+                'status': 'ACTIVE',
+                'addresses': {
+                    'private': [{'addr': '10.0.%s.%s' % (i // 256, i % 256)}]
+                },
+                'metadata': {'index': i, 'tags': ['a', 'b', 'ç']},
+                'flavor': {'vcpus': 2, 'ram': 4096.0, 'disk': None}
+            }
+            for i in range(item_count)
+        ]
+    }
+
+
+def _run(name, encode, decode, value, number):
+    json_str = encode(value)
+
+    enc_time = timeit.timeit(lambda: encode(value), number=number)
+    dec_time = timeit.timeit(lambda: decode(json_str), number=number)
+
+    print(
+        '%-24s %10.3f %10.3f' %
+        (name, enc_time / number * 1000, dec_time / number * 1000)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[10, 100, 1000, 10000],
+        help='Numbers of items in the benchmarked contexts.'
+    )
+    parser.add_argument(
+        '--number',
+        type=int,
+        default=20,
+        help='Number of runs of every operation.'
+    )
+
+    args = parser.parse_args()
+
+    codecs = [
+        (
+            'utils (reference)',
+            utils.to_json_str,
+            utils.from_json_str
+        ),
+        (
+            'stdlib',
+            json_codec.StdlibJsonCodec.encode,
+            json_codec.StdlibJsonCodec.decode
+        )
+    ]
+
+    if json_codec._ORJSON:
+        codecs.append(
+            (
+                'orjson',
+                json_codec.OrjsonCodec.encode,
+                json_codec.OrjsonCodec.decode
+            )
+        )
+    else:
+        print('orjson is not installed, skipping it.')
+
+    for size in args.sizes:
+        value = _make_context(size)
+
+        reference = utils.to_json_str(value)
+
+        print(
+            '\nContext with %s items, %s KB' % (size, len(reference) // 1024)
+        )
+        print('%-24s %10s %10s' % ('Codec', 'Encode ms', 'Decode ms'))
+
+        for name, encode, decode in codecs:
+            assert encode(value) == reference, (
+                'Codec %s produced different JSON.' % name
+            )
+
+            _run(name, encode, decode, value, args.number)
+
+
+if __name__ == '__main__':
+    main()